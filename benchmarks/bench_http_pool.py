@@ -0,0 +1,100 @@
+"""Compare REST fan-out latency and connection count across pool settings.
+
+Starts a local HTTP/1.1 keep-alive stand-in server that charges a fixed
+delay per new connection (standing in for the TCP+TLS handshake) and
+fans out 100 concurrent GETs -- the shape of ``MarketDataClient.get_rates``
+for 100 instruments -- through :class:`HttpClient` with different pool
+settings.
+
+A pool sized well below the fan-out usually wins: httpcore checks every
+idle connection when handing one out, so very large keep-alive pools
+cost more per request than the handshakes they save.
+
+Run with::
+
+    python benchmarks/bench_http_pool.py
+"""
+
+import asyncio
+import time
+
+from etoropy.config.settings import EToroConfig
+from etoropy.http.client import HttpClient, RequestOptions
+
+FAN_OUT = 100
+ROUNDS = 5
+SERVER_DELAY_S = 0.002
+HANDSHAKE_DELAY_S = 0.02  # simulated TCP+TLS setup cost per new connection
+
+
+class StandInServer:
+    def __init__(self) -> None:
+        self.connections = 0
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def stop(self) -> None:
+        assert self._server is not None
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        await asyncio.sleep(HANDSHAKE_DELAY_S)
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                await asyncio.sleep(SERVER_DELAY_S)
+                body = b"" if head.startswith(b"HEAD") else b"{}"
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n" + body)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def run(name: str, **settings: object) -> None:
+    server = StandInServer()
+    base_url = await server.start()
+    config = EToroConfig(api_key="k", user_key="u", base_url=base_url, rate_limit=False, **settings)  # type: ignore[arg-type]
+    client = HttpClient(config)
+    await client.warm_up()
+
+    timings: list[float] = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(client.request(RequestOptions(method="GET", path="/rates", query={"id": i})) for i in range(FAN_OUT))
+        )
+        timings.append(time.perf_counter() - start)
+        await asyncio.sleep(0.05)
+
+    stats = client.connection_stats
+    await client.aclose()
+    await server.stop()
+    print(
+        f"{name:<30} first={timings[0] * 1000:6.1f}ms best={min(timings) * 1000:6.1f}ms "
+        f"connections={server.connections:3d} reuse={stats.reuse_ratio:.0%}"
+    )
+
+
+async def main() -> None:
+    print(f"{ROUNDS} rounds of {FAN_OUT} concurrent GETs")
+    await run("defaults (100 max / 20 idle)")
+    for size in (10, 20, 50, 100):
+        await run(f"pool {size}/{size}", http_max_connections=size, http_max_keepalive_connections=size)
+    await run(
+        "pool 20/20 + prewarm 20",
+        http_max_connections=20,
+        http_max_keepalive_connections=20,
+        http_prewarm_connections=20,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
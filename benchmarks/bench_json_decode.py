@@ -0,0 +1,67 @@
+"""Per-tick WebSocket decode cost for each available JSON backend.
+
+Decodes a realistic ``instrument:<id>`` envelope the way ``WsClient``
+does -- outer envelope, then the JSON string in ``messages[].content`` --
+and reports the mean cost per tick, with and without pydantic validation.
+
+Run with::
+
+    python benchmarks/bench_json_decode.py
+"""
+
+import importlib.util
+import json
+import time
+
+from etoropy import _json
+from etoropy.ws.message_parser import parse_envelope, parse_messages
+
+ITERATIONS = 50_000
+
+RATE = {
+    "Ask": 189.52,
+    "Bid": 189.48,
+    "LastExecution": 189.50,
+    "ConversionRateAsk": 1.0,
+    "ConversionRateBid": 1.0,
+    "Date": "2026-03-02T14:30:00.1234567Z",
+    "PriceRateID": 123456789,
+}
+FRAME = json.dumps(
+    {
+        "messages": [
+            {"topic": "instrument:1001", "content": json.dumps(RATE), "id": "abc", "type": "Trading.Instrument.Rate"}
+        ]
+    }
+)
+
+
+def decode_only() -> None:
+    envelope = _json.loads(FRAME)
+    for msg in envelope["messages"]:
+        _json.loads(msg["content"])
+
+
+def decode_and_validate() -> None:
+    parse_messages(parse_envelope(FRAME))
+
+
+def per_tick_us(fn: object) -> float:
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        fn()  # type: ignore[operator]
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+def main() -> None:
+    backends = [name for name in ("orjson", "msgspec") if importlib.util.find_spec(name)] + ["json"]
+    print(f"{ITERATIONS} ticks, frame={len(FRAME)} bytes")
+    for name in backends:
+        _json.use(name)
+        decode = per_tick_us(decode_only)
+        full = per_tick_us(decode_and_validate)
+        print(f"{name:<8} decode={decode:6.2f}us/tick  decode+validate={full:6.2f}us/tick")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Measure ``RateLimiter.acquire()`` latency under heavy concurrency.
+
+Spawns 1,000 concurrent callers against a limiter and reports p50/p99
+acquire latency, compared with the previous lock-serialized design
+(kept here as ``LockedRateLimiter`` for reference).
+
+Run with::
+
+    python benchmarks/bench_rate_limiter.py
+"""
+
+import asyncio
+import statistics
+import time
+from collections import deque
+
+from etoropy.http.rate_limiter import RateLimiter, RateLimiterOptions
+
+CALLERS = 1_000
+MAX_REQUESTS = 100
+WINDOW_S = 0.1
+
+
+class LockedRateLimiter:
+    """The original implementation: one lock, sleeping while holding it."""
+
+    def __init__(self, max_requests: int, window_s: float) -> None:
+        self._max_requests = max_requests
+        self._window_s = window_s
+        self._timestamps: deque[float] = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            self._prune()
+            if len(self._timestamps) < self._max_requests:
+                self._timestamps.append(time.monotonic())
+                return
+            wait_s = self._timestamps[0] + self._window_s - time.monotonic() + 0.001
+            if wait_s > 0:
+                await asyncio.sleep(wait_s)
+            self._prune()
+            self._timestamps.append(time.monotonic())
+
+    def _prune(self) -> None:
+        cutoff = time.monotonic() - self._window_s
+        while self._timestamps and self._timestamps[0] < cutoff:
+            self._timestamps.popleft()
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run(name: str, limiter: RateLimiter | LockedRateLimiter) -> None:
+    latencies: list[float] = []
+
+    async def caller() -> None:
+        start = time.perf_counter()
+        await limiter.acquire()
+        latencies.append(time.perf_counter() - start)
+
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(caller() for _ in range(CALLERS)))
+    wall = time.perf_counter() - wall_start
+
+    print(
+        f"{name:<10} callers={CALLERS} wall={wall:.3f}s "
+        f"p50={percentile(latencies, 50) * 1000:.1f}ms "
+        f"p99={percentile(latencies, 99) * 1000:.1f}ms "
+        f"mean={statistics.fmean(latencies) * 1000:.1f}ms"
+    )
+
+
+async def main() -> None:
+    print(f"limit: {MAX_REQUESTS} requests / {WINDOW_S}s window")
+    await run("locked", LockedRateLimiter(MAX_REQUESTS, WINDOW_S))
+    await run("fifo", RateLimiter(RateLimiterOptions(max_requests=MAX_REQUESTS, window_s=WINDOW_S)))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
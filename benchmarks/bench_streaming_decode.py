@@ -0,0 +1,80 @@
+"""Compare peak memory of buffered vs streaming decode for a large rates payload.
+
+Builds a synthetic unfiltered ``/market-data/instruments/rates`` body and
+decodes it the way ``get_rates()`` does (text -> dict -> models) and the
+way ``iter_rates()`` does (incremental, one validated item at a time).
+
+Run with::
+
+    python benchmarks/bench_streaming_decode.py
+"""
+
+import asyncio
+import json
+import time
+import tracemalloc
+from collections.abc import AsyncIterator
+
+from etoropy.http.streaming import iter_json_array
+from etoropy.models.market_data import InstrumentRate, LiveRatesResponse
+
+INSTRUMENTS = 20_000
+CHUNK_SIZE = 16 * 1024
+
+
+def make_body() -> bytes:
+    rates = [
+        {
+            "instrumentID": i,
+            "ask": 100.0 + i,
+            "bid": 99.9 + i,
+            "lastExecution": 100.0 + i,
+            "conversionRateAsk": 1.0,
+            "conversionRateBid": 1.0,
+            "date": "2026-01-01T00:00:00Z",
+        }
+        for i in range(INSTRUMENTS)
+    ]
+    return json.dumps({"rates": rates}).encode()
+
+
+async def chunks(body: bytes) -> AsyncIterator[bytes]:
+    for i in range(0, len(body), CHUNK_SIZE):
+        yield body[i : i + CHUNK_SIZE]
+
+
+async def buffered(body: bytes) -> int:
+    collected = bytearray()
+    async for chunk in chunks(body):
+        collected += chunk
+    response = LiveRatesResponse.model_validate(json.loads(collected.decode()))
+    return len(response.rates)
+
+
+async def streaming(body: bytes) -> int:
+    count = 0
+    async for item in iter_json_array(chunks(body), "rates"):
+        InstrumentRate.model_validate(item)
+        count += 1
+    return count
+
+
+async def measure(name: str, fn: object, body: bytes) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = await fn(body)  # type: ignore[operator]
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<10} items={count} time={elapsed * 1000:7.1f}ms peak={peak / 1e6:6.1f}MB")
+
+
+async def main() -> None:
+    body = make_body()
+    print(f"payload: {len(body) / 1e6:.1f}MB, {INSTRUMENTS} rates")
+    await measure("buffered", buffered, body)
+    await measure("streaming", streaming, body)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
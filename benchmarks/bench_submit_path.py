@@ -0,0 +1,129 @@
+"""Client-side cost of submitting a market order, in microseconds.
+
+Compares ``EToroTrading.buy_by_amount`` (resolve the symbol, build the
+pydantic request, ``model_dump`` and encode it) with an
+:class:`ArmedOrder` prepared by ``arm_market_order`` (splice the amount
+into pre-rendered bytes), and the cost of the pre-trade risk checks
+(``RiskManager.check``) against a 200-position portfolio mirror.  The
+HTTP transport is replaced with an
+in-process ``httpx.MockTransport`` so only SDK overhead is measured; rate
+limiting is disabled.
+
+Run with::
+
+    python benchmarks/bench_submit_path.py
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import httpx
+
+from etoropy import _json
+from etoropy.config.settings import EToroConfig
+from etoropy.models.trading import PortfolioResponse
+from etoropy.trading.client import EToroTrading, OrderOptions, _market_order_request
+from etoropy.trading.portfolio_state import PortfolioState
+from etoropy.trading.risk import OrderIntent, RiskLimits, RiskManager
+
+ITERATIONS = 5_000
+OPENED = {
+    "token": "t",
+    "orderForOpen": {
+        "instrumentID": 1001,
+        "amount": 100.0,
+        "isBuy": True,
+        "leverage": 1,
+        "orderID": 1,
+        "orderType": 17,
+        "statusID": 1,
+        "CID": 1,
+    },
+}
+OPTIONS = OrderOptions(leverage=2, stop_loss=150.0, take_profit=250.0)
+
+
+async def _fetch_portfolio(count: int) -> PortfolioResponse:
+    positions = [
+        {
+            "positionID": i,
+            "CID": 1,
+            "openDateTime": "2026-01-01T00:00:00Z",
+            "openRate": 100.0,
+            "instrumentID": 1001 + i % 10,
+            "isBuy": True,
+            "leverage": 1,
+            "takeProfitRate": 0.0,
+            "stopLossRate": 0.0,
+            "amount": 100.0,
+            "orderID": i,
+            "orderType": 17,
+            "units": 1.0,
+        }
+        for i in range(count)
+    ]
+    return PortfolioResponse.model_validate({"clientPortfolio": {"positions": positions, "orders": []}})
+
+
+async def per_call_us(fn: Callable[[], Awaitable[Any]]) -> float:
+    for _ in range(200):
+        await fn()
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await fn()
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+async def main() -> None:
+    etoro = EToroTrading(EToroConfig(api_key="k", user_key="u", rate_limit=False))
+    # Swap the network for a canned response so only client-side work is timed.
+    transport = httpx.MockTransport(lambda _: httpx.Response(200, json=OPENED))
+    etoro.rest._http._client = httpx.AsyncClient(transport=transport)
+    etoro.resolver.load_bundled_csv()
+
+    armed = await etoro.arm_market_order("AAPL", is_buy=True, amount=100, options=OPTIONS)
+    submit = await per_call_us(lambda: etoro.buy_by_amount("AAPL", 125.5, OPTIONS))
+    fire = await per_call_us(armed.fire)
+    fire_amount = await per_call_us(lambda: armed.fire(amount=125.5))
+
+    async def prepare_only() -> None:
+        instrument_id = await etoro.resolver.resolve("AAPL")
+        request = _market_order_request(instrument_id, True, OPTIONS, 125.5, None)
+        _json.dumps_bytes(request.model_dump(mode="json", by_alias=True, exclude_none=True))
+
+    async def render_only() -> None:
+        armed.render(amount=125.5)
+
+    prepare = await per_call_us(prepare_only)
+    render = await per_call_us(render_only)
+
+    risk = RiskManager(
+        RiskLimits(
+            max_notional_per_instrument=1e12, max_open_positions=10**6, max_orders_per_second=1e9, max_leverage=10
+        )
+    )
+    state = PortfolioState(lambda: _fetch_portfolio(200))
+    await state.sync()
+    risk.exposure.state = state
+    intent = OrderIntent("open", 1001, 125.5, leverage=2)
+
+    async def risk_only() -> None:
+        ticket = risk.check(intent)
+        assert ticket is not None
+        risk.exposure.release(ticket)
+
+    risk_check = await per_call_us(risk_only)
+
+    print(f"{ITERATIONS} submits per variant, mock transport")
+    print(f"buy_by_amount          {submit:7.1f}us/order")
+    print(f"ArmedOrder.fire()      {fire:7.1f}us/order")
+    print(f"ArmedOrder.fire(amt)   {fire_amount:7.1f}us/order")
+    print(f"body: resolve+model+dump {prepare:6.2f}us  vs  render {render:6.2f}us")
+    print(f"risk check (all limits, 200 positions, 20 on the instrument) {risk_check:6.2f}us")
+    await etoro.rest.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,83 @@
+"""Ticks per second: per-tick callbacks vs. the columnar ``TickBuffer``.
+
+Feeds identical ``instrument:<id>`` frames (10 rates each) to
+``WsClient._handle_message`` and compares:
+
+- ``callback``: a no-op ``"instrument:rate"`` handler receiving
+  ``WsRateTick`` objects (``lightweight_ticks=True``)
+- ``buffer``: no rate listener; ticks are written to a ``TickBuffer``
+  and drained with ``read()`` every 1,000 frames
+
+Run with::
+
+    python benchmarks/bench_tick_buffer.py
+"""
+
+import json
+import time
+
+from etoropy import _json
+from etoropy.ws.client import WsClient, WsClientOptions
+from etoropy.ws.tick_buffer import TickBuffer
+
+FRAMES = 50_000
+TICKS_PER_FRAME = 10
+
+FRAME = json.dumps(
+    {
+        "messages": [
+            {
+                "topic": f"instrument:{1000 + i}",
+                "content": json.dumps(
+                    {
+                        "Ask": 189.52,
+                        "Bid": 189.48,
+                        "LastExecution": 189.50,
+                        "Date": "2026-03-02T14:30:00.1234567Z",
+                        "PriceRateID": 123456789,
+                    }
+                ),
+                "id": "abc",
+                "type": "Trading.Instrument.Rate",
+            }
+            for i in range(TICKS_PER_FRAME)
+        ]
+    }
+)
+
+
+def report(name: str, elapsed: float) -> None:
+    ticks = FRAMES * TICKS_PER_FRAME
+    print(f"{name:<10} {ticks / elapsed:>10,.0f} ticks/s  ({elapsed / ticks * 1e6:5.2f}us/tick)")
+
+
+def callback() -> None:
+    client = WsClient(WsClientOptions(lightweight_ticks=True))
+    client.on("instrument:rate", lambda instrument_id, rate: None)
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        client._handle_message(FRAME)
+    report("callback", time.perf_counter() - start)
+
+
+def buffered() -> None:
+    buffer = TickBuffer(capacity=TICKS_PER_FRAME * 1_000)
+    client = WsClient(WsClientOptions(tick_buffer=buffer))
+    read = 0
+    start = time.perf_counter()
+    for i in range(1, FRAMES + 1):
+        client._handle_message(FRAME)
+        if i % 1_000 == 0:
+            read += len(buffer.read())
+    report("buffer", time.perf_counter() - start)
+    assert read == FRAMES * TICKS_PER_FRAME and buffer.dropped == 0
+
+
+def main() -> None:
+    print(f"JSON backend: {_json.backend}")
+    callback()
+    buffered()
+
+
+if __name__ == "__main__":
+    main()
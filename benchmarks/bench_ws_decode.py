@@ -0,0 +1,78 @@
+"""Ticks per second per core through the WebSocket decode path.
+
+Feeds identical ``instrument:<id>`` frames to ``WsClient._handle_message``
+with a no-op ``"instrument:rate"`` handler and compares:
+
+- ``legacy``: the previous path (envelope model + ``parse_messages``),
+  reproduced here for reference
+- ``model``: the current default (one decode, no envelope model,
+  validated ``WsInstrumentRate``)
+- ``lightweight``: ``lightweight_ticks=True`` (slotted ``WsRateTick``)
+
+Run with::
+
+    python benchmarks/bench_ws_decode.py
+"""
+
+import json
+import time
+
+from etoropy import _json
+from etoropy.models.websocket import WsEnvelope
+from etoropy.ws.client import WsClient, WsClientOptions
+from etoropy.ws.message_parser import ParsedInstrumentRate, parse_messages
+
+FRAMES = 100_000
+
+FRAME = json.dumps(
+    {
+        "messages": [
+            {
+                "topic": "instrument:1001",
+                "content": json.dumps(
+                    {
+                        "Ask": 189.52,
+                        "Bid": 189.48,
+                        "LastExecution": 189.50,
+                        "Date": "2026-03-02T14:30:00.1234567Z",
+                        "PriceRateID": 123456789,
+                    }
+                ),
+                "id": "abc",
+                "type": "Trading.Instrument.Rate",
+            }
+        ]
+    }
+)
+
+
+def legacy(client: WsClient) -> None:
+    raw = _json.loads(FRAME)
+    envelope = WsEnvelope.model_validate(raw)
+    client._emit("message", envelope)
+    for msg in parse_messages(envelope):
+        if isinstance(msg.data, ParsedInstrumentRate):
+            client._emit("instrument:rate", msg.data.instrument_id, msg.data.rate)
+
+
+def run(name: str, client: WsClient, handle: object) -> None:
+    client.on("instrument:rate", lambda instrument_id, rate: None)
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        handle(FRAME)  # type: ignore[operator]
+    elapsed = time.perf_counter() - start
+    print(f"{name:<12} {FRAMES / elapsed:>10,.0f} ticks/s  ({elapsed / FRAMES * 1e6:5.2f}us/tick)")
+
+
+def main() -> None:
+    print(f"JSON backend: {_json.backend}")
+    legacy_client = WsClient(WsClientOptions())
+    run("legacy", legacy_client, lambda frame: legacy(legacy_client))
+    model = WsClient(WsClientOptions())
+    run("model", model, model._handle_message)
+    lightweight = WsClient(WsClientOptions(lightweight_ticks=True))
+    run("lightweight", lightweight, lightweight._handle_message)
+
+
+if __name__ == "__main__":
+    main()
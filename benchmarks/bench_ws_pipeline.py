@@ -0,0 +1,91 @@
+"""End-to-end WebSocket pipeline: tick latency, ticks/s and CPU per tick.
+
+Runs ``python -m etoropy.ws.simulator`` in a subprocess (so its CPU is not
+counted) and streams 200 instruments through ``EToroTrading.stream_prices``
+-- WebSocket read, JSON decode, rate parsing, quote book and ``"price"``
+emit -- into a handler that records latency.
+
+Latency is the handler's wall clock minus the rate's ``Date`` (stamped by
+the simulator when the frame was built), so it includes the loopback
+socket and any queueing in the client.  CPU per tick is this process's
+CPU time divided by the ticks delivered.
+
+Run with::
+
+    python benchmarks/bench_ws_pipeline.py
+"""
+
+import asyncio
+import sys
+import time
+from datetime import datetime
+
+from etoropy._events import LatencyHistogram
+from etoropy.config.settings import EToroConfig
+from etoropy.trading.client import EToroTrading
+
+INSTRUMENTS = list(range(1000, 1200))
+WARMUP_S = 0.5
+WINDOW_S = 3.0
+
+SCENARIOS: list[tuple[str, list[str], dict[str, object]]] = [
+    ("steady 5k/s", ["--rate", "5000"], {}),
+    ("steady 20k/s", ["--rate", "20000"], {}),
+    ("steady 20k/s lightweight", ["--rate", "20000"], {"ws_lightweight_ticks": True}),
+    (
+        "bursty 5k/s, 10x for 100ms/s",
+        ["--rate", "5000", "--burst-factor", "10", "--burst-period", "1", "--burst-duration", "0.1"],
+        {},
+    ),
+    ("flood (as fast as possible)", ["--rate", "1e9"], {}),
+]
+
+
+async def run(name: str, simulator_args: list[str], settings: dict[str, object]) -> None:
+    simulator = await asyncio.create_subprocess_exec(
+        sys.executable, "-m", "etoropy.ws.simulator", *simulator_args, stdout=asyncio.subprocess.PIPE
+    )
+    assert simulator.stdout is not None
+    url = (await simulator.stdout.readline()).decode().strip()
+
+    config = EToroConfig(api_key="k", user_key="u", ws_url=url, **settings)  # type: ignore[arg-type]
+    etoro = EToroTrading(config)
+    latency = LatencyHistogram()
+    measuring = False
+
+    def on_price(symbol: str, instrument_id: int, rate: object) -> None:
+        if measuring:
+            sent = datetime.fromisoformat(rate.date).timestamp()  # type: ignore[attr-defined]
+            latency.record(max(0, int((time.time() - sent) * 1e9)))
+
+    etoro.on("price", on_price)
+    await etoro.connect()
+    await etoro.stream_prices(INSTRUMENTS)
+    await asyncio.sleep(WARMUP_S)
+
+    measuring = True
+    cpu, wall = time.process_time(), time.perf_counter()
+    await asyncio.sleep(WINDOW_S)
+    cpu, wall = time.process_time() - cpu, time.perf_counter() - wall
+    measuring = False
+
+    await etoro.disconnect()
+    simulator.terminate()
+    await simulator.wait()
+
+    ticks = latency.count
+    print(
+        f"{name:<30} {ticks / wall:>9,.0f} ticks/s  "
+        f"p50={latency.percentile(50):>8,.0f}us p99={latency.percentile(99):>8,.0f}us max={latency.max_us:>8,.0f}us  "
+        f"cpu={cpu / max(ticks, 1) * 1e6:5.2f}us/tick"
+    )
+
+
+async def main() -> None:
+    print(f"{len(INSTRUMENTS)} instruments, {WINDOW_S:.0f}s window after {WARMUP_S}s warm-up")
+    for name, simulator_args, settings in SCENARIOS:
+        await run(name, simulator_args, settings)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
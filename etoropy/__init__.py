@@ -1,5 +1,8 @@
 """etoropy - Python SDK for the eToro Public API."""
 
+# Events
+from ._events import EventEmitter, HandlerStats, LatencyHistogram
+
 # High-level trading client
 # Configuration
 from .config.settings import EToroConfig
@@ -8,13 +11,16 @@ from .config.settings import EToroConfig
 from .errors.exceptions import (
     EToroApiError,
     EToroAuthError,
+    EToroBatchError,
     EToroError,
+    EToroHandlerError,
     EToroRateLimitError,
+    EToroRiskError,
     EToroValidationError,
     EToroWebSocketError,
 )
 from .http.client import HttpClient, RequestOptions
-from .http.rate_limiter import RateLimiter, RateLimiterOptions
+from .http.rate_limiter import RateLimiter, RateLimiterOptions, RequestPriority
 
 # Enums
 from .models.enums import (
@@ -33,30 +39,58 @@ from .rest.reactions import ReactionsClient
 
 # Low-level clients
 from .rest.rest_client import RestClient
-from .rest.trading_execution import TradingExecutionClient
+from .rest.trading_execution import ArmedOrder, TradingExecutionClient
 from .rest.trading_info import TradingInfoClient
 from .rest.users_info import UsersInfoClient
 from .rest.watchlists import WatchlistsClient
+from .trading.batch import BatchItemResult, BatchResult, CancelOrder, ClosePosition, MarketOrder
 from .trading.client import EToroTrading, OrderOptions
 from .trading.instrument_resolver import InstrumentInfo, InstrumentResolver
+from .trading.order_tracker import OrderTracker, OrderTrackerStats
+from .trading.portfolio_state import PortfolioState, PortfolioStateStats
+from .trading.risk import ExposureIndex, OrderIntent, RiskLimits, RiskManager, RiskStats
+from .trading.streams import EventStream, PriceTick, StreamStats
 
 # WebSocket
-from .ws.client import WsClient, WsClientOptions
+from .ws.client import SubscribeResult, WsClient, WsClientOptions
+from .ws.pool import WsClientPool
+from .ws.quote_book import Quote, QuoteBook
 
 __all__ = [
     # High-level
     "EToroTrading",
     "OrderOptions",
+    "MarketOrder",
+    "ClosePosition",
+    "CancelOrder",
+    "BatchItemResult",
+    "BatchResult",
     "InstrumentInfo",
     "InstrumentResolver",
+    "OrderTracker",
+    "OrderTrackerStats",
+    "PortfolioState",
+    "PortfolioStateStats",
+    "Quote",
+    "QuoteBook",
+    "RiskLimits",
+    "RiskManager",
+    "RiskStats",
+    "ExposureIndex",
+    "OrderIntent",
+    "EventStream",
+    "PriceTick",
+    "StreamStats",
     # Low-level clients
     "RestClient",
     "HttpClient",
     "RequestOptions",
     "RateLimiter",
     "RateLimiterOptions",
+    "RequestPriority",
     "MarketDataClient",
     "TradingExecutionClient",
+    "ArmedOrder",
     "TradingInfoClient",
     "FeedsClient",
     "ReactionsClient",
@@ -65,8 +99,13 @@ __all__ = [
     "WatchlistsClient",
     "UsersInfoClient",
     # WebSocket
+    "EventEmitter",
+    "HandlerStats",
+    "LatencyHistogram",
+    "SubscribeResult",
     "WsClient",
     "WsClientOptions",
+    "WsClientPool",
     # Config
     "EToroConfig",
     # Enums
@@ -79,8 +118,11 @@ __all__ = [
     # Errors
     "EToroApiError",
     "EToroAuthError",
+    "EToroBatchError",
     "EToroError",
+    "EToroHandlerError",
     "EToroRateLimitError",
+    "EToroRiskError",
     "EToroValidationError",
     "EToroWebSocketError",
 ]
@@ -0,0 +1,336 @@
+"""Event emitter shared by :class:`WsClient` and :class:`EToroTrading`.
+
+Handlers run one of three ways:
+
+- plain functions are called inline, in registration order;
+- coroutine functions (or handlers returning an awaitable) are scheduled
+  as tasks, at most *max_concurrent_handlers* running at a time; further
+  calls wait in a backlog of at most *max_pending_handlers* (the oldest is
+  dropped, and counted in :attr:`HandlerStats.dropped`, when it is full),
+  and coroutine functions are not even called until a slot frees up;
+- handlers registered with ``executor=`` run in a thread or process pool
+  so CPU-heavy work does not stall the event loop.
+
+A handler that raises does not affect the others: the failure is
+emitted as an ``"error"`` event (:class:`EToroHandlerError`), or logged if
+nobody listens for errors.
+
+Every handler gets a :class:`LatencyHistogram`; :meth:`EventEmitter.handler_stats`
+shows which one is slowing the feed and :meth:`EventEmitter.dispatch_stats`
+the total dispatch time per event.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Any, Literal, Self
+
+from .config.constants import DEFAULT_HANDLER_BACKLOG, DEFAULT_HANDLER_CONCURRENCY
+from .errors.exceptions import EToroHandlerError
+
+logger = logging.getLogger("etoropy")
+
+EventHandler = Callable[..., Any]
+HandlerExecutor = Executor | Literal["thread"]
+
+_LATENCY_BUCKETS = 64
+
+
+@dataclass(slots=True)
+class LatencyHistogram:
+    """Latency distribution in power-of-two nanosecond buckets.
+
+    ``counts[i]`` holds samples of ``2**(i-1)`` to ``2**i - 1`` ns, so
+    recording is a ``bit_length()`` and an increment -- cheap enough to
+    leave on for every handler call.
+    """
+
+    counts: list[int] = field(default_factory=lambda: [0] * _LATENCY_BUCKETS)
+    total_ns: int = 0
+    max_ns: int = 0
+
+    def record(self, ns: int) -> None:
+        self.counts[ns.bit_length()] += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    @property
+    def mean_us(self) -> float:
+        count = self.count
+        return self.total_ns / count / 1e3 if count else 0.0
+
+    @property
+    def max_us(self) -> float:
+        return self.max_ns / 1e3
+
+    def percentile(self, p: float) -> float:
+        """Upper bound (µs) of the bucket holding the *p*-th percentile (0-100)."""
+        count = self.count
+        if not count:
+            return 0.0
+        rank = p / 100 * count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if n and seen >= rank:
+                return min(1 << i, self.max_ns) / 1e3
+        return self.max_us
+
+
+@dataclass
+class HandlerStats:
+    """Latency of one registered handler.
+
+    For inline handlers the latency is the call itself; for async and
+    executor handlers it runs from the emit to completion, so it includes
+    time spent waiting for a free slot or worker.
+
+    :param mode: ``"sync"``, ``"async"`` or ``"executor"``.
+    :param errors: Invocations that raised.
+    :param dropped: Async invocations discarded because the handler
+        backlog was full.
+    """
+
+    event: str
+    handler: str
+    mode: str
+    errors: int = 0
+    dropped: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+
+class _Listener:
+    __slots__ = ("handler", "executor", "is_async", "stats", "latency")
+
+    def __init__(self, event: str, handler: EventHandler, executor: HandlerExecutor | None) -> None:
+        self.handler = handler
+        self.executor = executor
+        if executor is not None:
+            mode = "executor"
+        elif inspect.iscoroutinefunction(handler):
+            mode = "async"
+        else:
+            mode = "sync"
+        self.is_async = mode == "async"
+        name = getattr(handler, "__qualname__", None) or repr(handler)
+        self.stats = HandlerStats(event, name, mode)
+        self.latency = self.stats.latency
+
+
+# A deferred async invocation: the listener plus either its arguments (not
+# called yet) or the awaitable it already returned, and the emit time.
+_Pending = tuple[_Listener, tuple[Any, ...] | None, Awaitable[Any] | None, int]
+
+
+class EventEmitter:
+    """Minimal ``on`` / ``off`` / ``once`` event emitter.
+
+    :param max_concurrent_handlers: Upper bound on async handler
+        invocations running at once; further ones wait for a slot.
+    :param max_pending_handlers: Upper bound on async invocations waiting
+        for a slot; beyond it the oldest waiting one is dropped.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_handlers: int = DEFAULT_HANDLER_CONCURRENCY,
+        max_pending_handlers: int = DEFAULT_HANDLER_BACKLOG,
+    ) -> None:
+        self._listeners: dict[str, list[_Listener]] = {}
+        self._max_running = max_concurrent_handlers
+        self._max_backlog = max_pending_handlers
+        self._running = 0
+        self._backlog: deque[_Pending] = deque()
+        self._handler_tasks: set[asyncio.Future[Any]] = set()
+        self._dispatch_latency: dict[str, LatencyHistogram] = {}
+
+    def on(self, event: str, handler: EventHandler, *, executor: HandlerExecutor | None = None) -> Self:
+        """Register *handler* for *event*.
+
+        :param executor: Run the handler off the event loop -- ``"thread"``
+            for the loop's default thread pool, or any
+            :class:`concurrent.futures.Executor` (a ``ProcessPoolExecutor``
+            needs a picklable, module-level handler and arguments).
+        """
+        self._listeners.setdefault(event, []).append(_Listener(event, handler, executor))
+        self._listeners_changed()
+        return self
+
+    def off(self, event: str, handler: EventHandler) -> Self:
+        """Unregister *handler* from *event*."""
+        listeners = self._listeners.get(event)
+        if listeners:
+            for listener in listeners:
+                if listener.handler == handler:
+                    listeners.remove(listener)
+                    break
+        self._listeners_changed()
+        return self
+
+    def once(self, event: str, handler: EventHandler, *, executor: HandlerExecutor | None = None) -> Self:
+        """Register *handler* for *event*, then auto-unregister after the first call."""
+
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            self.off(event, wrapper)
+            return handler(*args, **kwargs)
+
+        return self.on(event, wrapper, executor=executor)
+
+    def remove_all_listeners(self, event: str | None = None) -> Self:
+        """Remove all listeners, or only those for *event* if given."""
+        if event:
+            self._listeners.pop(event, None)
+        else:
+            self._listeners.clear()
+        self._listeners_changed()
+        return self
+
+    def listener_count(self, event: str) -> int:
+        return len(self._listeners.get(event, ()))
+
+    def _listeners_changed(self) -> None:
+        """Hook for subclasses that track which events are listened to."""
+
+    def _emit(self, event: str, *args: Any) -> bool:
+        listeners = self._listeners.get(event)
+        if not listeners:
+            return False
+        clock = time.perf_counter_ns
+        began = clock()
+        for listener in tuple(listeners):
+            start = clock()
+            if listener.executor is not None:
+                self._run_in_executor(listener, args, start)
+                continue
+            if listener.is_async and self._running >= self._max_running:
+                self._enqueue((listener, args, None, start))
+                continue
+            try:
+                result = listener.handler(*args)
+            except Exception as exc:
+                listener.latency.record(clock() - start)
+                self._handler_failed(listener, exc)
+                continue
+            if result is not None and inspect.isawaitable(result):
+                self._schedule(listener, result, start)
+            else:
+                listener.latency.record(clock() - start)
+        latency = self._dispatch_latency.get(event)
+        if latency is None:
+            latency = self._dispatch_latency[event] = LatencyHistogram()
+        latency.record(clock() - began)
+        return True
+
+    def _handler_failed(self, listener: _Listener, exc: BaseException) -> None:
+        stats = listener.stats
+        stats.errors += 1
+        if stats.event != "error" and self._listeners.get("error"):
+            error = EToroHandlerError(
+                f"Handler {stats.handler} for {stats.event!r} raised {exc!r}", stats.event, stats.handler, exc
+            )
+            self._emit("error", error)
+        else:
+            logger.error("Handler %s for %r failed", stats.handler, stats.event, exc_info=exc)
+
+    def _schedule(self, listener: _Listener, awaitable: Awaitable[Any], start: int) -> None:
+        if self._running < self._max_running:
+            self._start_task(listener, awaitable, start)
+        else:
+            self._enqueue((listener, None, awaitable, start))
+
+    def _start_task(self, listener: _Listener, awaitable: Awaitable[Any], start: int) -> None:
+        self._running += 1
+        task = asyncio.ensure_future(self._run_async(listener, awaitable, start))
+        self._handler_tasks.add(task)
+        task.add_done_callback(self._task_done)
+
+    def _enqueue(self, pending: _Pending) -> None:
+        backlog = self._backlog
+        if len(backlog) >= self._max_backlog:
+            if not backlog:
+                self._drop(pending)
+                return
+            self._drop(backlog.popleft())
+        backlog.append(pending)
+
+    @staticmethod
+    def _drop(pending: _Pending) -> None:
+        listener, _, awaitable, _ = pending
+        listener.stats.dropped += 1
+        if inspect.iscoroutine(awaitable):
+            awaitable.close()
+
+    def _task_done(self, task: asyncio.Future[Any]) -> None:
+        self._handler_tasks.discard(task)
+        self._running -= 1
+        backlog = self._backlog
+        while backlog and self._running < self._max_running:
+            listener, args, awaitable, start = backlog.popleft()
+            if args is not None:
+                try:
+                    awaitable = listener.handler(*args)
+                except Exception as exc:
+                    listener.latency.record(time.perf_counter_ns() - start)
+                    self._handler_failed(listener, exc)
+                    continue
+            if awaitable is not None and inspect.isawaitable(awaitable):
+                self._start_task(listener, awaitable, start)
+            else:
+                listener.latency.record(time.perf_counter_ns() - start)
+
+    async def _run_async(self, listener: _Listener, awaitable: Awaitable[Any], start: int) -> None:
+        try:
+            await awaitable
+        except Exception as exc:
+            self._handler_failed(listener, exc)
+        finally:
+            listener.latency.record(time.perf_counter_ns() - start)
+
+    def _run_in_executor(self, listener: _Listener, args: tuple[Any, ...], start: int) -> None:
+        executor = None if listener.executor == "thread" else listener.executor
+        assert not isinstance(executor, str)
+        future = asyncio.get_running_loop().run_in_executor(executor, functools.partial(listener.handler, *args))
+        self._handler_tasks.add(future)
+
+        def done(f: asyncio.Future[Any]) -> None:
+            self._handler_tasks.discard(f)
+            listener.latency.record(time.perf_counter_ns() - start)
+            if not f.cancelled() and (exc := f.exception()) is not None:
+                self._handler_failed(listener, exc)
+
+        future.add_done_callback(done)
+
+    @property
+    def pending_handlers(self) -> int:
+        """Async and executor handler invocations not yet finished, including the backlog."""
+        return len(self._handler_tasks) + len(self._backlog)
+
+    async def wait_for_handlers(self) -> None:
+        """Wait until every scheduled async and executor handler has finished."""
+        while self._handler_tasks:
+            await asyncio.gather(*self._handler_tasks, return_exceptions=True)
+
+    def dispatch_stats(self) -> dict[str, LatencyHistogram]:
+        """Time spent dispatching each event to all of its inline handlers.
+
+        Async and executor handlers count only for scheduling them.
+        """
+        return dict(self._dispatch_latency)
+
+    def handler_stats(self, event: str | None = None) -> list[HandlerStats]:
+        """Latency stats for the registered handlers (of *event*, if given)."""
+        events = [event] if event else list(self._listeners)
+        return [listener.stats for name in events for listener in self._listeners.get(name, ())]
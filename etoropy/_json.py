@@ -0,0 +1,85 @@
+"""JSON encoding/decoding with an optional fast backend.
+
+``orjson`` or ``msgspec`` is used when installed (``pip install
+etoropy[fast-json]``), in that order, falling back to the standard
+library.  Set ``ETORO_JSON_BACKEND`` to ``orjson``, ``msgspec`` or
+``json`` to force a particular one; an unknown or missing backend there
+logs a warning and keeps the standard library.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import json
+import logging
+import os
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger("etoropy")
+
+_BACKENDS = ("orjson", "msgspec", "json")
+
+backend: str = "json"
+_loads: Callable[[str | bytes], Any] = json.loads
+_dumps_bytes: Callable[[Any], bytes] = lambda obj: json.dumps(obj, separators=(",", ":")).encode()  # noqa: E731
+
+
+def use(name: str) -> None:
+    """Switch the JSON backend to *name* (``"orjson"``, ``"msgspec"`` or ``"json"``).
+
+    :raises ValueError: If *name* is unknown.
+    :raises ImportError: If the backend's package is not installed.
+    """
+    global backend, _loads, _dumps_bytes
+
+    if name == "orjson":
+        orjson: Any = importlib.import_module("orjson")
+        option = orjson.OPT_NON_STR_KEYS
+        _loads = orjson.loads
+        _dumps_bytes = lambda obj: orjson.dumps(obj, option=option)  # noqa: E731
+    elif name == "msgspec":
+        msgspec: Any = importlib.import_module("msgspec")
+        encoder = msgspec.json.Encoder()
+        _loads = msgspec.json.decode
+        _dumps_bytes = encoder.encode
+    elif name == "json":
+        _loads = json.loads
+        _dumps_bytes = lambda obj: json.dumps(obj, separators=(",", ":")).encode()  # noqa: E731
+    else:
+        raise ValueError(f"Unknown JSON backend {name!r}; expected one of {', '.join(_BACKENDS)}")
+    backend = name
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode a JSON document."""
+    return _loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Encode *obj* as compact JSON text."""
+    return _dumps_bytes(obj).decode()
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Encode *obj* as compact UTF-8 JSON."""
+    return _dumps_bytes(obj)
+
+
+def _auto_detect() -> None:
+    forced = os.environ.get("ETORO_JSON_BACKEND")
+    if forced:
+        try:
+            use(forced)
+        except (ValueError, ImportError) as exc:
+            logger.warning("Ignoring ETORO_JSON_BACKEND=%r (%s); using the standard library json", forced, exc)
+            use("json")
+        return
+    for name in _BACKENDS:
+        if name == "json" or importlib.util.find_spec(name) is not None:
+            use(name)
+            return
+
+
+_auto_detect()
@@ -10,11 +10,34 @@ DEFAULT_TIMEOUT = 30.0  # seconds
 DEFAULT_RETRY_ATTEMPTS = 3
 DEFAULT_RETRY_DELAY = 1.0  # seconds
 
+DEFAULT_HTTP_MAX_CONNECTIONS = 100
+DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_HTTP_KEEPALIVE_EXPIRY = 5.0  # seconds
+
 DEFAULT_RATE_LIMIT_MAX_REQUESTS = 20
 DEFAULT_RATE_LIMIT_WINDOW = 10.0  # seconds
 
+DEFAULT_CACHE_MAX_ENTRIES = 256
+# Reference data that changes rarely; keys are path prefixes relative to API_PREFIX.
+DEFAULT_CACHE_TTLS: dict[str, float] = {
+    "/market-data/exchanges": 24 * 3600.0,
+    "/market-data/instrument-types": 24 * 3600.0,
+    "/market-data/stocks-industries": 24 * 3600.0,
+    "/market-data/instruments/history/closing-price": 3600.0,
+    "/curated-lists": 3600.0,
+}
+
 DEFAULT_WS_RECONNECT_ATTEMPTS = 10
 DEFAULT_WS_RECONNECT_DELAY = 1.0  # seconds
+DEFAULT_WS_RECONNECT_MAX_DELAY = 30.0  # seconds
 DEFAULT_WS_AUTH_TIMEOUT = 10.0  # seconds
 DEFAULT_WS_HEARTBEAT_INTERVAL = 30.0  # seconds
 DEFAULT_WS_HEARTBEAT_TIMEOUT = 10.0  # seconds
+DEFAULT_WS_SUBSCRIBE_BATCH = 200  # topics per Subscribe frame
+DEFAULT_WS_MAX_FRAME_BYTES = 16_384
+DEFAULT_WS_ACK_TIMEOUT = 5.0  # seconds
+DEFAULT_WS_ACK_RETRIES = 2
+DEFAULT_QUOTE_MAX_AGE = 5.0  # seconds
+DEFAULT_HANDLER_CONCURRENCY = 64
+DEFAULT_HANDLER_BACKLOG = 1024
+DEFAULT_PORTFOLIO_RECONCILE_INTERVAL = 60.0  # seconds
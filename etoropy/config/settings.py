@@ -7,6 +7,15 @@ from pydantic_settings import BaseSettings
 
 from .constants import (
     DEFAULT_BASE_URL,
+    DEFAULT_CACHE_MAX_ENTRIES,
+    DEFAULT_CACHE_TTLS,
+    DEFAULT_HANDLER_BACKLOG,
+    DEFAULT_HANDLER_CONCURRENCY,
+    DEFAULT_HTTP_KEEPALIVE_EXPIRY,
+    DEFAULT_HTTP_MAX_CONNECTIONS,
+    DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_PORTFOLIO_RECONCILE_INTERVAL,
+    DEFAULT_QUOTE_MAX_AGE,
     DEFAULT_RATE_LIMIT_MAX_REQUESTS,
     DEFAULT_RATE_LIMIT_WINDOW,
     DEFAULT_RETRY_ATTEMPTS,
@@ -27,12 +36,70 @@ class EToroConfig(BaseSettings):
     :param mode: ``"demo"`` (paper trading) or ``"real"`` (live trading).
     :param base_url: REST API base URL.
     :param ws_url: WebSocket endpoint URL.
+    :param ws_shards: Number of WebSocket connections instrument
+        subscriptions are sharded across (see :class:`WsClientPool`).
+    :param ws_lightweight_ticks: Deliver price ticks as slotted
+        :class:`WsRateTick` objects instead of validated pydantic models.
+    :param ws_tick_buffer_size: Capacity of the :class:`TickBuffer` that
+        streamed ticks are written into for batched consumption (0 = off).
+    :param quote_max_age: Seconds a streamed quote stays fresh in
+        :attr:`EToroTrading.quotes`, as read by ``get_quote`` /
+        ``get_quotes``.  The book is filled from the decoded frames without
+        building rate models; 0 turns it off.
+    :param event_handler_concurrency: Upper bound on async event handlers
+        running at once, per emitter.
+    :param event_handler_backlog: Upper bound on async event handler calls
+        waiting for a slot, per emitter; the oldest is dropped beyond it.
+    :param portfolio_mirror: While the WebSocket is connected, keep a
+        :class:`PortfolioState` updated from private events and use it for
+        position/order lookups instead of fetching the portfolio each time.
+        Off by default: it subscribes to ``private`` and re-syncs over REST
+        every *portfolio_reconcile_interval* seconds.
+    :param portfolio_reconcile_interval: Seconds between background
+        portfolio re-syncs of the mirror (0 = never).
+    :param risk_max_notional_per_instrument: Pre-trade cap on gross
+        exposure (``amount * leverage``) per instrument; see
+        :class:`RiskLimits`.
+    :param risk_max_open_positions: Pre-trade cap on open plus pending
+        positions.
+    :param risk_max_orders_per_second: Pre-trade cap on order submissions
+        per second.
+    :param risk_max_leverage: Highest leverage allowed on new orders.
+    :param risk_leverage_caps: Per-instrument leverage caps, as
+        ``{instrument_id: max_leverage}``.
     :param timeout: HTTP request timeout in seconds.
+    :param connect_timeout: Connection-establishment timeout (defaults to *timeout*).
+    :param read_timeout: Response read timeout (defaults to *timeout*).
+    :param write_timeout: Request write timeout (defaults to *timeout*).
+    :param pool_timeout: Max wait for a free pooled connection (defaults to *timeout*).
+    :param http_max_connections: Upper bound on open connections in the pool.
+    :param http_max_keepalive_connections: Idle connections kept alive for reuse.
+    :param http_keepalive_expiry: Seconds an idle connection stays in the pool.
+    :param http2: Multiplex requests over HTTP/2 (requires ``etoropy[http2]``).
+    :param http_prewarm_connections: Connections opened by
+        :meth:`HttpClient.warm_up` ahead of the first request.
     :param retry_attempts: Max retries on transient failures (0 = no retry).
     :param retry_delay: Base delay in seconds between retries.
     :param rate_limit: Enable or disable the built-in rate limiter (default ``True``).
     :param rate_limit_max_requests: Max requests allowed in the sliding window (default 20).
     :param rate_limit_window: Sliding window size in seconds (default 10.0).
+    :param rate_limit_groups: Separate rate-limit buckets per endpoint group, as
+        ``{path_prefix: (max_requests, window_s)}`` with prefixes relative to the
+        API root (e.g. ``{"/market-data": (20, 10.0)}``).  Paths matching no
+        group share the global bucket.
+    :param rate_limit_adaptive: Adjust bucket capacity from ``X-RateLimit-*`` /
+        ``RateLimit-*`` response headers when the server sends them.
+    :param rate_limit_shared_path: Path of a state file used to share the
+        rate-limit windows with other processes on the same host.
+    :param coalesce_requests: Let concurrent identical ``GET`` requests share
+        one network round-trip (default ``True``).
+    :param cache_enabled: Cache ``GET`` responses for the paths listed in
+        *cache_ttls* (default ``False``).
+    :param cache_ttls: Cache lifetime in seconds per path prefix relative to
+        the API root (e.g. ``{"/market-data/exchanges": 86400.0}``).  Paths
+        matching no prefix are never cached.
+    :param cache_max_entries: Max cached responses; least recently used
+        entries are evicted first.
     """
 
     model_config = {"env_prefix": "ETORO_"}
@@ -42,9 +109,38 @@ class EToroConfig(BaseSettings):
     mode: Literal["demo", "real"] = "demo"
     base_url: str = DEFAULT_BASE_URL
     ws_url: str = DEFAULT_WS_URL
+    ws_lightweight_ticks: bool = False
+    ws_shards: int = Field(default=1, ge=1)
+    ws_tick_buffer_size: int = Field(default=0, ge=0)
+    quote_max_age: float = Field(default=DEFAULT_QUOTE_MAX_AGE, ge=0)
+    event_handler_concurrency: int = Field(default=DEFAULT_HANDLER_CONCURRENCY, ge=1)
+    event_handler_backlog: int = Field(default=DEFAULT_HANDLER_BACKLOG, ge=0)
+    portfolio_mirror: bool = False
+    portfolio_reconcile_interval: float = Field(default=DEFAULT_PORTFOLIO_RECONCILE_INTERVAL, ge=0)
+    risk_max_notional_per_instrument: float | None = Field(default=None, gt=0)
+    risk_max_open_positions: int | None = Field(default=None, ge=0)
+    risk_max_orders_per_second: float | None = Field(default=None, gt=0)
+    risk_max_leverage: int | None = Field(default=None, ge=1)
+    risk_leverage_caps: dict[int, int] = Field(default_factory=dict)
     timeout: float = DEFAULT_TIMEOUT
+    connect_timeout: float | None = None
+    read_timeout: float | None = None
+    write_timeout: float | None = None
+    pool_timeout: float | None = None
+    http_max_connections: int = Field(default=DEFAULT_HTTP_MAX_CONNECTIONS, ge=1)
+    http_max_keepalive_connections: int = Field(default=DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS, ge=0)
+    http_keepalive_expiry: float = Field(default=DEFAULT_HTTP_KEEPALIVE_EXPIRY, ge=0)
+    http2: bool = False
+    http_prewarm_connections: int = Field(default=0, ge=0)
     retry_attempts: int = Field(default=DEFAULT_RETRY_ATTEMPTS, ge=0)
     retry_delay: float = Field(default=DEFAULT_RETRY_DELAY, gt=0)
     rate_limit: bool = True
     rate_limit_max_requests: int = Field(default=DEFAULT_RATE_LIMIT_MAX_REQUESTS, ge=1)
     rate_limit_window: float = Field(default=DEFAULT_RATE_LIMIT_WINDOW, gt=0)
+    rate_limit_groups: dict[str, tuple[int, float]] = Field(default_factory=dict)
+    rate_limit_adaptive: bool = False
+    rate_limit_shared_path: str | None = None
+    coalesce_requests: bool = True
+    cache_enabled: bool = False
+    cache_ttls: dict[str, float] = Field(default_factory=lambda: dict(DEFAULT_CACHE_TTLS))
+    cache_max_entries: int = Field(default=DEFAULT_CACHE_MAX_ENTRIES, ge=1)
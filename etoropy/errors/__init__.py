@@ -1,8 +1,11 @@
 from .exceptions import (
     EToroApiError,
     EToroAuthError,
+    EToroBatchError,
     EToroError,
+    EToroHandlerError,
     EToroRateLimitError,
+    EToroRiskError,
     EToroValidationError,
     EToroWebSocketError,
     RequestContext,
@@ -11,8 +14,11 @@ from .exceptions import (
 __all__ = [
     "EToroApiError",
     "EToroAuthError",
+    "EToroBatchError",
     "EToroError",
+    "EToroHandlerError",
     "EToroRateLimitError",
+    "EToroRiskError",
     "EToroValidationError",
     "EToroWebSocketError",
     "RequestContext",
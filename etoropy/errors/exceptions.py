@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ..trading.batch import BatchResult
 
 
 class EToroError(Exception):
@@ -81,3 +84,49 @@ class EToroWebSocketError(EToroError):
     def __init__(self, message: str, error_code: str | None = None) -> None:
         super().__init__(message)
         self.error_code = error_code
+
+
+class EToroHandlerError(EToroError):
+    """An event handler raised while an event was being dispatched.
+
+    Emitted as the ``"error"`` event; the handler's exception is
+    ``__cause__``.  Other handlers for the same event still run.
+
+    :param event: Name of the event being dispatched.
+    :param handler: Qualified name of the failing handler.
+    """
+
+    def __init__(self, message: str, event: str, handler: str, cause: BaseException | None = None) -> None:
+        super().__init__(message, cause)
+        self.event = event
+        self.handler = handler
+
+
+class EToroBatchError(EToroError):
+    """One or more operations of a batch failed.
+
+    Raised by :meth:`BatchResult.raise_for_errors`; the first failure is
+    ``__cause__``.
+
+    :param result: The full :class:`~etoropy.BatchResult`, including the
+        operations that succeeded.
+    """
+
+    def __init__(self, message: str, result: BatchResult) -> None:
+        failed = result.failed
+        super().__init__(message, failed[0].error if failed else None)
+        self.result = result
+
+
+class EToroRiskError(EToroError):
+    """An order was rejected by a client-side pre-trade risk check.
+
+    Nothing was sent to the API.
+
+    :param rule: Name of the limit that was breached (e.g.
+        ``"max_notional_per_instrument"``).
+    """
+
+    def __init__(self, message: str, rule: str) -> None:
+        super().__init__(message)
+        self.rule = rule
@@ -1,12 +1,33 @@
-from .client import HttpClient, RequestOptions
-from .rate_limiter import RateLimiter, RateLimiterOptions
+from .cache import CacheStats, ResponseCache
+from .client import ConnectionStats, HttpClient, RequestOptions
+from .rate_limit_backends import FileRateLimitBackend, SortedSetStore, StoreRateLimitBackend
+from .rate_limiter import (
+    LaneStats,
+    RateLimitBackend,
+    RateLimiter,
+    RateLimiterOptions,
+    RateLimiterRegistry,
+    RequestPriority,
+)
 from .retry import RetryOptions, retry
+from .singleflight import SingleFlight
 
 __all__ = [
+    "CacheStats",
+    "ConnectionStats",
+    "FileRateLimitBackend",
     "HttpClient",
+    "LaneStats",
+    "RateLimitBackend",
     "RateLimiter",
     "RateLimiterOptions",
+    "RateLimiterRegistry",
     "RequestOptions",
+    "RequestPriority",
+    "ResponseCache",
     "RetryOptions",
+    "SingleFlight",
+    "SortedSetStore",
+    "StoreRateLimitBackend",
     "retry",
 ]
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from ..config.constants import API_PREFIX
+from .singleflight import SingleFlight
+
+NOT_MODIFIED: Any = object()
+"""Returned by a cache loader when the server answered ``304 Not Modified``."""
+
+Loader = Callable[[str | None], Awaitable[tuple[Any, str | None]]]
+
+
+@dataclass
+class CacheStats:
+    """Counters kept by :class:`ResponseCache`.
+
+    :param hits: Lookups served from a fresh entry.
+    :param misses: Lookups that went to the server.
+    :param revalidated: Misses answered with ``304 Not Modified``.
+    :param coalesced: Lookups that joined an identical request already in flight.
+    :param evictions: Entries dropped to respect the size bound.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses + self.coalesced
+        return (self.hits + self.coalesced) / total if total else 0.0
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    expires_at: float
+    etag: str | None
+
+
+class ResponseCache:
+    """In-memory LRU cache for ``GET`` responses with per-path TTLs.
+
+    A path is cacheable when it matches one of the configured prefixes
+    (relative to the API root, longest prefix wins).  Concurrent lookups
+    of the same key share a single request.  Expired entries that carried
+    an ``ETag`` are kept and revalidated with ``If-None-Match``; a ``304``
+    answer renews them without transferring the body again.
+
+    Cached values are shared between callers and must not be mutated.
+
+    :param ttls: Mapping of path prefix to lifetime in seconds.
+    :param max_entries: Max entries kept; least recently used go first.
+    """
+
+    def __init__(self, ttls: dict[str, float], max_entries: int = 256) -> None:
+        self._ttls = dict(
+            sorted(
+                (("/" + prefix.strip("/"), ttl) for prefix, ttl in ttls.items()),
+                key=lambda item: len(item[0]),
+                reverse=True,
+            )
+        )
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._flights: SingleFlight[Any] = SingleFlight()
+        self._stats = CacheStats()
+
+    def ttl_for(self, path: str) -> float | None:
+        """Return the TTL for *path*, or ``None`` if it is not cacheable."""
+        if path.startswith(API_PREFIX):
+            path = path[len(API_PREFIX) :]
+        path = path.split("?", 1)[0]
+        for prefix, ttl in self._ttls.items():
+            if path == prefix or path.startswith(prefix + "/"):
+                return ttl if ttl > 0 else None
+        return None
+
+    async def get_or_load(self, key: str, ttl: float, load: Loader) -> Any:
+        """Return the cached value for *key*, calling *load* on a miss.
+
+        *load* receives the stale entry's ``ETag`` (or ``None``) and returns
+        ``(value, etag)``, where *value* is :data:`NOT_MODIFIED` on a 304.
+        """
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is not None and entry.expires_at > now:
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry.value
+
+        if key in self._flights:
+            self._stats.coalesced += 1
+        else:
+            self._stats.misses += 1
+        return await self._flights.do(key, lambda: self._load(key, ttl, load, entry))
+
+    async def _load(self, key: str, ttl: float, load: Loader, entry: _CacheEntry | None) -> Any:
+        value, etag = await load(entry.etag if entry is not None else None)
+        if value is NOT_MODIFIED and entry is not None:
+            self._stats.revalidated += 1
+            value = entry.value
+            etag = etag or entry.etag
+        self._store(key, _CacheEntry(value, time.monotonic() + ttl, etag))
+        return value
+
+    def invalidate(self, prefix: str | None = None) -> None:
+        """Drop every entry, or only those whose key contains path *prefix*."""
+        if prefix is None:
+            self._entries.clear()
+            return
+        for key in [k for k in self._entries if prefix in k]:
+            del self._entries[key]
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._stats
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(self, key: str, entry: _CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import dataclasses
+import importlib.util
 import logging
 import time
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
 from typing import Any
 
 import httpx
+from pydantic import BaseModel
 
+from .. import _json
 from .._utils import generate_uuid
 from ..config.settings import EToroConfig
 from ..errors.exceptions import (
@@ -15,19 +23,59 @@ from ..errors.exceptions import (
     EToroRateLimitError,
     RequestContext,
 )
-from .rate_limiter import RateLimiter, RateLimiterOptions
+from .cache import NOT_MODIFIED, CacheStats, ResponseCache
+from .rate_limit_backends import FileRateLimitBackend
+from .rate_limiter import RateLimitBackend, RateLimiter, RateLimiterOptions, RateLimiterRegistry, RequestPriority
 from .retry import RetryOptions, retry
+from .singleflight import SingleFlight
+from .streaming import iter_json_array
 
 logger = logging.getLogger("etoropy")
 
 
 @dataclass
 class RequestOptions:
+    """A single API request.
+
+    :param priority: Rate-limiter lane; order execution is served ahead of
+        market-data fan-out when the window is full.
+    """
+
     method: str
     path: str
     query: dict[str, str | int | bool | None] | None = None
     body: Any = None
     request_id: str | None = None
+    priority: RequestPriority = RequestPriority.NORMAL
+
+
+@dataclass
+class ConnectionStats:
+    """Connection-pool usage counters kept by :class:`HttpClient`.
+
+    :param requests: Requests sent over the pool (warm-up ``HEAD``
+        requests are not counted).
+    :param connections_opened: New TCP connections established by those
+        requests.
+    :param prewarmed_connections: Connections opened ahead of time by
+        :meth:`HttpClient.warm_up`; requests that later use them count as
+        reused.
+    :param http2_requests: Requests that were served over HTTP/2.
+    """
+
+    requests: int = 0
+    connections_opened: int = 0
+    prewarmed_connections: int = 0
+    http2_requests: int = 0
+
+    @property
+    def reused_requests(self) -> int:
+        """Requests that went over an already-open connection."""
+        return max(0, self.requests - self.connections_opened)
+
+    @property
+    def reuse_ratio(self) -> float:
+        return self.reused_requests / self.requests if self.requests else 0.0
 
 
 class HttpClient:
@@ -38,9 +86,28 @@ class HttpClient:
     retried on transient failures (5xx, 429, connection errors) with
     exponential backoff and jitter.
 
+    When :attr:`EToroConfig.rate_limit_groups` is set, each endpoint group
+    gets its own bucket (see :class:`RateLimiterRegistry`), so a noisy
+    subsystem or a 429 on one group does not throttle the others.
+
+    Connection pooling (size, keep-alive, HTTP/2, per-phase timeouts) is
+    configured through :class:`EToroConfig`; :attr:`connection_stats`
+    reports how often pooled connections were reused.
+
+    With :attr:`EToroConfig.cache_enabled`, ``GET`` responses for the
+    reference-data paths in :attr:`EToroConfig.cache_ttls` are served from
+    a :class:`ResponseCache` (see :attr:`cache`) instead of the network.
+    Other concurrent ``GET`` requests for the same URL share a single
+    round-trip unless :attr:`EToroConfig.coalesce_requests` is disabled.
+
+    To share the limits with other processes using the same API key, pass
+    a :class:`RateLimitBackend` as *rate_limit_backend* or set
+    :attr:`EToroConfig.rate_limit_shared_path`.
+
     Pydantic ``BaseModel`` request bodies are serialized with
     ``model_dump(by_alias=True, exclude_none=True)`` so PascalCase field
-    aliases are preserved for the eToro API.
+    aliases are preserved for the eToro API; ``bytes`` bodies are sent
+    as-is, as already-encoded JSON.
     """
 
     def __init__(
@@ -48,30 +115,126 @@ class HttpClient:
         config: EToroConfig,
         *,
         rate_limiter: RateLimiterOptions | None | bool = None,
+        rate_limit_backend: RateLimitBackend | None = None,
     ) -> None:
         self._config = config
-        self._client = httpx.AsyncClient(timeout=config.timeout)
-
-        if rate_limiter is False or not config.rate_limit:
-            self._rate_limiter: RateLimiter | None = None
-        elif isinstance(rate_limiter, RateLimiterOptions):
-            self._rate_limiter = RateLimiter(rate_limiter)
-        else:
-            self._rate_limiter = RateLimiter(
-                RateLimiterOptions(
+        self._connection_stats = ConnectionStats()
+        self._auth_headers = {"x-api-key": config.api_key, "x-user-key": config.user_key}
+
+        http2 = config.http2
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("http2=True requires the 'h2' package (pip install etoropy[http2]); using HTTP/1.1")
+            http2 = False
+        self._http2 = http2
+
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(
+                config.timeout,
+                connect=config.connect_timeout if config.connect_timeout is not None else config.timeout,
+                read=config.read_timeout if config.read_timeout is not None else config.timeout,
+                write=config.write_timeout if config.write_timeout is not None else config.timeout,
+                pool=config.pool_timeout if config.pool_timeout is not None else config.timeout,
+            ),
+            limits=httpx.Limits(
+                max_connections=config.http_max_connections,
+                max_keepalive_connections=config.http_max_keepalive_connections,
+                keepalive_expiry=config.http_keepalive_expiry,
+            ),
+            http2=http2,
+        )
+
+        self._flights: SingleFlight[Any] = SingleFlight()
+        self._cache: ResponseCache | None = None
+        if config.cache_enabled:
+            self._cache = ResponseCache(config.cache_ttls, config.cache_max_entries)
+
+        self._rate_limiter: RateLimiter | None = None
+        self._rate_limiters: RateLimiterRegistry | None = None
+        if rate_limiter is not False and config.rate_limit:
+            backend = rate_limit_backend
+            if backend is None and config.rate_limit_shared_path:
+                backend = FileRateLimitBackend(config.rate_limit_shared_path)
+
+            if isinstance(rate_limiter, RateLimiterOptions):
+                default_options = rate_limiter
+                if backend is not None and rate_limiter.backend is None:
+                    default_options = dataclasses.replace(rate_limiter, backend=backend)
+            else:
+                default_options = RateLimiterOptions(
                     max_requests=config.rate_limit_max_requests,
                     window_s=config.rate_limit_window,
+                    backend=backend,
                 )
+            self._rate_limiter = RateLimiter(default_options)
+            self._rate_limiters = RateLimiterRegistry(
+                self._rate_limiter,
+                {
+                    prefix: RateLimiter(
+                        RateLimiterOptions(max_requests=max_requests, window_s=window_s, backend=backend, key=prefix)
+                    )
+                    for prefix, (max_requests, window_s) in config.rate_limit_groups.items()
+                },
             )
 
+    def rate_limiter_for(self, path: str) -> RateLimiter | None:
+        """Return the rate limiter that governs requests to *path*, if limiting is enabled."""
+        return self._rate_limiters.get(path) if self._rate_limiters else None
+
     async def request(self, options: RequestOptions, response_type: type | None = None) -> Any:
+        if self._cache is not None and options.method == "GET":
+            ttl = self._cache.ttl_for(options.path)
+            if ttl is not None:
+                key = self._build_url(options.path, options.query)
+                return await self._cache.get_or_load(key, ttl, lambda etag: self._load_cached(options, etag))
+
+        if self._config.coalesce_requests and options.method == "GET":
+            flight = (options.method, self._build_url(options.path, options.query))
+            return await self._flights.do(flight, lambda: self._fetch(options))
+
+        return await self._fetch(options)
+
+    async def _fetch(self, options: RequestOptions) -> Any:
+        return self._decode(await self._send(options))
+
+    async def _load_cached(self, options: RequestOptions, etag: str | None) -> tuple[Any, str | None]:
+        response = await self._send(options, {"If-None-Match": etag} if etag else None)
+        if response.status_code == 304:
+            return NOT_MODIFIED, response.headers.get("ETag")
+        return self._decode(response), response.headers.get("ETag")
+
+    async def stream(self, options: RequestOptions, key: str | None = None) -> AsyncIterator[Any]:
+        """Send *options* and yield the elements of the JSON array in the response as they arrive.
+
+        The body is decoded incrementally (see :func:`iter_json_array`), so
+        large listings never sit in memory whole.  Rate limiting and retries
+        apply up to the response headers; streamed responses bypass the
+        cache and request coalescing.
+
+        :param key: Top-level key holding the array when the body is an object.
+        """
+        response = await self._send(options, stream=True)
+        try:
+            async for item in iter_json_array(response.aiter_bytes(), key):
+                yield item
+        finally:
+            await response.aclose()
+
+    async def _send(
+        self,
+        options: RequestOptions,
+        extra_headers: dict[str, str] | None = None,
+        *,
+        stream: bool = False,
+    ) -> httpx.Response:
         request_id = options.request_id or generate_uuid()
         start_time = time.monotonic()
 
-        async def _do_request() -> Any:
-            if self._rate_limiter:
-                await self._rate_limiter.acquire()
-            return await self._execute_request(options, request_id, start_time)
+        rate_limiter = self.rate_limiter_for(options.path)
+
+        async def _do_request() -> httpx.Response:
+            if rate_limiter:
+                await rate_limiter.acquire(options.priority)
+            return await self._execute_request(options, request_id, start_time, extra_headers, stream=stream)
 
         return await retry(
             _do_request,
@@ -97,42 +260,51 @@ class HttpClient:
         options: RequestOptions,
         request_id: str,
         start_time: float,
-    ) -> Any:
+        extra_headers: dict[str, str] | None = None,
+        *,
+        stream: bool = False,
+    ) -> httpx.Response:
         url = self._build_url(options.path, options.query)
 
-        headers: dict[str, str] = {
-            "x-request-id": request_id,
-            "x-api-key": self._config.api_key,
-            "x-user-key": self._config.user_key,
-        }
+        headers = {"x-request-id": request_id, **self._auth_headers}
+        if extra_headers:
+            headers.update(extra_headers)
 
-        if options.body is not None:
+        content = None
+        body = options.body
+        if body is not None:
             headers["Content-Type"] = "application/json"
-
-        json_body = None
-        if options.body is not None:
-            from pydantic import BaseModel
-
-            if isinstance(options.body, BaseModel):
-                json_body = options.body.model_dump(by_alias=True, exclude_none=True)
-            elif isinstance(options.body, dict):
-                json_body = options.body
+            if isinstance(body, bytes):
+                content = body
+            elif isinstance(body, BaseModel):
+                content = _json.dumps_bytes(body.model_dump(mode="json", by_alias=True, exclude_none=True))
             else:
-                json_body = options.body
+                content = _json.dumps_bytes(body)
 
         logger.debug("%s %s", options.method, url)
 
-        response = await self._client.request(
+        request = self._client.build_request(
             method=options.method,
             url=url,
             headers=headers,
-            json=json_body,
+            content=content,
+            extensions={"trace": self._trace},
         )
+        response = await self._client.send(request, stream=stream)
+        if stream and not response.is_success:
+            await response.aread()  # error paths below need the body; also releases the connection
+        self._connection_stats.requests += 1
+        if response.http_version == "HTTP/2":
+            self._connection_stats.http2_requests += 1
 
         duration_s = time.monotonic() - start_time
 
-        if response.status_code == 204:
-            return None
+        rate_limiter = self.rate_limiter_for(options.path)
+        if rate_limiter and self._config.rate_limit_adaptive:
+            self._learn_rate_limit(rate_limiter, response.headers)
+
+        if response.status_code in (204, 304):
+            return response
 
         if response.status_code in (401, 403):
             raise EToroAuthError(
@@ -141,10 +313,9 @@ class HttpClient:
             )
 
         if response.status_code == 429:
-            retry_after_header = response.headers.get("Retry-After")
-            retry_after_s = float(retry_after_header) if retry_after_header else None
-            if retry_after_s is not None and self._rate_limiter:
-                self._rate_limiter.penalize(retry_after_s)
+            retry_after_s = self._parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after_s is not None and rate_limiter:
+                rate_limiter.penalize(retry_after_s)
             raise EToroRateLimitError(
                 "Rate limit exceeded",
                 retry_after_s=retry_after_s,
@@ -166,11 +337,106 @@ class HttpClient:
                 ),
             )
 
-        text = response.text
-        if not text:
+        return response
+
+    @staticmethod
+    def _decode(response: httpx.Response) -> Any:
+        if response.status_code == 204:
+            return None
+
+        if not response.content:
+            return None
+
+        return _json.loads(response.content)
+
+    @property
+    def coalesced_requests(self) -> int:
+        """``GET`` requests answered by joining an identical one already in flight."""
+        return self._flights.shared
+
+    @property
+    def cache(self) -> ResponseCache | None:
+        """The response cache, or ``None`` unless :attr:`EToroConfig.cache_enabled` is set."""
+        return self._cache
+
+    @property
+    def cache_stats(self) -> CacheStats | None:
+        """Hit/miss counters of :attr:`cache`, if caching is enabled."""
+        return self._cache.stats if self._cache is not None else None
+
+    async def _trace(self, event_name: str, info: dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            self._connection_stats.connections_opened += 1
+
+    async def _warm_up_trace(self, event_name: str, info: dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            self._connection_stats.prewarmed_connections += 1
+
+    @property
+    def connection_stats(self) -> ConnectionStats:
+        """Pool usage counters (requests sent, connections opened, HTTP/2 use)."""
+        return self._connection_stats
+
+    async def warm_up(self, connections: int | None = None) -> None:
+        """Open pooled connections to the API host before the first real request.
+
+        Sends concurrent ``HEAD`` requests to :attr:`EToroConfig.base_url`
+        (bypassing the rate limiter) so TCP/TLS handshakes are already done
+        when latency matters.  Failures are ignored.
+
+        :param connections: Number of connections to open; defaults to
+            :attr:`EToroConfig.http_prewarm_connections`.  Over HTTP/2 a
+            single connection is enough.
+        """
+        count = self._config.http_prewarm_connections if connections is None else connections
+        if self._http2 and count > 1:
+            count = 1
+        if count <= 0:
+            return
+
+        async def _open() -> None:
+            with contextlib.suppress(httpx.HTTPError):
+                await self._client.request("HEAD", self._config.base_url, extensions={"trace": self._warm_up_trace})
+
+        await asyncio.gather(*(_open() for _ in range(count)))
+        logger.debug("Pre-warmed %d connection(s) to %s", count, self._config.base_url)
+
+    @staticmethod
+    def _parse_retry_after(value: str | None) -> float | None:
+        """Parse a ``Retry-After`` header given either as seconds or as an HTTP date."""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
             return None
 
-        return response.json()
+    @staticmethod
+    def _learn_rate_limit(rate_limiter: RateLimiter, headers: httpx.Headers) -> None:
+        """Adapt *rate_limiter* to ``X-RateLimit-*`` / ``RateLimit-*`` headers, if present."""
+
+        def header(name: str) -> float | None:
+            value = headers.get(f"X-RateLimit-{name}") or headers.get(f"RateLimit-{name}")
+            try:
+                return float(value) if value is not None else None
+            except ValueError:
+                return None
+
+        limit = header("Limit")
+        if limit is not None and limit >= 1:
+            rate_limiter.update_limit(max_requests=int(limit))
+
+        remaining = header("Remaining")
+        reset = header("Reset")
+        if remaining is not None and remaining <= 0 and reset is not None:
+            # Some servers send an epoch timestamp, others a delay in seconds.
+            wait_s = reset - time.time() if reset > 1_000_000_000 else reset
+            if wait_s > 0:
+                rate_limiter.penalize(wait_s)
 
     def _is_retryable(self, error: BaseException) -> bool:
         if isinstance(error, EToroRateLimitError):
@@ -194,8 +460,8 @@ class HttpClient:
         return url
 
     async def aclose(self) -> None:
-        if self._rate_limiter:
-            self._rate_limiter.dispose()
+        if self._rate_limiters:
+            self._rate_limiters.dispose()
         await self._client.aclose()
 
     async def __aenter__(self) -> HttpClient:
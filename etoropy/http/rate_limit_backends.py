@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from typing import Any, Protocol
+
+from .._utils import generate_uuid
+
+
+class FileRateLimitBackend:
+    """Share a sliding window between processes on the same host.
+
+    The window for every key lives in a small JSON file guarded by an
+    exclusive ``flock``; each :meth:`try_acquire` reads, prunes, and
+    rewrites it under the lock.  File I/O runs in a worker thread so the
+    event loop is never blocked waiting for another process.
+
+    POSIX only (uses :mod:`fcntl`).
+
+    Example::
+
+        backend = FileRateLimitBackend("/tmp/etoropy-ratelimit.json")
+        http = HttpClient(config, rate_limit_backend=backend)
+
+    :param path: State file shared by all cooperating processes.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        import fcntl  # noqa: F401  -- fail early on platforms without flock
+
+        self._path = os.fspath(path)
+        # Timestamps this instance claimed per key, newest last, for release().
+        self._claimed: dict[str, deque[float]] = {}
+
+    async def try_acquire(self, key: str, max_requests: int, window_s: float) -> float:
+        wait_s, claimed = await asyncio.to_thread(self._try_acquire_sync, key, max_requests, window_s)
+        if claimed is not None:
+            stamps = self._claimed.setdefault(key, deque())
+            while stamps and stamps[0] <= claimed - window_s:
+                stamps.popleft()
+            stamps.append(claimed)
+        return wait_s
+
+    async def release(self, key: str) -> None:
+        stamps = self._claimed.get(key)
+        if stamps:
+            await asyncio.to_thread(self._release_sync, key, stamps.pop())
+
+    async def penalize(self, key: str, retry_after_s: float) -> None:
+        await asyncio.to_thread(self._penalize_sync, key, retry_after_s)
+
+    def _try_acquire_sync(self, key: str, max_requests: int, window_s: float) -> tuple[float, float | None]:
+        with _LockedState(self._path) as state:
+            now = time.time()
+            entry = state.setdefault(key, {"timestamps": [], "penalty_until": 0.0})
+            if entry["penalty_until"] > now:
+                return float(entry["penalty_until"] - now), None
+            timestamps = [t for t in entry["timestamps"] if t > now - window_s]
+            entry["timestamps"] = timestamps
+            if len(timestamps) < max_requests:
+                timestamps.append(now)
+                return 0.0, now
+            return max(0.001, float(timestamps[0]) + window_s - now), None
+
+    def _release_sync(self, key: str, claimed: float) -> None:
+        with _LockedState(self._path) as state:
+            timestamps = state.get(key, {}).get("timestamps", [])
+            if claimed in timestamps:
+                timestamps.remove(claimed)
+
+    def _penalize_sync(self, key: str, retry_after_s: float) -> None:
+        with _LockedState(self._path) as state:
+            entry = state.setdefault(key, {"timestamps": [], "penalty_until": 0.0})
+            entry["penalty_until"] = max(entry["penalty_until"], time.time() + retry_after_s)
+
+
+class _LockedState:
+    """Context manager yielding the decoded state file while holding ``flock``."""
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._fd = -1
+        self._state: dict[str, Any] = {}
+
+    def __enter__(self) -> dict[str, Any]:
+        import fcntl
+
+        self._fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        raw = b""
+        while chunk := os.read(self._fd, 65536):
+            raw += chunk
+        try:
+            self._state = json.loads(raw) if raw else {}
+        except ValueError:
+            self._state = {}  # corrupt or half-written by a crashed process
+        return self._state
+
+    def __exit__(self, exc_type: object, *args: object) -> None:
+        import fcntl
+
+        try:
+            if exc_type is None:
+                data = json.dumps(self._state).encode()
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                os.ftruncate(self._fd, 0)
+                os.write(self._fd, data)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+
+
+class SortedSetStore(Protocol):
+    """The subset of a Redis-like async client used by :class:`StoreRateLimitBackend`.
+
+    Signatures match ``redis.asyncio.Redis``, so a Redis (or Valkey,
+    KeyDB, ...) client can be passed directly.
+    """
+
+    async def zadd(self, name: str, mapping: dict[str, float]) -> Any: ...
+
+    async def zrem(self, name: str, *values: str) -> Any: ...
+
+    async def zremrangebyscore(self, name: str, min: float, max: float) -> Any: ...
+
+    async def zcard(self, name: str) -> int: ...
+
+    async def zrange(self, name: str, start: int, end: int, withscores: bool = False) -> Any: ...
+
+    async def get(self, name: str) -> Any: ...
+
+    async def set(self, name: str, value: str, px: int | None = None) -> Any: ...
+
+
+class StoreRateLimitBackend:
+    """Share a sliding window across hosts through a Redis-like sorted set.
+
+    Each claim adds a uniquely named member scored by its timestamp, then
+    counts the set; if the count exceeds the limit the member is removed
+    again.  Concurrent claimers can therefore only over-*deny*, never
+    over-grant, without needing server-side scripting.
+
+    :param store: A client implementing :class:`SortedSetStore`.
+    :param namespace: Prefix for the keys written to the store.
+    """
+
+    def __init__(self, store: SortedSetStore, namespace: str = "etoropy:ratelimit") -> None:
+        self._store = store
+        self._namespace = namespace
+        # (timestamp, member) this instance claimed per key, newest last, for release().
+        self._claimed: dict[str, deque[tuple[float, str]]] = {}
+
+    async def try_acquire(self, key: str, max_requests: int, window_s: float) -> float:
+        window_key = f"{self._namespace}:{key}"
+        now = time.time()
+
+        penalty = await self._store.get(f"{window_key}:penalty")
+        if penalty is not None and float(penalty) > now:
+            return float(penalty) - now
+
+        await self._store.zremrangebyscore(window_key, 0, now - window_s)
+        member = f"{now}:{generate_uuid()}"
+        await self._store.zadd(window_key, {member: now})
+        if await self._store.zcard(window_key) <= max_requests:
+            claimed = self._claimed.setdefault(key, deque())
+            while claimed and claimed[0][0] <= now - window_s:
+                claimed.popleft()
+            claimed.append((now, member))
+            return 0.0
+
+        await self._store.zrem(window_key, member)
+        oldest = await self._store.zrange(window_key, 0, 0, withscores=True)
+        if not oldest:
+            return 0.001
+        return max(0.001, float(oldest[0][1]) + window_s - now)
+
+    async def release(self, key: str) -> None:
+        claimed = self._claimed.get(key)
+        if claimed:
+            await self._store.zrem(f"{self._namespace}:{key}", claimed.pop()[1])
+
+    async def penalize(self, key: str, retry_after_s: float) -> None:
+        penalty_key = f"{self._namespace}:{key}:penalty"
+        until = time.time() + retry_after_s
+        current = await self._store.get(penalty_key)
+        if current is None or float(current) < until:
+            await self._store.set(penalty_key, str(until), px=max(1, int(retry_after_s * 1000)))
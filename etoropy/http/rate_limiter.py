@@ -1,68 +1,220 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import logging
 import time
 from collections import deque
 from dataclasses import dataclass
+from enum import IntEnum
+from typing import Protocol
+
+from ..config.constants import API_PREFIX
+
+logger = logging.getLogger("etoropy")
+
+
+class RequestPriority(IntEnum):
+    """Scheduling lane for a request waiting on the rate limiter.
+
+    Lower values are served first when the window is full.
+    """
+
+    EXECUTION = 0  # open/close/cancel orders
+    ACCOUNT = 1  # portfolio, PnL, order status, trade history
+    NORMAL = 2  # market data and anything not otherwise classified
+    BULK = 3  # social feeds, watchlists, discovery, user info
+
+
+class RateLimitBackend(Protocol):
+    """Shared sliding-window state for limiters in several processes or hosts.
+
+    Implementations must make :meth:`try_acquire` atomic with respect to
+    every other limiter using the same *key*.  See
+    :mod:`etoropy.http.rate_limit_backends` for a same-host file-lock
+    backend and an adapter for Redis-like sorted-set stores.
+    """
+
+    async def try_acquire(self, key: str, max_requests: int, window_s: float) -> float:
+        """Claim one slot in the window for *key*.
+
+        :returns: ``0.0`` if the slot was claimed, otherwise the number of
+            seconds until a slot may become free.
+        """
+        ...
+
+    async def release(self, key: str) -> None:
+        """Return the most recent slot this backend claimed for *key*.
+
+        Called when a claimed slot ends up unused (the waiter it was
+        granted to was cancelled); a no-op if that slot already expired.
+        """
+        ...
+
+    async def penalize(self, key: str, retry_after_s: float) -> None:
+        """Block every limiter sharing *key* for *retry_after_s* seconds."""
+        ...
 
 
 @dataclass
 class RateLimiterOptions:
+    """Configuration for :class:`RateLimiter`.
+
+    :param max_requests: Max requests allowed in the sliding window.
+    :param window_s: Sliding window size in seconds.
+    :param starvation_s: A waiter queued longer than this is served next
+        regardless of its lane, so bulk traffic cannot starve forever.
+    :param backend: Optional shared backend; when set, the window is
+        coordinated with every other limiter using the same *key*.
+    :param key: Window identifier within *backend*.
+    """
+
     max_requests: int = 20
     window_s: float = 10.0
+    starvation_s: float = 30.0
+    backend: RateLimitBackend | None = None
+    key: str = "default"
+
+
+@dataclass
+class LaneStats:
+    """Per-lane counters kept by :class:`RateLimiter`.
+
+    :param acquired: Slots granted to this lane.
+    :param queued: Callers currently waiting in this lane.
+    :param total_wait_s: Cumulative time callers spent waiting.
+    :param max_wait_s: Longest single wait observed.
+    :param promoted: Grants made out of priority order by starvation protection.
+    """
+
+    acquired: int = 0
+    queued: int = 0
+    total_wait_s: float = 0.0
+    max_wait_s: float = 0.0
+    promoted: int = 0
+
+    @property
+    def mean_wait_s(self) -> float:
+        return self.total_wait_s / self.acquired if self.acquired else 0.0
+
+
+@dataclass
+class _Waiter:
+    future: asyncio.Future[float]
+    priority: RequestPriority
+    enqueued_at: float
 
 
 class RateLimiter:
-    """Token-bucket rate limiter for outgoing HTTP requests.
+    """Sliding-window rate limiter for outgoing HTTP requests.
 
     Tracks request timestamps in a sliding window (default: 20 requests
-    per 10 seconds).  ``acquire()`` blocks the caller when the bucket is
-    full until a slot opens.
+    per 10 seconds).  ``acquire()`` returns immediately while the window
+    has free slots; otherwise the caller is parked in a FIFO waiter queue
+    for its :class:`RequestPriority` lane.  A single timer, armed for the
+    moment the oldest timestamp leaves the window, hands freed slots to
+    the highest-priority lane first, so no caller ever sleeps while
+    holding up the others.  A waiter queued for longer than
+    ``starvation_s`` is served ahead of higher lanes.
+
+    Cancelling a waiting ``acquire()`` removes it from the queue; if the
+    slot had already been granted, it is returned to the window (to the
+    shared one through :meth:`RateLimitBackend.release` when a backend is
+    configured).
 
     On HTTP 429 responses, call ``penalize(retry_after_s)`` to force all
     subsequent requests to wait for the server-specified back-off period.
+
+    With a :class:`RateLimitBackend` configured, slots are claimed from the
+    shared backend instead of the local window: a single dispatcher task
+    asks the backend for a slot and hands each one to the next local
+    waiter, so lanes and FIFO ordering still apply within the process.
     """
 
     def __init__(self, options: RateLimiterOptions | None = None) -> None:
         opts = options or RateLimiterOptions()
         self._max_requests = opts.max_requests
         self._window_s = opts.window_s
+        self._starvation_s = opts.starvation_s
         self._timestamps: deque[float] = deque()
+        self._lanes: dict[RequestPriority, deque[_Waiter]] = {p: deque() for p in RequestPriority}
+        self._stats: dict[RequestPriority, LaneStats] = {p: LaneStats() for p in RequestPriority}
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_deadline: float = 0.0
         self._penalty_until: float = 0.0
-        self._lock = asyncio.Lock()
         self._disposed = False
+        self._backend = opts.backend
+        self._key = opts.key
+        self._dispatcher: asyncio.Task[None] | None = None
+        self._background: set[asyncio.Task[None]] = set()
 
-    async def acquire(self) -> None:
+    async def acquire(self, priority: RequestPriority = RequestPriority.NORMAL) -> None:
         if self._disposed:
             return
 
-        async with self._lock:
-            now = time.monotonic()
-            if self._penalty_until > now:
-                await asyncio.sleep(self._penalty_until - now)
-
+        if self._backend is None and not self.queue_size and not self.is_penalized:
             self._prune_timestamps()
-
             if len(self._timestamps) < self._max_requests:
                 self._timestamps.append(time.monotonic())
+                self._stats[priority].acquired += 1
                 return
 
-            # Wait until the oldest timestamp expires
-            wait_s = self._timestamps[0] + self._window_s - time.monotonic() + 0.001
-            if wait_s > 0:
-                await asyncio.sleep(wait_s)
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), priority, time.monotonic())
+        self._lanes[priority].append(waiter)
+        self._stats[priority].queued += 1
+        self._schedule()
 
-            self._prune_timestamps()
-            self._timestamps.append(time.monotonic())
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Slot was granted just before cancellation -- give it back.
+                with contextlib.suppress(ValueError):
+                    self._timestamps.remove(waiter.future.result())
+                if self._backend is not None and not self._disposed:
+                    self._return_backend_slot()
+            else:
+                with contextlib.suppress(ValueError):
+                    self._lanes[priority].remove(waiter)
+                    self._stats[priority].queued -= 1
+            self._schedule()
+            raise
+
+    def update_limit(self, max_requests: int | None = None, window_s: float | None = None) -> None:
+        """Change the window size or capacity, e.g. from server-reported limits."""
+        if max_requests is not None and max_requests > 0:
+            self._max_requests = max_requests
+        if window_s is not None and window_s > 0:
+            self._window_s = window_s
+        self._schedule()
+
+    @property
+    def max_requests(self) -> int:
+        return self._max_requests
+
+    @property
+    def window_s(self) -> float:
+        return self._window_s
 
     def penalize(self, retry_after_s: float) -> None:
         until = time.monotonic() + retry_after_s
         if until > self._penalty_until:
             self._penalty_until = until
+            self._schedule()
+        if self._backend is not None:
+            task = asyncio.ensure_future(self._backend.penalize(self._key, retry_after_s))
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
 
     @property
     def queue_size(self) -> int:
-        return 0  # simplified — lock-based instead of queue-based
+        """Number of callers currently waiting for a slot, across all lanes."""
+        return sum(len(lane) for lane in self._lanes.values())
+
+    @property
+    def lane_stats(self) -> dict[RequestPriority, LaneStats]:
+        """Per-lane grant and wait-time counters."""
+        return self._stats
 
     @property
     def current_usage(self) -> int:
@@ -75,9 +227,181 @@ class RateLimiter:
 
     def dispose(self) -> None:
         self._disposed = True
+        self._cancel_timer()
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            self._dispatcher = None
+        now = time.monotonic()
+        for priority, lane in self._lanes.items():
+            while lane:
+                waiter = lane.popleft()
+                self._stats[priority].queued -= 1
+                if not waiter.future.done():
+                    waiter.future.set_result(now)
         self._timestamps.clear()
 
+    def _release(self) -> None:
+        """Grant free slots to queued waiters, highest lane first (timer callback)."""
+        self._timer = None
+        if self._disposed:
+            return
+
+        now = time.monotonic()
+        if self._penalty_until <= now:
+            self._prune_timestamps()
+            while len(self._timestamps) < self._max_requests:
+                waiter = self._next_waiter(now)
+                if waiter is None:
+                    break
+                if waiter.future.done():
+                    continue
+                self._timestamps.append(now)
+                waiter.future.set_result(now)
+
+        self._schedule()
+
+    def _next_waiter(self, now: float) -> _Waiter | None:
+        heads = [lane[0] for lane in self._lanes.values() if lane]
+        if not heads:
+            return None
+
+        oldest = min(heads, key=lambda w: w.enqueued_at)
+        starved = now - oldest.enqueued_at >= self._starvation_s
+        waiter = oldest if starved else min(heads, key=lambda w: w.priority)
+        self._lanes[waiter.priority].popleft()
+
+        stats = self._stats[waiter.priority]
+        stats.queued -= 1
+        if waiter.future.done():
+            return waiter
+        waited = now - waiter.enqueued_at
+        stats.acquired += 1
+        stats.total_wait_s += waited
+        stats.max_wait_s = max(stats.max_wait_s, waited)
+        if starved and waiter.priority != min(h.priority for h in heads):
+            stats.promoted += 1
+        return waiter
+
+    async def _dispatch(self) -> None:
+        """Claim slots from the shared backend and hand them to local waiters."""
+        try:
+            while self.queue_size and not self._disposed:
+                now = time.monotonic()
+                if self._penalty_until > now:
+                    await asyncio.sleep(self._penalty_until - now)
+                    continue
+                assert self._backend is not None
+                try:
+                    wait_s = await self._backend.try_acquire(self._key, self._max_requests, self._window_s)
+                except Exception as exc:
+                    logger.warning("Rate-limit backend failed, retrying: %s", exc)
+                    wait_s = 0.1
+                if wait_s > 0:
+                    await asyncio.sleep(wait_s)
+                    continue
+                now = time.monotonic()
+                while (waiter := self._next_waiter(now)) is not None:
+                    if not waiter.future.done():
+                        self._timestamps.append(now)
+                        waiter.future.set_result(now)
+                        break
+                else:
+                    # Every waiter was cancelled while the slot was claimed.
+                    await self._release_backend_slot()
+        finally:
+            self._dispatcher = None
+
+    def _return_backend_slot(self) -> None:
+        task = asyncio.ensure_future(self._release_backend_slot())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _release_backend_slot(self) -> None:
+        assert self._backend is not None
+        try:
+            await self._backend.release(self._key)
+        except Exception as exc:
+            logger.warning("Rate-limit backend failed to release a slot: %s", exc)
+
+    def _schedule(self) -> None:
+        """Arm the release timer for the next moment a slot can open."""
+        if not self.queue_size or self._disposed:
+            self._cancel_timer()
+            return
+
+        if self._backend is not None:
+            if self._dispatcher is None:
+                self._dispatcher = asyncio.get_running_loop().create_task(self._dispatch())
+            return
+
+        now = time.monotonic()
+        self._prune_timestamps()
+        full = len(self._timestamps) >= self._max_requests
+        deadline = self._timestamps[0] + self._window_s + 0.001 if full else now
+        deadline = max(deadline, self._penalty_until)
+
+        if self._timer is not None:
+            if self._timer_deadline <= deadline:
+                return
+            self._timer.cancel()
+
+        loop = asyncio.get_running_loop()
+        self._timer_deadline = deadline
+        self._timer = loop.call_later(max(0.0, deadline - now), self._release)
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
     def _prune_timestamps(self) -> None:
         cutoff = time.monotonic() - self._window_s
         while self._timestamps and self._timestamps[0] < cutoff:
             self._timestamps.popleft()
+
+
+class RateLimiterRegistry:
+    """Routes request paths to per-endpoint-group :class:`RateLimiter` instances.
+
+    Groups are keyed by path prefix relative to the API root (e.g.
+    ``"/market-data"`` or ``"/trading/execution"``); the longest matching
+    prefix wins, and unmatched paths share the *default* limiter.  A 429
+    on one group therefore only penalizes that group.
+
+    :param default: Limiter for paths that match no group.
+    :param groups: Mapping of path prefix to limiter.
+    """
+
+    def __init__(self, default: RateLimiter, groups: dict[str, RateLimiter] | None = None) -> None:
+        self._default = default
+        self._groups: dict[str, RateLimiter] = {}
+        for prefix, limiter in (groups or {}).items():
+            self.add(prefix, limiter)
+
+    def add(self, prefix: str, limiter: RateLimiter) -> None:
+        """Register *limiter* for every path starting with *prefix*."""
+        self._groups["/" + prefix.strip("/")] = limiter
+        # Keep longest prefixes first so ``get`` can stop at the first match.
+        self._groups = dict(sorted(self._groups.items(), key=lambda item: len(item[0]), reverse=True))
+
+    def get(self, path: str) -> RateLimiter:
+        """Return the limiter responsible for *path*."""
+        if path.startswith(API_PREFIX):
+            path = path[len(API_PREFIX) :]
+        for prefix, limiter in self._groups.items():
+            if path == prefix or path.startswith(prefix + "/"):
+                return limiter
+        return self._default
+
+    @property
+    def default(self) -> RateLimiter:
+        return self._default
+
+    @property
+    def groups(self) -> dict[str, RateLimiter]:
+        return dict(self._groups)
+
+    def dispose(self) -> None:
+        self._default.dispose()
+        for limiter in self._groups.values():
+            limiter.dispose()
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import asyncio
 import random
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
-from typing import Any, TypeVar
+from typing import TypeVar
 
 T = TypeVar("T")
 
@@ -39,7 +39,7 @@ def _apply_jitter(s: float) -> float:
     return s + (random.random() * 2 - 1) * jitter_range  # noqa: S311
 
 
-async def retry(fn: Callable[[], Any], options: RetryOptions) -> Any:
+async def retry(fn: Callable[[], Awaitable[T]], options: RetryOptions) -> T:
     """Execute ``fn`` with automatic retries on failure.
 
     Uses exponential backoff (``delay * backoff_multiplier ** attempt``)
@@ -47,13 +47,14 @@ async def retry(fn: Callable[[], Any], options: RetryOptions) -> Any:
     when ``get_retry_after_s`` is provided.
     """
     last_error: BaseException | None = None
+    attempts = max(1, options.attempts)  # always make at least one call
 
-    for attempt in range(options.attempts):
+    for attempt in range(attempts):
         try:
             return await fn()
         except Exception as error:
             last_error = error
-            if attempt < options.attempts - 1 and options.should_retry(error):
+            if attempt < attempts - 1 and options.should_retry(error):
                 retry_after = options.get_retry_after_s(error) if options.get_retry_after_s else None
                 backoff = options.delay * (options.backoff_multiplier**attempt)
                 wait_s = retry_after if retry_after is not None else backoff
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Collapse concurrent calls with the same key into one execution.
+
+    The first caller for a key runs *fn*; callers arriving while it is in
+    flight await the same result (or exception) instead of starting their
+    own.  Once the call finishes the key is forgotten, so this never
+    serves stale data -- pair it with a cache for that.
+
+    If the caller running *fn* is cancelled, the callers that joined it
+    are not: the next one in line runs *fn* again.
+
+    Example::
+
+        flights: SingleFlight[Portfolio] = SingleFlight()
+        portfolio = await flights.do("portfolio", fetch_portfolio)
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Future[T]] = {}
+        self._shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run *fn*, or join the call already in flight for *key*."""
+        while (pending := self._calls.get(key)) is not None:
+            self._shared += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if not pending.cancelled() or (task is not None and task.cancelling()):
+                    raise
+                self._shared -= 1  # the call we joined was cancelled, not us
+
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()  # mark retrieved; only joined callers re-raise it
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+    @property
+    def in_flight(self) -> int:
+        """Number of keys currently executing."""
+        return len(self._calls)
+
+    @property
+    def shared(self) -> int:
+        """Calls answered by joining another caller's execution."""
+        return self._shared
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._calls
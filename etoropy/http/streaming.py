@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from collections.abc import AsyncIterator
+from typing import Any
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DELIMITERS = frozenset(",]}: \t\n\r")
+_COMPACT_THRESHOLD = 64 * 1024
+
+_decoder = json.JSONDecoder()
+
+
+class _Buffer:
+    """Growing text buffer fed from a byte stream, with a read cursor."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        self._chunks = chunks
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    async def fill(self) -> bool:
+        """Append the next chunk; returns ``False`` once the stream is exhausted."""
+        if self.eof:
+            return False
+        try:
+            chunk = await anext(self._chunks)
+        except StopAsyncIteration:
+            self.text += self._utf8.decode(b"", final=True)
+            self.eof = True
+            return False
+        if self.pos > _COMPACT_THRESHOLD:
+            self.text = self.text[self.pos :]
+            self.pos = 0
+        self.text += self._utf8.decode(chunk)
+        return True
+
+    async def peek(self) -> str:
+        """Skip whitespace and return the next character (``""`` at end of stream)."""
+        while True:
+            self.pos = _WHITESPACE.match(self.text, self.pos).end()  # type: ignore[union-attr]
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not await self.fill():
+                return ""
+
+    async def expect(self, char: str) -> None:
+        if await self.peek() != char:
+            raise json.JSONDecodeError(f"Expecting {char!r}", self.text, self.pos)
+        self.pos += 1
+
+    async def value(self) -> Any:
+        """Decode one complete JSON value at the cursor, reading more input as needed."""
+        await self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if await self.fill():
+                    continue
+                raise
+            # A number cut off by the chunk boundary ("12" of "12.5") decodes
+            # fine, so only trust a value once a delimiter follows it.
+            if (end == len(self.text) or self.text[end] not in _DELIMITERS) and await self.fill():
+                continue
+            self.pos = end
+            return obj
+
+
+async def iter_json_array(chunks: AsyncIterator[bytes], key: str | None = None) -> AsyncIterator[Any]:
+    """Decode a JSON array incrementally, yielding each element as soon as it is complete.
+
+    Only one element (plus one network chunk) is held in memory at a time,
+    instead of the whole body as text *and* as decoded objects.
+
+    :param chunks: Raw response body chunks (e.g. ``httpx.Response.aiter_bytes()``).
+    :param key: When the body is an object, stream the array stored under
+        this top-level key; other members are decoded and discarded.  A
+        bare top-level array is streamed regardless of *key*.  If the key is
+        missing, nothing is yielded.
+    :raises json.JSONDecodeError: If the body is not valid JSON of that shape.
+    """
+    buf = _Buffer(chunks)
+    first = await buf.peek()
+    if first == "":
+        return
+
+    if first == "{":
+        buf.pos += 1
+        while True:
+            if await buf.peek() == "}":
+                return
+            name = await buf.value()
+            await buf.expect(":")
+            if name == key and await buf.peek() == "[":
+                break
+            await buf.value()
+            if await buf.peek() == ",":
+                buf.pos += 1
+    elif first != "[":
+        raise json.JSONDecodeError("Expecting '[' or '{'", buf.text, buf.pos)
+
+    await buf.expect("[")
+    if await buf.peek() == "]":
+        return
+    while True:
+        yield await buf.value()
+        separator = await buf.peek()
+        if separator == "]":
+            return
+        if separator != ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", buf.text, buf.pos)
+        buf.pos += 1
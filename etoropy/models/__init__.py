@@ -72,6 +72,7 @@ from .websocket import (
     WsInstrumentRate,
     WsMessage,
     WsPrivateEvent,
+    WsRateTick,
     WsSubscribeOperation,
     WsUnsubscribeOperation,
 )
@@ -150,6 +151,7 @@ __all__ = [
     "WsInstrumentRate",
     "WsMessage",
     "WsPrivateEvent",
+    "WsRateTick",
     "WsSubscribeOperation",
     "WsUnsubscribeOperation",
 ]
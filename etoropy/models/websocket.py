@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -42,6 +43,32 @@ class WsInstrumentRate(BaseModel):
     price_rate_id: int = Field(0, alias="PriceRateID")
 
 
+@dataclass(slots=True)
+class WsRateTick:
+    """Lightweight, unvalidated alternative to :class:`WsInstrumentRate`.
+
+    Emitted instead of :class:`WsInstrumentRate` when
+    ``WsClientOptions.lightweight_ticks`` is set.  Attribute names match,
+    so handlers reading ``rate.bid`` / ``rate.ask`` work with either.
+    """
+
+    ask: float
+    bid: float
+    last_execution: float = 0.0
+    date: str = ""
+    price_rate_id: int = 0
+
+    @classmethod
+    def from_content(cls, content: dict[str, Any]) -> WsRateTick:
+        return cls(
+            float(content["Ask"]),
+            float(content["Bid"]),
+            float(content.get("LastExecution", 0.0)),
+            content.get("Date", ""),
+            int(content.get("PriceRateID", 0)),
+        )
+
+
 class WsPrivateEvent(BaseModel):
     model_config = {"extra": "allow"}
 
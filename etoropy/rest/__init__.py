@@ -4,12 +4,13 @@ from .market_data import MarketDataClient
 from .pi_data import PiDataClient
 from .reactions import ReactionsClient
 from .rest_client import RestClient
-from .trading_execution import TradingExecutionClient
+from .trading_execution import ArmedOrder, TradingExecutionClient
 from .trading_info import TradingInfoClient
 from .users_info import UsersInfoClient
 from .watchlists import WatchlistsClient
 
 __all__ = [
+    "ArmedOrder",
     "DiscoveryClient",
     "FeedsClient",
     "MarketDataClient",
@@ -1,24 +1,34 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from typing import Any
 
 from ..http.client import HttpClient, RequestOptions
+from ..http.rate_limiter import RequestPriority
 
 
 class BaseRestClient:
-    """Base class for all REST sub-clients, providing ``_get``/``_post``/``_put``/``_delete`` helpers."""
+    """Base class for all REST sub-clients, providing ``_get``/``_post``/``_put``/``_delete`` helpers.
+
+    Subclasses set ``_priority`` to pick the rate-limiter lane their requests wait in.
+    """
+
+    _priority: RequestPriority = RequestPriority.NORMAL
 
     def __init__(self, http: HttpClient) -> None:
         self._http = http
 
     async def _get(self, path: str, query: dict[str, Any] | None = None) -> Any:
-        return await self._http.request(RequestOptions(method="GET", path=path, query=query))
+        return await self._http.request(RequestOptions(method="GET", path=path, query=query, priority=self._priority))
+
+    def _stream(self, path: str, query: dict[str, Any] | None = None, key: str | None = None) -> AsyncIterator[Any]:
+        return self._http.stream(RequestOptions(method="GET", path=path, query=query, priority=self._priority), key)
 
     async def _post(self, path: str, body: Any = None) -> Any:
-        return await self._http.request(RequestOptions(method="POST", path=path, body=body))
+        return await self._http.request(RequestOptions(method="POST", path=path, body=body, priority=self._priority))
 
     async def _put(self, path: str, body: Any = None) -> Any:
-        return await self._http.request(RequestOptions(method="PUT", path=path, body=body))
+        return await self._http.request(RequestOptions(method="PUT", path=path, body=body, priority=self._priority))
 
     async def _delete(self, path: str, body: Any = None) -> Any:
-        return await self._http.request(RequestOptions(method="DELETE", path=path, body=body))
+        return await self._http.request(RequestOptions(method="DELETE", path=path, body=body, priority=self._priority))
@@ -3,10 +3,13 @@ from __future__ import annotations
 from typing import Any, cast
 
 from ..config.constants import API_PREFIX
+from ..http.rate_limiter import RequestPriority
 from ._base import BaseRestClient
 
 
 class DiscoveryClient(BaseRestClient):
+    _priority = RequestPriority.BULK
+
     async def get_curated_lists(self) -> list[Any]:
         data = await self._get(f"{API_PREFIX}/curated-lists")
         if isinstance(data, dict) and "curatedLists" in data:
@@ -3,10 +3,13 @@ from __future__ import annotations
 from typing import Any
 
 from ..config.constants import API_PREFIX
+from ..http.rate_limiter import RequestPriority
 from ._base import BaseRestClient
 
 
 class FeedsClient(BaseRestClient):
+    _priority = RequestPriority.BULK
+
     async def create_post(self, content: str, instrument_id: int | None = None) -> Any:
         body: dict[str, Any] = {"content": content}
         if instrument_id is not None:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import AsyncIterator
 from typing import Any
 
 from ..config.constants import API_PREFIX, MAX_CANDLES, MAX_RATE_INSTRUMENT_IDS
@@ -10,6 +11,8 @@ from ..models.market_data import (
     CandlesResponse,
     ClosingPricesResponse,
     ExchangesResponse,
+    InstrumentDisplayData,
+    InstrumentRate,
     InstrumentSearchResponse,
     InstrumentsResponse,
     InstrumentTypesResponse,
@@ -115,6 +118,31 @@ class MarketDataClient(BaseRestClient):
         data = await self._get(f"{API_PREFIX}/market-data/instruments", query or None)
         return InstrumentsResponse.model_validate(data)
 
+    async def iter_instruments(
+        self,
+        *,
+        exchange_ids: list[int] | None = None,
+        stocks_industry_ids: list[int] | None = None,
+        instrument_type_ids: list[int] | None = None,
+    ) -> AsyncIterator[InstrumentDisplayData]:
+        """Stream the instrument listing, validating each item as it is decoded.
+
+        Equivalent to :meth:`get_instruments` without ``instrument_ids``, but
+        the full listing is never held in memory at once.
+        """
+        query: dict[str, Any] = {}
+        if exchange_ids:
+            query["exchangeIds"] = ",".join(map(str, exchange_ids))
+        if stocks_industry_ids:
+            query["stocksIndustryIds"] = ",".join(map(str, stocks_industry_ids))
+        if instrument_type_ids:
+            query["instrumentTypeIds"] = ",".join(map(str, instrument_type_ids))
+
+        async for item in self._stream(
+            f"{API_PREFIX}/market-data/instruments", query or None, "instrumentDisplayDatas"
+        ):
+            yield InstrumentDisplayData.model_validate(item)
+
     async def get_rates(self, instrument_ids: list[int] | None = None) -> LiveRatesResponse:
         if not instrument_ids:
             data = await self._get(f"{API_PREFIX}/market-data/instruments/rates")
@@ -149,6 +177,21 @@ class MarketDataClient(BaseRestClient):
             all_rates.extend(resp.rates)
         return LiveRatesResponse(rates=all_rates)
 
+    async def iter_rates(self, instrument_ids: list[int] | None = None) -> AsyncIterator[InstrumentRate]:
+        """Stream live rates, validating each one as it is decoded.
+
+        Without *instrument_ids* the unfiltered all-instruments response is
+        decoded incrementally; with IDs this is a thin wrapper over
+        :meth:`get_rates`, whose per-ID responses are small.
+        """
+        if instrument_ids:
+            for rate in (await self.get_rates(instrument_ids)).rates:
+                yield rate
+            return
+
+        async for item in self._stream(f"{API_PREFIX}/market-data/instruments/rates", key="rates"):
+            yield InstrumentRate.model_validate(item)
+
     async def get_candles(
         self,
         instrument_id: int,
@@ -3,10 +3,13 @@ from __future__ import annotations
 from typing import Any
 
 from ..config.constants import API_PREFIX
+from ..http.rate_limiter import RequestPriority
 from ._base import BaseRestClient
 
 
 class PiDataClient(BaseRestClient):
+    _priority = RequestPriority.BULK
+
     async def get_copiers_public_info(self) -> Any:
         """Get copier info for the authenticated user."""
         return await self._get(f"{API_PREFIX}/pi-data/copiers")
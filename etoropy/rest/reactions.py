@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 from ..config.constants import API_PREFIX
+from ..http.rate_limiter import RequestPriority
 from ..models.feeds import Comment
 from ._base import BaseRestClient
 
 
 class ReactionsClient(BaseRestClient):
+    _priority = RequestPriority.BULK
+
     async def create_comment(self, post_id: str, content: str) -> Comment:
         data = await self._post(
             f"{API_PREFIX}/comments",
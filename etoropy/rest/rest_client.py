@@ -43,6 +43,10 @@ class RestClient:
         self.watchlists = WatchlistsClient(self._http)
         self.users_info = UsersInfoClient(self._http)
 
+    async def warm_up(self, connections: int | None = None) -> None:
+        """Pre-open HTTP connections; see :meth:`HttpClient.warm_up`."""
+        await self._http.warm_up(connections)
+
     async def aclose(self) -> None:
         await self._http.aclose()
 
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
-from typing import Any
+import math
+from collections.abc import Awaitable, Callable
+from typing import Any, Generic, TypeVar
 
+from pydantic import BaseModel
+
+from .. import _json
 from ..config.constants import API_PREFIX
-from ..http.client import HttpClient
+from ..errors.exceptions import EToroValidationError
+from ..http.client import HttpClient, RequestOptions
+from ..http.rate_limiter import RateLimiter, RequestPriority
 from ..models.common import TokenResponse
 from ..models.enums import TradingMode
 from ..models.trading import (
@@ -16,6 +23,115 @@ from ..models.trading import (
 )
 from ._base import BaseRestClient
 
+T = TypeVar("T", bound=BaseModel)
+
+
+class ArmedOrder(Generic[T]):
+    """An order request resolved and serialized ahead of time.
+
+    The JSON body is rendered once, when the order is armed, and split
+    around its variable fields; :meth:`fire` only splices in the new
+    *amount* and/or *rate* and posts the bytes, skipping instrument
+    resolution, request-model construction and ``model_dump``.  Requests
+    still go through the execution rate-limit lane and retries.
+
+    Create with :meth:`TradingExecutionClient.arm_market_order` /
+    :meth:`~TradingExecutionClient.arm_limit_order`, or
+    :meth:`EToroTrading.arm_market_order` to resolve a symbol first.
+
+    :param http: Client used to send the request.
+    :param path: Endpoint path.
+    :param request: The request to send when :meth:`fire` gets no overrides.
+    :param slots: Fields that :meth:`fire` may override, mapped to their
+        JSON names (e.g. ``{"amount": "Amount", "rate": "Rate"}``).
+    :param response_type: Model the response is validated into.
+    :param priority: Rate-limiter lane.
+    :param guard: Optional wrapper around each send, called with the
+        *amount* passed to :meth:`fire` and a coroutine function that
+        performs the request (used for pre-trade risk checks).
+    """
+
+    def __init__(
+        self,
+        http: HttpClient,
+        path: str,
+        request: BaseModel,
+        slots: dict[str, str],
+        response_type: type[T],
+        priority: RequestPriority = RequestPriority.EXECUTION,
+        guard: Callable[[float | None, Callable[[], Awaitable[T]]], Awaitable[T]] | None = None,
+    ) -> None:
+        self._http = http
+        self.guard = guard
+        self.path = path
+        self._response_type = response_type
+        self._priority = priority
+
+        payload = request.model_dump(mode="json", by_alias=True, exclude_none=True)
+        self._body = _json.dumps_bytes(payload)
+        self._defaults = {name: _json.dumps_bytes(payload[field]) for name, field in slots.items()}
+        markers = {}
+        for name, field in slots.items():
+            payload[field] = f"\x00slot:{name}\x00"
+            markers[name] = _json.dumps_bytes(payload[field])
+        template = _json.dumps_bytes(payload)
+        self._parts: list[bytes] = []
+        self._slots: list[str] = []
+        start = 0
+        for index, name in sorted((template.index(marker), name) for name, marker in markers.items()):
+            self._parts.append(template[start:index])
+            self._slots.append(name)
+            start = index + len(markers[name])
+        self._parts.append(template[start:])
+
+    @property
+    def body(self) -> bytes:
+        """The pre-rendered body sent by :meth:`fire` without overrides."""
+        return self._body
+
+    def render(self, amount: float | None = None, rate: float | None = None) -> bytes:
+        """Return the body with *amount* and/or *rate* replaced.
+
+        :raises EToroValidationError: If a value is not a positive finite
+            number or the order has no such field.
+        """
+        if amount is None and rate is None:
+            return self._body
+        values = {"amount": amount, "rate": rate}
+        for name, value in values.items():
+            if value is not None and name not in self._slots:
+                raise EToroValidationError(f"This order has no {name} to set", field=name)
+        chunks = [self._parts[0]]
+        for name, part in zip(self._slots, self._parts[1:], strict=True):
+            value = values[name]
+            chunks.append(_encode_number(name, value) if value is not None else self._defaults[name])
+            chunks.append(part)
+        return b"".join(chunks)
+
+    async def fire(self, amount: float | None = None, rate: float | None = None) -> T:
+        """Send the order, optionally with a new *amount* and/or *rate*.
+
+        :param amount: Amount to invest -- in units for orders armed by
+            units.
+        :param rate: Trigger rate (limit orders only).
+        """
+        body = self.render(amount, rate)
+        if self.guard is not None:
+            return await self.guard(amount, lambda: self._send(body))
+        return await self._send(body)
+
+    async def _send(self, body: bytes) -> T:
+        data = await self._http.request(
+            RequestOptions(method="POST", path=self.path, body=body, priority=self._priority)
+        )
+        return self._response_type.model_validate(data)
+
+
+def _encode_number(name: str, value: float) -> bytes:
+    if not (value > 0 and math.isfinite(value)):
+        raise EToroValidationError(f"{name} must be a positive number, got {value!r}", field=name)
+    return repr(float(value)).encode()
+
 
 class TradingExecutionClient(BaseRestClient):
     """REST client for order execution (open, close, cancel).
@@ -24,12 +140,19 @@ class TradingExecutionClient(BaseRestClient):
     ``/trading/execution/demo/...``, real orders to ``/trading/execution/...``.
     """
 
+    _priority = RequestPriority.EXECUTION
+
     def __init__(self, http: HttpClient, mode: TradingMode) -> None:
         super().__init__(http)
         self._path_prefix = (
             f"{API_PREFIX}/trading/execution/demo" if mode == "demo" else f"{API_PREFIX}/trading/execution"
         )
 
+    @property
+    def rate_limiter(self) -> RateLimiter | None:
+        """The limiter governing execution requests, if rate limiting is enabled."""
+        return self._http.rate_limiter_for(self._path_prefix)
+
     async def open_market_order_by_amount(self, params: MarketOrderByAmountRequest) -> OrderForOpenResponse:
         data = await self._post(f"{self._path_prefix}/market-open-orders/by-amount", params)
         return OrderForOpenResponse.model_validate(data)
@@ -38,6 +161,30 @@ class TradingExecutionClient(BaseRestClient):
         data = await self._post(f"{self._path_prefix}/market-open-orders/by-units", params)
         return OrderForOpenResponse.model_validate(data)
 
+    def arm_market_order(
+        self, params: MarketOrderByAmountRequest | MarketOrderByUnitsRequest
+    ) -> ArmedOrder[OrderForOpenResponse]:
+        """Pre-serialize a market order; :meth:`ArmedOrder.fire` may override its amount."""
+        if isinstance(params, MarketOrderByUnitsRequest):
+            path, field = f"{self._path_prefix}/market-open-orders/by-units", "AmountInUnits"
+        else:
+            path, field = f"{self._path_prefix}/market-open-orders/by-amount", "Amount"
+        return ArmedOrder(self._http, path, params, {"amount": field}, OrderForOpenResponse, self._priority)
+
+    def arm_limit_order(self, params: LimitOrderRequest) -> ArmedOrder[TokenResponse]:
+        """Pre-serialize a limit order; :meth:`ArmedOrder.fire` may override its amount and rate."""
+        if params.amount is None and params.amount_in_units is None:
+            raise EToroValidationError("Limit order needs an amount or units", field="amount")
+        field = "Amount" if params.amount is not None else "AmountInUnits"
+        return ArmedOrder(
+            self._http,
+            f"{self._path_prefix}/limit-orders",
+            params,
+            {"amount": field, "rate": "Rate"},
+            TokenResponse,
+            self._priority,
+        )
+
     async def cancel_market_open_order(self, order_id: int) -> TokenResponse:
         data = await self._delete(f"{self._path_prefix}/market-open-orders/{order_id}")
         return TokenResponse.model_validate(data)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from typing import Any
 
 from ..config.constants import API_PREFIX
 from ..http.client import HttpClient
+from ..http.rate_limiter import RequestPriority
 from ..models.enums import TradingMode
 from ..models.trading import (
     OrderForOpenInfoResponse,
@@ -22,6 +24,8 @@ class TradingInfoClient(BaseRestClient):
     real portfolio at ``/trading/info/portfolio`` (no ``real`` segment).
     """
 
+    _priority = RequestPriority.ACCOUNT
+
     def __init__(self, http: HttpClient, mode: TradingMode) -> None:
         super().__init__(http)
         self._mode = mode
@@ -63,3 +67,24 @@ class TradingInfoClient(BaseRestClient):
         if isinstance(data, list):
             return [TradeHistoryEntry.model_validate(item) for item in data]
         return []
+
+    async def iter_trade_history(
+        self,
+        min_date: str,
+        *,
+        page: int | None = None,
+        page_size: int | None = None,
+    ) -> AsyncIterator[TradeHistoryEntry]:
+        """Stream closed trades, validating each entry as it is decoded.
+
+        Same parameters as :meth:`get_trade_history`; yields nothing in demo mode.
+        """
+        if self._mode == "demo":
+            return
+        query: dict[str, Any] = {"minDate": min_date}
+        if page is not None:
+            query["page"] = page
+        if page_size is not None:
+            query["pageSize"] = page_size
+        async for item in self._stream(f"{API_PREFIX}/trading/info/trade/history", query):
+            yield TradeHistoryEntry.model_validate(item)
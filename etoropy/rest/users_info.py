@@ -3,10 +3,13 @@ from __future__ import annotations
 from typing import Any
 
 from ..config.constants import API_PREFIX
+from ..http.rate_limiter import RequestPriority
 from ._base import BaseRestClient
 
 
 class UsersInfoClient(BaseRestClient):
+    _priority = RequestPriority.BULK
+
     async def search_users(
         self,
         *,
@@ -1,4 +1,35 @@
+from ..ws.quote_book import Quote, QuoteBook
+from .batch import BatchItemResult, BatchResult, CancelOrder, ClosePosition, MarketOrder
 from .client import EToroTrading, OrderOptions
 from .instrument_resolver import InstrumentInfo, InstrumentResolver
+from .order_tracker import OrderTracker, OrderTrackerStats
+from .portfolio_state import PortfolioState, PortfolioStateStats
+from .risk import ExposureIndex, OrderIntent, RiskLimits, RiskManager, RiskStats
+from .streams import EventStream, OverflowPolicy, PriceTick, StreamStats
 
-__all__ = ["EToroTrading", "InstrumentInfo", "InstrumentResolver", "OrderOptions"]
+__all__ = [
+    "BatchItemResult",
+    "BatchResult",
+    "CancelOrder",
+    "ClosePosition",
+    "EToroTrading",
+    "EventStream",
+    "ExposureIndex",
+    "InstrumentInfo",
+    "InstrumentResolver",
+    "MarketOrder",
+    "OrderIntent",
+    "OrderOptions",
+    "OrderTracker",
+    "OrderTrackerStats",
+    "OverflowPolicy",
+    "PortfolioState",
+    "PortfolioStateStats",
+    "PriceTick",
+    "Quote",
+    "QuoteBook",
+    "RiskLimits",
+    "RiskManager",
+    "RiskStats",
+    "StreamStats",
+]
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from ..errors.exceptions import EToroBatchError, EToroValidationError
+from ..models.common import TokenResponse
+from ..models.trading import OrderForCloseResponse, OrderForOpenResponse
+from ..models.websocket import WsPrivateEvent
+
+if TYPE_CHECKING:
+    from .client import OrderOptions
+
+logger = logging.getLogger("etoropy")
+
+
+@dataclass(frozen=True)
+class MarketOrder:
+    """Open a market position in a batch.
+
+    Exactly one of *amount* and *units* must be given.
+
+    :param symbol_or_id: Instrument symbol or numeric ID.
+    :param amount: Dollar amount to invest.
+    :param units: Number of units.
+    :param is_buy: ``True`` for long, ``False`` for short.
+    :param options: Optional leverage, stop-loss, and take-profit settings.
+    """
+
+    symbol_or_id: str | int
+    amount: float | None = None
+    units: float | None = None
+    is_buy: bool = True
+    options: OrderOptions | None = None
+
+    def __post_init__(self) -> None:
+        if (self.amount is None) == (self.units is None):
+            raise EToroValidationError("MarketOrder needs exactly one of amount or units", field="amount")
+
+
+@dataclass(frozen=True)
+class ClosePosition:
+    """Close (or partially close) a position in a batch.
+
+    :param position_id: The position to close.
+    :param units_to_deduct: If given, perform a partial close.
+    :param instrument_id: The position's instrument, when already known;
+        otherwise it is looked up in the portfolio.
+    """
+
+    position_id: int
+    units_to_deduct: float | None = None
+    instrument_id: int | None = None
+
+
+@dataclass(frozen=True)
+class CancelOrder:
+    """Cancel a pending order in a batch.
+
+    :param order_id: The order to cancel.
+    :param limit: ``True`` for a limit order, ``False`` for a pending market order.
+    """
+
+    order_id: int
+    limit: bool = False
+
+
+BatchOp = MarketOrder | ClosePosition | CancelOrder
+BatchResponse = OrderForOpenResponse | OrderForCloseResponse | TokenResponse
+
+
+@dataclass
+class BatchItemResult:
+    """Outcome of one operation in a batch.
+
+    :param index: Position of the operation in the submitted sequence.
+    :param op: The operation.
+    :param response: The REST response, if the request succeeded.
+    :param fill: The execution event, when fills were awaited.
+    :param error: Why the operation (or its fill) failed.
+    :param latency: Seconds from submission to response (or to fill).
+    """
+
+    index: int
+    op: BatchOp
+    response: BatchResponse | None = None
+    fill: WsPrivateEvent | None = None
+    error: Exception | None = None
+    latency: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BatchResult:
+    """Per-item outcomes and throughput of one batch.
+
+    :param items: One entry per operation, in submission order.
+    :param elapsed: Wall-clock seconds for the whole batch.
+    :param concurrency: Maximum requests that were in flight at once.
+    """
+
+    items: list[BatchItemResult] = field(default_factory=list)
+    elapsed: float = 0.0
+    concurrency: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return all(item.ok for item in self.items)
+
+    @property
+    def succeeded(self) -> list[BatchItemResult]:
+        return [item for item in self.items if item.ok]
+
+    @property
+    def failed(self) -> list[BatchItemResult]:
+        return [item for item in self.items if not item.ok]
+
+    @property
+    def throughput(self) -> float:
+        """Operations completed per second."""
+        return len(self.items) / self.elapsed if self.elapsed > 0 else 0.0
+
+    def raise_for_errors(self) -> None:
+        """Raise :class:`EToroBatchError` if any operation failed."""
+        failed = self.failed
+        if failed:
+            first = failed[0].error
+            raise EToroBatchError(f"{len(failed)} of {len(self.items)} batch operations failed: {first}", self)
+
+
+async def run_batch(
+    ops: Sequence[BatchOp],
+    submit: Callable[[BatchOp], Awaitable[BatchResponse]],
+    concurrency: int,
+    confirm: Callable[[BatchOp, BatchResponse], Awaitable[WsPrivateEvent | None]] | None = None,
+) -> BatchResult:
+    """Run *ops* through *submit* with at most *concurrency* requests in flight.
+
+    Each operation's failure is recorded on its :class:`BatchItemResult`
+    rather than aborting the batch.  *confirm*, if given, runs after a
+    successful submission outside the concurrency bound (waiting for a fill
+    costs no requests) and returns the fill event, if any.
+    """
+    concurrency = max(1, concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+    items = [BatchItemResult(index, op) for index, op in enumerate(ops)]
+
+    async def run(item: BatchItemResult) -> None:
+        started = time.monotonic()
+        try:
+            async with semaphore:
+                item.response = await submit(item.op)
+            if confirm is not None:
+                item.fill = await confirm(item.op, item.response)
+        except Exception as exc:
+            logger.debug("Batch operation %d (%r) failed: %s", item.index, item.op, exc)
+            item.error = exc
+        item.latency = time.monotonic() - started
+
+    started = time.monotonic()
+    await asyncio.gather(*(run(item) for item in items))
+    return BatchResult(items, time.monotonic() - started, concurrency)
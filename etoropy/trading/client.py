@@ -1,16 +1,17 @@
 from __future__ import annotations
 
 import asyncio
-import contextlib
 import logging
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable, Sequence
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, TypeVar
 
+from .._events import EventEmitter
 from ..config.settings import EToroConfig
 from ..errors.exceptions import EToroError, EToroValidationError
+from ..http.singleflight import SingleFlight
 from ..models.common import TokenResponse
-from ..models.enums import CandleDirection, CandleInterval, OrderStatusId
+from ..models.enums import CandleDirection, CandleInterval
 from ..models.market_data import CandlesResponse, InstrumentRate
 from ..models.trading import (
     ClosePositionRequest,
@@ -18,7 +19,6 @@ from ..models.trading import (
     MarketOrderByAmountRequest,
     MarketOrderByUnitsRequest,
     OrderForCloseResponse,
-    OrderForOpenInfoResponse,
     OrderForOpenResponse,
     PendingOrder,
     PnlResponse,
@@ -26,14 +26,24 @@ from ..models.trading import (
     Position,
     TradeHistoryEntry,
 )
-from ..models.websocket import WsInstrumentRate, WsPrivateEvent
+from ..models.websocket import WsEnvelope, WsInstrumentRate, WsPrivateEvent, WsRateTick
 from ..rest.rest_client import RestClient
+from ..rest.trading_execution import ArmedOrder
 from ..ws.client import WsClient, WsClientOptions
+from ..ws.pool import WsClientPool
+from ..ws.quote_book import Quote, QuoteBook
+from ..ws.tick_buffer import TickBuffer
+from .batch import BatchOp, BatchResponse, BatchResult, CancelOrder, ClosePosition, MarketOrder, run_batch
+from .conflation import TickConflator
 from .instrument_resolver import InstrumentInfo, InstrumentResolver
+from .order_tracker import OrderTracker
+from .portfolio_state import PortfolioState
+from .risk import OrderIntent, RiskLimits, RiskManager
+from .streams import DEFAULT_STREAM_MAXSIZE, EventStream, OverflowPolicy, PriceTick, StreamStats
 
 logger = logging.getLogger("etoropy")
 
-EventHandler = Callable[..., Any]
+R = TypeVar("R")
 
 
 @dataclass
@@ -52,7 +62,7 @@ class OrderOptions:
     trailing_stop_loss: bool | None = None
 
 
-class EToroTrading:
+class EToroTrading(EventEmitter):
     """High-level async client for the eToro Public API.
 
     Wraps REST endpoints, WebSocket streaming, and instrument resolution
@@ -70,12 +80,19 @@ class EToroTrading:
 
     Events (register with ``etoro.on(event, handler)``)::
 
-        "price"          -> (symbol, instrument_id, WsInstrumentRate)
+        "price"          -> (symbol, instrument_id, WsInstrumentRate | WsRateTick)
         "order:update"   -> (WsPrivateEvent)
         "connected"      -> ()
         "disconnected"   -> ()
         "error"          -> (Exception)
         "ws:message"     -> (WsEnvelope)
+        "resync"         -> (reason, topics)   # after a reconnect or a sequence gap
+
+    Handlers may be coroutine functions (scheduled as tasks) or run in a
+    thread/process pool via ``on(event, handler, executor=...)``;
+    :meth:`handler_stats` reports per-handler latency.  For
+    backpressure-aware consumption use the async iterators :meth:`prices`
+    and :meth:`order_events` instead.
 
     :param config: SDK configuration. When *None*, settings are read from
         ``ETORO_``-prefixed environment variables.
@@ -86,75 +103,149 @@ class EToroTrading:
         if config is None:
             config = EToroConfig(**kwargs) if kwargs else EToroConfig()
         self._config = config
+        super().__init__(config.event_handler_concurrency, config.event_handler_backlog)
 
         self.rest = RestClient(config)
-        self.ws = WsClient(
-            WsClientOptions(
-                api_key=config.api_key,
-                user_key=config.user_key,
-                ws_url=config.ws_url,
-            )
+        self._quotes = QuoteBook(config.quote_max_age)
+        ws_options = WsClientOptions(
+            api_key=config.api_key,
+            user_key=config.user_key,
+            ws_url=config.ws_url,
+            lightweight_ticks=config.ws_lightweight_ticks,
+            tick_buffer=TickBuffer(config.ws_tick_buffer_size) if config.ws_tick_buffer_size else None,
+            max_concurrent_handlers=config.event_handler_concurrency,
+            max_pending_handlers=config.event_handler_backlog,
+            quote_book=self._quotes if config.quote_max_age > 0 else None,
+        )
+        self.ws: WsClient | WsClientPool = (
+            WsClientPool(ws_options, config.ws_shards) if config.ws_shards > 1 else WsClient(ws_options)
         )
         self.resolver = InstrumentResolver(self.rest.market_data)
+        self._portfolio_flight: SingleFlight[PortfolioResponse] = SingleFlight()
+        self._portfolio_state = (
+            PortfolioState(self.get_portfolio, config.portfolio_reconcile_interval) if config.portfolio_mirror else None
+        )
+        self._orders = OrderTracker(lambda order_id: self.rest.info.get_order(order_id))
+        self._risk = RiskManager(
+            RiskLimits(
+                max_notional_per_instrument=config.risk_max_notional_per_instrument,
+                max_open_positions=config.risk_max_open_positions,
+                max_orders_per_second=config.risk_max_orders_per_second,
+                max_leverage=config.risk_max_leverage,
+                leverage_caps=dict(config.risk_leverage_caps),
+            )
+        )
+        self._conflators: dict[float, TickConflator[WsInstrumentRate | WsRateTick]] = {}
+        self._conflated: dict[int, TickConflator[WsInstrumentRate | WsRateTick]] = {}
 
-        self._listeners: dict[str, list[EventHandler]] = {}
+        self._forwarded: set[str] = set()
 
-        self.ws.on("instrument:rate", self._on_instrument_rate)
         self.ws.on("private:event", self._on_private_event)
         self.ws.on("error", lambda err: self._emit("error", err))
-        self.ws.on("message", lambda envelope: self._emit("ws:message", envelope))
-
-    def on(self, event: str, handler: EventHandler) -> EToroTrading:
-        """Register *handler* for *event*."""
-        self._listeners.setdefault(event, []).append(handler)
-        return self
-
-    def off(self, event: str, handler: EventHandler) -> EToroTrading:
-        """Unregister *handler* from *event*."""
-        handlers = self._listeners.get(event)
-        if handlers and handler in handlers:
-            handlers.remove(handler)
-        return self
-
-    def once(self, event: str, handler: EventHandler) -> EToroTrading:
-        """Register *handler* for *event*, then auto-unregister after the first call."""
-
-        def wrapper(*args: Any, **kwargs: Any) -> Any:
-            self.off(event, wrapper)
-            return handler(*args, **kwargs)
-
-        return self.on(event, wrapper)
-
-    def _emit(self, event: str, *args: Any) -> bool:
-        handlers = self._listeners.get(event)
-        if not handlers:
-            return False
-        for handler in list(handlers):
-            handler(*args)
-        return True
-
-    def remove_all_listeners(self, event: str | None = None) -> EToroTrading:
-        """Remove all listeners, or only those for *event* if given."""
-        if event:
-            self._listeners.pop(event, None)
+        self.ws.on("resync", self._on_resync)
+        self._sync_ws_forwarding()
+
+    def _listeners_changed(self) -> None:
+        self._sync_ws_forwarding()
+
+    def _sync_ws_forwarding(self) -> None:
+        # Only listen to WsClient events someone here consumes: without a
+        # "message" / "instrument:rate" listener, WsClient skips building
+        # envelope and rate models altogether.  The quote book is fed by
+        # WsClient straight from the decoded frames.
+        for event, ws_event, handler in (
+            ("ws:message", "message", self._on_ws_message),
+            ("price", "instrument:rate", self._on_instrument_rate),
+        ):
+            wanted = bool(self._listeners.get(event))
+            if wanted == (event in self._forwarded):
+                continue
+            if wanted:
+                self.ws.on(ws_event, handler)
+                self._forwarded.add(event)
+            else:
+                self.ws.off(ws_event, handler)
+                self._forwarded.discard(event)
+
+    def _on_ws_message(self, envelope: WsEnvelope) -> None:
+        self._emit("ws:message", envelope)
+
+    def _on_instrument_rate(self, instrument_id: int, rate: WsInstrumentRate | WsRateTick) -> None:
+        conflator = self._conflated.get(instrument_id)
+        if conflator is not None:
+            conflator.put(instrument_id, rate)
         else:
-            self._listeners.clear()
-        return self
+            self._emit_price(instrument_id, rate)
 
-    def _on_instrument_rate(self, instrument_id: int, rate: WsInstrumentRate) -> None:
+    def _emit_price(self, instrument_id: int, rate: WsInstrumentRate | WsRateTick) -> None:
         symbol = self.resolver.get_symbol(instrument_id) or str(instrument_id)
         self._emit("price", symbol, instrument_id, rate)
 
+    def _on_resync(self, reason: str, topics: list[str]) -> None:
+        ids = [int(topic[11:]) for topic in topics if topic.startswith("instrument:")]
+        self._quotes.invalidate(ids)
+        if self._portfolio_state is not None and "private" in topics:
+            self._portfolio_state.invalidate()
+        self._emit("resync", reason, topics)
+
     def _on_private_event(self, event: WsPrivateEvent) -> None:
+        if self._portfolio_state is not None:
+            self._portfolio_state.apply(event)
+        self._orders.on_event(event)
+        self._risk.exposure.on_event(event)
         self._emit("order:update", event)
 
+    @property
+    def quotes(self) -> QuoteBook:
+        """Latest streamed quote per instrument (see :attr:`EToroConfig.quote_max_age`)."""
+        return self._quotes
+
+    @property
+    def portfolio(self) -> PortfolioState | None:
+        """Event-driven portfolio mirror (see :attr:`EToroConfig.portfolio_mirror`)."""
+        return self._portfolio_state
+
+    async def _synced_portfolio(self) -> PortfolioState | None:
+        # The mirror is only trustworthy while private events are streaming.
+        state = self._portfolio_state
+        if state is None or not self.ws.is_connected_for("private"):
+            return None
+        if not state.is_seeded:
+            self._ensure_private_subscription()
+            await state.ensure_synced()
+            state.start()
+        return state
+
+    @property
+    def conflation_stats(self) -> StreamStats:
+        """Totals across conflated price streams (see :meth:`stream_prices`).
+
+        ``dropped`` counts ticks superseded before delivery.
+        """
+        total = StreamStats()
+        for conflator in self._conflators.values():
+            total.delivered += conflator.stats.delivered
+            total.dropped += conflator.stats.dropped
+            total.high_water = max(total.high_water, conflator.stats.high_water)
+        return total
+
+    @property
+    def tick_buffer(self) -> TickBuffer | None:
+        """Columnar buffer of streamed ticks, if :attr:`EToroConfig.ws_tick_buffer_size` is set."""
+        return self.ws.tick_buffer
+
     async def connect(self) -> None:
         """Open the WebSocket connection and authenticate.
 
         Must be called before :meth:`stream_prices` or :meth:`wait_for_order`.
-        Emits the ``"connected"`` event on success.
+        Emits the ``"connected"`` event on success.  When
+        :attr:`EToroConfig.http_prewarm_connections` is set, the HTTP
+        connection pool is warmed up concurrently.
         """
-        await self.ws.connect()
+        if self._config.http_prewarm_connections:
+            await asyncio.gather(self.ws.connect(), self.rest.warm_up())
+        else:
+            await self.ws.connect()
         self._emit("connected")
 
     async def disconnect(self) -> None:
@@ -163,8 +254,14 @@ class EToroTrading:
         Emits the ``"disconnected"`` event.  Called automatically when
         exiting the ``async with`` block.
         """
+        if self._portfolio_state is not None:
+            await self._portfolio_state.stop()
+            self._portfolio_state.invalidate()
+        await self._orders.stop()
         await self.ws.disconnect()
         await self.rest.aclose()
+        for conflator in self._conflators.values():
+            conflator.discard()
         self._emit("disconnected")
 
     async def buy_by_amount(
@@ -180,19 +277,7 @@ class EToroTrading:
         :param options: Optional leverage, stop-loss, and take-profit settings.
         :returns: The order response including the assigned order ID.
         """
-        opts = options or OrderOptions()
-        instrument_id = await self.resolver.resolve(symbol_or_id)
-        return await self.rest.execution.open_market_order_by_amount(
-            MarketOrderByAmountRequest(
-                InstrumentID=instrument_id,
-                IsBuy=True,
-                Leverage=opts.leverage,
-                Amount=amount,
-                StopLossRate=opts.stop_loss,
-                TakeProfitRate=opts.take_profit,
-                IsTslEnabled=opts.trailing_stop_loss,
-            )
-        )
+        return await self._open_market_order(symbol_or_id, True, options, amount=amount)
 
     async def buy_by_units(
         self,
@@ -207,19 +292,7 @@ class EToroTrading:
         :param options: Optional leverage, stop-loss, and take-profit settings.
         :returns: The order response including the assigned order ID.
         """
-        opts = options or OrderOptions()
-        instrument_id = await self.resolver.resolve(symbol_or_id)
-        return await self.rest.execution.open_market_order_by_units(
-            MarketOrderByUnitsRequest(
-                InstrumentID=instrument_id,
-                IsBuy=True,
-                Leverage=opts.leverage,
-                AmountInUnits=units,
-                StopLossRate=opts.stop_loss,
-                TakeProfitRate=opts.take_profit,
-                IsTslEnabled=opts.trailing_stop_loss,
-            )
-        )
+        return await self._open_market_order(symbol_or_id, True, options, units=units)
 
     async def sell_by_amount(
         self,
@@ -234,19 +307,7 @@ class EToroTrading:
         :param options: Optional leverage, stop-loss, and take-profit settings.
         :returns: The order response including the assigned order ID.
         """
-        opts = options or OrderOptions()
-        instrument_id = await self.resolver.resolve(symbol_or_id)
-        return await self.rest.execution.open_market_order_by_amount(
-            MarketOrderByAmountRequest(
-                InstrumentID=instrument_id,
-                IsBuy=False,
-                Leverage=opts.leverage,
-                Amount=amount,
-                StopLossRate=opts.stop_loss,
-                TakeProfitRate=opts.take_profit,
-                IsTslEnabled=opts.trailing_stop_loss,
-            )
-        )
+        return await self._open_market_order(symbol_or_id, False, options, amount=amount)
 
     async def sell_by_units(
         self,
@@ -261,53 +322,92 @@ class EToroTrading:
         :param options: Optional leverage, stop-loss, and take-profit settings.
         :returns: The order response including the assigned order ID.
         """
+        return await self._open_market_order(symbol_or_id, False, options, units=units)
+
+    async def _open_market_order(
+        self,
+        symbol_or_id: str | int,
+        is_buy: bool,
+        options: OrderOptions | None,
+        amount: float | None = None,
+        units: float | None = None,
+    ) -> OrderForOpenResponse:
         opts = options or OrderOptions()
         instrument_id = await self.resolver.resolve(symbol_or_id)
-        return await self.rest.execution.open_market_order_by_units(
-            MarketOrderByUnitsRequest(
-                InstrumentID=instrument_id,
-                IsBuy=False,
-                Leverage=opts.leverage,
-                AmountInUnits=units,
-                StopLossRate=opts.stop_loss,
-                TakeProfitRate=opts.take_profit,
-                IsTslEnabled=opts.trailing_stop_loss,
-            )
-        )
+        params = _market_order_request(instrument_id, is_buy, opts, amount, units)
+        intent = self._open_intent(instrument_id, is_buy, opts.leverage, amount, units)
+        if isinstance(params, MarketOrderByUnitsRequest):
+            return await self._checked(intent, lambda: self.rest.execution.open_market_order_by_units(params))
+        return await self._checked(intent, lambda: self.rest.execution.open_market_order_by_amount(params))
 
     async def close_position(self, position_id: int, units_to_deduct: float | None = None) -> OrderForCloseResponse:
         """Close an open position.
 
+        While the WebSocket is connected the position is looked up in
+        :attr:`portfolio`, so this is a single execution call.
+
         :param position_id: The position to close.
         :param units_to_deduct: If given, perform a partial close.
         :raises EToroValidationError: If *position_id* is not found in the portfolio.
         """
-        portfolio = await self.get_portfolio()
-        all_positions = list(portfolio.client_portfolio.positions)
-        for mirror in portfolio.client_portfolio.mirrors:
-            all_positions.extend(mirror.positions)
-        position = next((p for p in all_positions if p.position_id == position_id), None)
-        if not position:
-            raise EToroValidationError(f"Position {position_id} not found in portfolio", field="position_id")
-        return await self.rest.execution.close_position(
-            position_id,
-            ClosePositionRequest(InstrumentId=position.instrument_id, UnitsToDeduct=units_to_deduct),
+        position = await self._find_position(position_id)
+        request = ClosePositionRequest(InstrumentId=position.instrument_id, UnitsToDeduct=units_to_deduct)
+        return await self._checked(
+            OrderIntent("close", position.instrument_id),
+            lambda: self.rest.execution.close_position(position_id, request),
         )
 
-    async def close_all_positions(self) -> list[OrderForCloseResponse]:
-        """Close all open positions in the portfolio (runs in parallel)."""
-        portfolio = await self.get_portfolio()
-        return list(
-            await asyncio.gather(
-                *(
-                    self.rest.execution.close_position(
-                        p.position_id,
-                        ClosePositionRequest(InstrumentId=p.instrument_id),
-                    )
-                    for p in portfolio.client_portfolio.positions
-                )
-            )
+    async def _find_position(self, position_id: int) -> Position:
+        state = await self._synced_portfolio()
+        if state is not None:
+            position = state.position(position_id)
+            if position is None:
+                # Opened moments ago and its event not seen yet?
+                await state.sync()
+                position = state.position(position_id)
+        else:
+            portfolio = await self.get_portfolio()
+            all_positions = list(portfolio.client_portfolio.positions)
+            for mirror in portfolio.client_portfolio.mirrors:
+                all_positions.extend(mirror.positions)
+            position = next((p for p in all_positions if p.position_id == position_id), None)
+        if not position:
+            raise EToroValidationError(f"Position {position_id} not found in portfolio", field="position_id")
+        return position
+
+    async def close_all_positions(
+        self, include_mirrors: bool = False, concurrency: int | None = None, raise_on_error: bool = True
+    ) -> BatchResult:
+        """Close all open positions in the portfolio.
+
+        Runs as one :meth:`execute_batch`: requests are bounded by
+        *concurrency* and a failed close does not abandon the others.
+
+        :param include_mirrors: Also close positions held through
+            copy-trading mirrors.
+        :param concurrency: See :meth:`execute_batch`.
+        :param raise_on_error: Raise :class:`EToroBatchError` once every
+            close has finished if any of them failed.  Pass ``False`` to
+            inspect the returned :class:`BatchResult` instead; the error
+            also carries it as ``result``.
+        :raises EToroBatchError: If *raise_on_error* and a close failed.
+        """
+        state = await self._synced_portfolio()
+        if state is not None:
+            positions = state.positions()
+            if include_mirrors:
+                positions.extend(state.mirror_positions())
+        else:
+            client = (await self.get_portfolio()).client_portfolio
+            positions = list(client.positions)
+            if include_mirrors:
+                positions.extend(p for m in client.mirrors for p in m.positions)
+        result = await self.execute_batch(
+            [ClosePosition(p.position_id, instrument_id=p.instrument_id) for p in positions], concurrency
         )
+        if raise_on_error:
+            result.raise_for_errors()
+        return result
 
     async def place_limit_order(
         self,
@@ -327,7 +427,81 @@ class EToroTrading:
         """
         opts = options or OrderOptions()
         instrument_id = await self.resolver.resolve(symbol_or_id)
-        return await self.rest.execution.open_limit_order(
+        request = LimitOrderRequest(
+            InstrumentID=instrument_id,
+            IsBuy=is_buy,
+            Leverage=opts.leverage,
+            Amount=amount,
+            Rate=trigger_rate,
+            StopLossRate=opts.stop_loss or 0.0,
+            TakeProfitRate=opts.take_profit or 0.0,
+            IsTslEnabled=opts.trailing_stop_loss,
+        )
+        intent = self._open_intent(instrument_id, is_buy, opts.leverage, amount, None)
+        return await self._checked(intent, lambda: self.rest.execution.open_limit_order(request))
+
+    async def arm_market_order(
+        self,
+        symbol_or_id: str | int,
+        is_buy: bool,
+        amount: float | None = None,
+        units: float | None = None,
+        options: OrderOptions | None = None,
+    ) -> ArmedOrder[OrderForOpenResponse]:
+        """Prepare a market order to be sent later with minimal latency.
+
+        The instrument is resolved and the request body serialized now;
+        :meth:`ArmedOrder.fire` then only splices in the amount and posts::
+
+            entry = await etoro.arm_market_order("AAPL", is_buy=True, amount=100)
+            ...
+            response = await entry.fire()  # or entry.fire(amount=250)
+
+        Exactly one of *amount* and *units* must be given; :meth:`fire
+        <ArmedOrder.fire>` overrides the same field.  The pre-trade checks
+        of :attr:`risk` run on every fire.
+
+        :param symbol_or_id: Instrument symbol or numeric ID.
+        :param is_buy: ``True`` for long, ``False`` for short.
+        :param amount: Dollar amount to invest.
+        :param units: Number of units.
+        :param options: Optional leverage, stop-loss, and take-profit settings.
+        """
+        if (amount is None) == (units is None):
+            raise EToroValidationError("Arm a market order with exactly one of amount or units", field="amount")
+        opts = options or OrderOptions()
+        instrument_id = await self.resolver.resolve(symbol_or_id)
+        armed = self.rest.execution.arm_market_order(_market_order_request(instrument_id, is_buy, opts, amount, units))
+
+        def guard(
+            size: float | None, send: Callable[[], Awaitable[OrderForOpenResponse]]
+        ) -> Awaitable[OrderForOpenResponse]:
+            if units is not None:
+                intent = self._open_intent(instrument_id, is_buy, opts.leverage, None, size or units)
+            else:
+                intent = self._open_intent(instrument_id, is_buy, opts.leverage, size or amount, None)
+            return self._checked(intent, send)
+
+        armed.guard = guard
+        return armed
+
+    async def arm_limit_order(
+        self,
+        symbol_or_id: str | int,
+        is_buy: bool,
+        trigger_rate: float,
+        amount: float,
+        options: OrderOptions | None = None,
+    ) -> ArmedOrder[TokenResponse]:
+        """Prepare a limit order to be sent later with minimal latency.
+
+        Like :meth:`arm_market_order`; :meth:`ArmedOrder.fire` may override
+        both *amount* and *trigger_rate* (as ``rate``).  Parameters are those
+        of :meth:`place_limit_order`.
+        """
+        opts = options or OrderOptions()
+        instrument_id = await self.resolver.resolve(symbol_or_id)
+        armed = self.rest.execution.arm_limit_order(
             LimitOrderRequest(
                 InstrumentID=instrument_id,
                 IsBuy=is_buy,
@@ -340,37 +514,155 @@ class EToroTrading:
             )
         )
 
+        def guard(size: float | None, send: Callable[[], Awaitable[TokenResponse]]) -> Awaitable[TokenResponse]:
+            return self._checked(self._open_intent(instrument_id, is_buy, opts.leverage, size or amount, None), send)
+
+        armed.guard = guard
+        return armed
+
     async def cancel_order(self, order_id: int) -> TokenResponse:
         """Cancel a pending market order."""
-        return await self.rest.execution.cancel_market_open_order(order_id)
+        return await self._checked(
+            OrderIntent("cancel"), lambda: self.rest.execution.cancel_market_open_order(order_id)
+        )
 
     async def cancel_limit_order(self, order_id: int) -> TokenResponse:
         """Cancel a pending limit order."""
-        return await self.rest.execution.cancel_limit_order(order_id)
+        return await self._checked(OrderIntent("cancel"), lambda: self.rest.execution.cancel_limit_order(order_id))
 
-    async def cancel_all_orders(self) -> list[TokenResponse]:
-        """Cancel all pending market orders (runs in parallel)."""
-        portfolio = await self.get_portfolio()
-        orders = portfolio.client_portfolio.orders_for_open
-        return list(await asyncio.gather(*(self.rest.execution.cancel_market_open_order(o.order_id) for o in orders)))
+    async def cancel_all_orders(self, concurrency: int | None = None, raise_on_error: bool = True) -> BatchResult:
+        """Cancel all pending market orders as one :meth:`execute_batch`.
 
-    async def cancel_all_limit_orders(self) -> list[TokenResponse]:
-        """Cancel all pending limit orders (runs in parallel)."""
-        portfolio = await self.get_portfolio()
-        orders = portfolio.client_portfolio.orders
-        return list(await asyncio.gather(*(self.rest.execution.cancel_limit_order(o.order_id) for o in orders)))
+        :param concurrency: See :meth:`execute_batch`.
+        :param raise_on_error: See :meth:`close_all_positions`.
+        :raises EToroBatchError: If *raise_on_error* and a cancel failed.
+        """
+        state = await self._synced_portfolio()
+        orders = (
+            state.market_orders()
+            if state is not None
+            else (await self.get_portfolio()).client_portfolio.orders_for_open
+        )
+        result = await self.execute_batch([CancelOrder(o.order_id) for o in orders], concurrency)
+        if raise_on_error:
+            result.raise_for_errors()
+        return result
+
+    async def cancel_all_limit_orders(self, concurrency: int | None = None, raise_on_error: bool = True) -> BatchResult:
+        """Cancel all pending limit orders as one :meth:`execute_batch`.
+
+        :param concurrency: See :meth:`execute_batch`.
+        :param raise_on_error: See :meth:`close_all_positions`.
+        :raises EToroBatchError: If *raise_on_error* and a cancel failed.
+        """
+        state = await self._synced_portfolio()
+        orders = state.limit_orders() if state is not None else (await self.get_portfolio()).client_portfolio.orders
+        result = await self.execute_batch([CancelOrder(o.order_id, limit=True) for o in orders], concurrency)
+        if raise_on_error:
+            result.raise_for_errors()
+        return result
+
+    @property
+    def batch_concurrency(self) -> int:
+        """Default in-flight request bound for :meth:`execute_batch`.
+
+        The capacity of the execution rate-limit bucket: more concurrent
+        requests than that would only queue inside the limiter.
+        """
+        limiter = self.rest.execution.rate_limiter
+        return limiter.max_requests if limiter is not None else self._config.rate_limit_max_requests
+
+    async def execute_batch(
+        self,
+        ops: Sequence[BatchOp],
+        concurrency: int | None = None,
+        wait_for_fills: bool = False,
+        fill_timeout_s: float = 30.0,
+    ) -> BatchResult:
+        """Submit many order operations with bounded concurrency.
+
+        Every operation gets a :class:`BatchItemResult`; a failure is
+        recorded on its item instead of cancelling the rest of the batch.
+        The returned :class:`BatchResult` also reports elapsed time and
+        throughput.
+
+        Example::
+
+            result = await etoro.execute_batch(
+                [MarketOrder("AAPL", amount=100), ClosePosition(123), CancelOrder(456, limit=True)],
+                wait_for_fills=True,
+            )
+            for item in result.failed:
+                print(item.op, item.error)
+
+        :param ops: :class:`MarketOrder`, :class:`ClosePosition` and
+            :class:`CancelOrder` operations, submitted in order.
+        :param concurrency: Max requests in flight (default
+            :attr:`batch_concurrency`).
+        :param wait_for_fills: Also wait for each :class:`MarketOrder` to
+            execute (via the ``private`` stream, see :meth:`wait_for_order`);
+            a failed or timed-out fill is recorded as the item's error.
+            Requires :meth:`connect`.
+        :param fill_timeout_s: Per-order fill timeout.
+        """
+        confirm = None
+        if wait_for_fills:
+            self._ensure_private_subscription()
+
+            async def confirm(op: BatchOp, response: BatchResponse) -> WsPrivateEvent | None:
+                if not isinstance(response, OrderForOpenResponse):
+                    return None
+                return await self.wait_for_order(response.order_for_open.order_id, fill_timeout_s)
+
+        return await run_batch(
+            ops, self._submit, concurrency if concurrency is not None else self.batch_concurrency, confirm
+        )
+
+    async def _submit(self, op: BatchOp) -> BatchResponse:
+        if isinstance(op, MarketOrder):
+            return await self._open_market_order(op.symbol_or_id, op.is_buy, op.options, op.amount, op.units)
+        if isinstance(op, ClosePosition):
+            instrument_id = op.instrument_id
+            if instrument_id is None:
+                instrument_id = (await self._find_position(op.position_id)).instrument_id
+            request = ClosePositionRequest(InstrumentId=instrument_id, UnitsToDeduct=op.units_to_deduct)
+            return await self._checked(
+                OrderIntent("close", instrument_id),
+                lambda: self.rest.execution.close_position(op.position_id, request),
+            )
+        if op.limit:
+            return await self.cancel_limit_order(op.order_id)
+        return await self.cancel_order(op.order_id)
 
     async def get_portfolio(self) -> PortfolioResponse:
-        """Fetch the full portfolio (positions, mirrors, pending orders)."""
-        return await self.rest.info.get_portfolio()
+        """Fetch the full portfolio (positions, mirrors, pending orders).
+
+        Concurrent calls share one request and one parsed response unless
+        :attr:`EToroConfig.coalesce_requests` is disabled.
+        """
+        if not self._config.coalesce_requests:
+            return await self.rest.info.get_portfolio()
+        return await self._portfolio_flight.do("portfolio", self.rest.info.get_portfolio)
 
     async def get_positions(self) -> list[Position]:
-        """Fetch all open positions."""
+        """Fetch all open positions.
+
+        Served from :attr:`portfolio` while the WebSocket is connected.
+        """
+        state = await self._synced_portfolio()
+        if state is not None:
+            return state.positions()
         portfolio = await self.get_portfolio()
         return portfolio.client_portfolio.positions
 
     async def get_pending_orders(self) -> list[PendingOrder]:
-        """Fetch all pending orders (limit orders and orders-for-open)."""
+        """Fetch all pending orders (limit orders and orders-for-open).
+
+        Served from :attr:`portfolio` while the WebSocket is connected.
+        """
+        state = await self._synced_portfolio()
+        if state is not None:
+            return state.pending_orders()
         portfolio = await self.get_portfolio()
         return [*portfolio.client_portfolio.orders, *portfolio.client_portfolio.orders_for_open]
 
@@ -393,11 +685,37 @@ class EToroTrading:
         return await self.rest.info.get_trade_history(min_date, page=page, page_size=page_size)
 
     async def get_rates(self, symbols_or_ids: list[str | int]) -> list[InstrumentRate]:
-        """Fetch live bid/ask rates for the given instruments."""
+        """Fetch live bid/ask rates for the given instruments.
+
+        Always a REST call returning the full :class:`InstrumentRate`
+        (conversion rates, unit margins, ...); use :meth:`get_quotes` for
+        the streamed bid/ask without a request.
+        """
         ids = list(await asyncio.gather(*(self.resolver.resolve(s) for s in symbols_or_ids)))
         response = await self.rest.market_data.get_rates(ids)
         return response.rates
 
+    async def get_quote(self, symbol_or_id: str | int, max_age: float | None = None) -> Quote | None:
+        """Return the latest streamed quote for an instrument without calling REST.
+
+        :param max_age: Freshness limit in seconds (defaults to
+            :attr:`EToroConfig.quote_max_age`).
+        :returns: ``None`` if no fresh quote has been streamed.
+        """
+        instrument_id = await self.resolver.resolve(symbol_or_id)
+        return self._quotes.get(instrument_id, max_age)
+
+    async def get_quotes(self, symbols_or_ids: list[str | int], max_age: float | None = None) -> list[Quote | None]:
+        """Return the latest streamed quotes for several instruments without calling REST.
+
+        :param max_age: Freshness limit in seconds (defaults to
+            :attr:`EToroConfig.quote_max_age`).
+        :returns: One entry per instrument, in order; ``None`` where no
+            fresh quote has been streamed.
+        """
+        ids = await asyncio.gather(*(self.resolver.resolve(s) for s in symbols_or_ids))
+        return [self._quotes.get(id_, max_age) for id_ in ids]
+
     async def get_candles(
         self,
         symbol_or_id: str | int,
@@ -415,17 +733,41 @@ class EToroTrading:
         instrument_id = await self.resolver.resolve(symbol_or_id)
         return await self.rest.market_data.get_candles(instrument_id, direction, interval, count)
 
-    async def stream_prices(self, symbols_or_ids: list[str | int], snapshot: bool = True) -> None:
+    async def stream_prices(
+        self,
+        symbols_or_ids: list[str | int],
+        snapshot: bool = True,
+        conflate_interval: float | None = None,
+    ) -> None:
         """Subscribe to real-time price updates for the given instruments.
 
         Price ticks are emitted as ``"price"`` events with
         ``(symbol, instrument_id, WsInstrumentRate)`` arguments.
         Requires a prior call to :meth:`connect`.
 
+        With *conflate_interval*, ticks for these instruments are coalesced
+        and only the latest per instrument is emitted, at most once every
+        *conflate_interval* seconds, so handler cost no longer grows with the
+        feed rate.  The quote book still sees every tick.  To instead take
+        the latest quote whenever the consumer is ready, iterate
+        :meth:`prices` with ``policy="conflate"``.
+
         :param symbols_or_ids: Instruments to stream.
         :param snapshot: If ``True``, request an initial snapshot on subscribe.
+        :param conflate_interval: Conflation cadence in seconds (e.g.
+            ``0.05``); ``None`` delivers every tick.
         """
         ids = list(await asyncio.gather(*(self.resolver.resolve(s) for s in symbols_or_ids)))
+        if conflate_interval:
+            conflator = self._conflators.get(conflate_interval)
+            if conflator is None:
+                conflator = TickConflator(conflate_interval, self._emit_price)
+                self._conflators[conflate_interval] = conflator
+            for id_ in ids:
+                self._conflated[id_] = conflator
+        else:
+            for id_ in ids:
+                self._conflated.pop(id_, None)
         topics = [f"instrument:{id_}" for id_ in ids]
         self.ws.subscribe(topics, snapshot)
 
@@ -436,13 +778,118 @@ class EToroTrading:
             id_ = s if isinstance(s, int) else self.resolver.get_cached_id(s)
             if id_ is not None:
                 topics.append(f"instrument:{id_}")
+                self._quotes.invalidate([id_])
+                conflator = self._conflated.pop(id_, None)
+                if conflator is not None:
+                    conflator.discard([id_])
         if topics:
             self.ws.unsubscribe(topics)
 
+    def prices(
+        self,
+        symbols_or_ids: list[str | int] | None = None,
+        *,
+        maxsize: int = DEFAULT_STREAM_MAXSIZE,
+        policy: OverflowPolicy = "drop_oldest",
+        snapshot: bool = True,
+    ) -> EventStream[PriceTick]:
+        """Stream price ticks as an async iterator.
+
+        Unlike ``on("price", ...)`` handlers, the consumer runs outside the
+        WebSocket receive loop: ticks are queued in a bounded per-stream
+        queue and *policy* decides what happens when it fills up (see
+        :class:`EventStream`).  ``stream.stats`` counts dropped ticks.
+
+        Example::
+
+            async with etoro.prices(["AAPL", "BTC"], policy="conflate") as stream:
+                async for tick in stream:
+                    print(tick.symbol, tick.rate.bid, tick.rate.ask)
+
+        Instruments are resolved and subscribed when iteration starts;
+        closing the stream does not unsubscribe them.  Requires a prior
+        call to :meth:`connect`.
+
+        :param symbols_or_ids: Instruments to stream; ``None`` yields every
+            tick from existing subscriptions.
+        :param maxsize: Queue bound.
+        :param policy: ``"drop_oldest"``, ``"conflate"`` (latest tick per
+            instrument) or ``"block"`` (pause socket reads; use
+            ``async with`` so the pause is always lifted).
+        :param snapshot: Request an initial snapshot on subscribe.
+        """
+        wanted: set[int] | None = None
+
+        def handler(symbol: str, instrument_id: int, rate: WsInstrumentRate | WsRateTick) -> None:
+            if wanted is None or instrument_id in wanted:
+                put(PriceTick(symbol, instrument_id, rate))
+
+        async def start() -> None:
+            nonlocal wanted
+            if symbols_or_ids is not None:
+                wanted = set(await asyncio.gather(*(self.resolver.resolve(s) for s in symbols_or_ids)))
+            self.on("price", handler)
+            if wanted:
+                self.ws.subscribe([f"instrument:{id_}" for id_ in wanted], snapshot)
+
+        stream: EventStream[PriceTick] = EventStream(
+            maxsize,
+            policy,
+            key=lambda tick: tick.instrument_id,
+            start=start,
+            stop=lambda: self.off("price", handler),
+            pause=self.ws.pause_reading,
+            resume=self.ws.resume_reading,
+        )
+        put = stream.sink()
+        return stream
+
+    def order_events(
+        self,
+        *,
+        maxsize: int = DEFAULT_STREAM_MAXSIZE,
+        policy: OverflowPolicy = "drop_oldest",
+    ) -> EventStream[WsPrivateEvent]:
+        """Stream private order events as an async iterator.
+
+        Subscribes to private events when iteration starts.  ``"conflate"``
+        keeps the latest event per order ID; ``"block"`` drops nothing but
+        pauses the whole connection while the consumer is behind.
+
+        Example::
+
+            async with etoro.order_events(policy="conflate") as stream:
+                async for event in stream:
+                    print(event.order_id, event.status_id)
+
+        :param maxsize: Queue bound.
+        :param policy: Overflow policy (see :class:`EventStream`).
+        """
+
+        async def start() -> None:
+            self.on("order:update", put)
+            self.subscribe_to_private_events()
+
+        stream: EventStream[WsPrivateEvent] = EventStream(
+            maxsize,
+            policy,
+            key=lambda event: event.order_id,
+            start=start,
+            stop=lambda: self.off("order:update", put),
+            pause=self.ws.pause_reading,
+            resume=self.ws.resume_reading,
+        )
+        put = stream.sink()
+        return stream
+
     def subscribe_to_private_events(self) -> None:
         """Subscribe to private account events (order fills, cancellations, etc.)."""
         self.ws.subscribe(["private"])
 
+    def _ensure_private_subscription(self) -> None:
+        if not self.ws.is_subscribed("private"):
+            self.subscribe_to_private_events()
+
     def unsubscribe_from_private_events(self) -> None:
         """Unsubscribe from private account events."""
         self.ws.unsubscribe(["private"])
@@ -451,105 +898,64 @@ class EToroTrading:
         """Block until an order reaches a terminal state.
 
         Uses a hybrid approach: listens for WebSocket private events
-        and, after a 3-second grace period, starts polling the REST
-        ``GET /orders/{id}`` endpoint as a fallback.
+        and, after a 3-second grace period, polls the REST
+        ``GET /orders/{id}`` endpoint as a fallback.  All waits share one
+        :class:`OrderTracker`, so many concurrent calls cost one event
+        lookup per update and one backed-off polling loop.
 
         :param order_id: The order ID to monitor.
         :param timeout_s: Maximum wait time in seconds.
         :returns: The :class:`WsPrivateEvent` describing the terminal state.
         :raises EToroError: If the order fails, is cancelled, or times out.
         """
-        if not self.ws.is_connected:
+        if not self.ws.is_connected_for("private"):
             raise EToroError("WebSocket not connected -- call connect() before wait_for_order()")
 
-        self.subscribe_to_private_events()
-
-        event_future: asyncio.Future[WsPrivateEvent] = asyncio.get_event_loop().create_future()
-
-        def handler(event: WsPrivateEvent) -> None:
-            if event.order_id != order_id:
-                return
-            if event_future.done():
-                return
-
-            if event.status_id == OrderStatusId.EXECUTED:
-                event_future.set_result(event)
-            elif event.status_id in (OrderStatusId.FAILED, OrderStatusId.CANCELLED):
-                status_name = OrderStatusId(event.status_id).name
-                reason = event.error_message or event.close_reason or "unknown reason"
-                event_future.set_exception(
-                    EToroError(f"Order {order_id} {status_name}: {reason} (errorCode: {event.error_code or 'none'})")
-                )
-
-        self.on("order:update", handler)
-
-        poll_delay = min(3.0, timeout_s / 2)
-
-        async def _poll_fallback() -> None:
-            await asyncio.sleep(poll_delay)
-            if event_future.done():
-                return
-            try:
-                info = await self._poll_order_status(order_id, timeout_s - poll_delay)
-                if not event_future.done():
-                    event_future.set_result(
-                        WsPrivateEvent(
-                            OrderID=info.order_id,
-                            OrderType=info.order_type,
-                            StatusID=info.status_id,
-                            InstrumentID=info.instrument_id,
-                            CID=info.cid,
-                            RequestedUnits=info.units,
-                            ExecutedUnits=info.units,
-                            NetProfit=0,
-                            CloseReason="",
-                            OpenDateTime=info.request_occurred,
-                            RequestOccurred=info.request_occurred,
-                            PositionID=info.positions[0].position_id if info.positions else None,
-                            Amount=info.amount,
-                            ErrorCode=info.error_code,
-                            ErrorMessage=info.error_message,
-                        )
-                    )
-            except Exception:
-                pass  # WS might still deliver
-
-        poll_task = asyncio.create_task(_poll_fallback())
+        self._ensure_private_subscription()
+        return await self._orders.wait(order_id, timeout_s, grace=min(3.0, timeout_s / 2))
 
+    @property
+    def order_tracker(self) -> OrderTracker:
+        """The tracker behind :meth:`wait_for_order`."""
+        return self._orders
+
+    @property
+    def risk(self) -> RiskManager:
+        """Pre-trade risk checks applied to every order this client submits.
+
+        Limits come from the ``risk_*`` settings of :class:`EToroConfig` and
+        can be replaced at runtime (``etoro.risk.limits = RiskLimits(...)``);
+        add custom rules with :meth:`RiskManager.add_check`.
+        """
+        return self._risk
+
+    def _open_intent(
+        self, instrument_id: int, is_buy: bool, leverage: int, amount: float | None, units: float | None
+    ) -> OrderIntent:
+        if amount is not None:
+            notional: float | None = amount * leverage
+        else:
+            quote = self._quotes.peek(instrument_id)
+            notional = units * (quote.ask if is_buy else quote.bid) if quote is not None and units else None
+        return OrderIntent("open", instrument_id, notional, leverage, is_buy)
+
+    async def _checked(self, intent: OrderIntent, send: Callable[[], Awaitable[R]]) -> R:
+        risk = self._risk
+        if not risk.active:
+            return await send()
+        if intent.kind == "open" and risk.limits.needs_exposure:
+            risk.exposure.state = await self._synced_portfolio()
+        ticket = risk.check(intent)
+        if ticket is None:
+            return await send()
         try:
-            return await asyncio.wait_for(event_future, timeout=timeout_s)
-        except TimeoutError as exc:
-            raise EToroError(f"Timeout waiting for order {order_id} after {timeout_s}s") from exc
-        finally:
-            self.off("order:update", handler)
-            poll_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await poll_task
-
-    async def _poll_order_status(
-        self,
-        order_id: int,
-        timeout_s: float,
-        poll_interval_s: float = 0.5,
-    ) -> OrderForOpenInfoResponse:
-        elapsed = 0.0
-        while elapsed < timeout_s:
-            try:
-                info = await self.rest.info.get_order(order_id)
-                if info.status_id == OrderStatusId.EXECUTED:
-                    return info
-                if info.status_id in (OrderStatusId.CANCELLED, OrderStatusId.FAILED):
-                    status_name = OrderStatusId(info.status_id).name
-                    raise EToroError(f"Order {order_id} was {status_name}: {info.error_message or 'unknown reason'}")
-            except EToroError:
-                raise
-            except Exception:
-                pass  # 404 etc -- keep polling
-
-            await asyncio.sleep(poll_interval_s)
-            elapsed += poll_interval_s
-
-        raise EToroError(f"Timeout waiting for order {order_id} execution after {timeout_s}s")
+            response = await send()
+        except BaseException:
+            risk.exposure.release(ticket)
+            raise
+        order_id = response.order_for_open.order_id if isinstance(response, OrderForOpenResponse) else None
+        risk.exposure.settle(ticket, order_id)
+        return response
 
     async def resolve_instrument(self, symbol_or_id: str | int) -> int:
         """Resolve an instrument symbol to its numeric ID."""
@@ -581,3 +987,27 @@ class EToroTrading:
 
     async def __aexit__(self, *args: Any) -> None:
         await self.disconnect()
+
+
+def _market_order_request(
+    instrument_id: int, is_buy: bool, opts: OrderOptions, amount: float | None, units: float | None
+) -> MarketOrderByAmountRequest | MarketOrderByUnitsRequest:
+    if units is not None:
+        return MarketOrderByUnitsRequest(
+            InstrumentID=instrument_id,
+            IsBuy=is_buy,
+            Leverage=opts.leverage,
+            AmountInUnits=units,
+            StopLossRate=opts.stop_loss,
+            TakeProfitRate=opts.take_profit,
+            IsTslEnabled=opts.trailing_stop_loss,
+        )
+    return MarketOrderByAmountRequest(
+        InstrumentID=instrument_id,
+        IsBuy=is_buy,
+        Leverage=opts.leverage,
+        Amount=amount,
+        StopLossRate=opts.stop_loss,
+        TakeProfitRate=opts.take_profit,
+        IsTslEnabled=opts.trailing_stop_loss,
+    )
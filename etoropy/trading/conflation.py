@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+from .streams import StreamStats
+
+T = TypeVar("T")
+
+
+class TickConflator(Generic[T]):
+    """Coalesce updates per key and deliver only the latest at a fixed cadence.
+
+    The first update after a quiet period schedules a flush *interval*
+    seconds later; further updates for the same key until then replace the
+    pending one.  A flush calls *deliver* once per key that changed, in
+    order of first arrival, so handler work is bounded by the number of
+    instruments rather than the feed rate.  No timer runs while idle.
+
+    ``stats.dropped`` counts superseded updates and ``stats.high_water``
+    the most keys pending at a flush.
+
+    :param interval: Flush cadence in seconds.
+    :param deliver: Called as ``deliver(key, item)`` for each pending key.
+    """
+
+    def __init__(self, interval: float, deliver: Callable[[int, T], object]) -> None:
+        if interval <= 0:
+            raise ValueError("interval must be > 0")
+        self.interval = interval
+        self._deliver = deliver
+        self._pending: dict[int, T] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self.stats = StreamStats()
+
+    def put(self, key: int, item: T) -> None:
+        """Record *item* as the latest update for *key*."""
+        if key in self._pending:
+            self.stats.dropped += 1
+        self._pending[key] = item
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.interval, self.flush)
+
+    def flush(self) -> None:
+        """Deliver all pending updates now."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, {}
+        if len(pending) > self.stats.high_water:
+            self.stats.high_water = len(pending)
+        for key, item in pending.items():
+            self.stats.delivered += 1
+            self._deliver(key, item)
+
+    def discard(self, keys: list[int] | None = None) -> None:
+        """Drop pending updates -- all of them, or only for *keys*."""
+        if keys is None:
+            self._pending.clear()
+        else:
+            for key in keys:
+                self._pending.pop(key, None)
+        if not self._pending and self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
@@ -4,6 +4,7 @@ import importlib.resources
 from dataclasses import dataclass
 
 from ..errors.exceptions import EToroValidationError
+from ..http.singleflight import SingleFlight
 from ..models.market_data import InstrumentDisplayData
 from ..rest.market_data import MarketDataClient
 
@@ -49,7 +50,8 @@ class InstrumentResolver:
     3. **API text search** -- free-text fallback on the same endpoint.
 
     Every successful lookup is cached for the lifetime of the resolver, so
-    repeated calls for the same symbol are free.
+    repeated calls for the same symbol are free, and concurrent lookups of
+    the same uncached symbol share one API round-trip.
 
     Example::
 
@@ -66,6 +68,7 @@ class InstrumentResolver:
         self._symbol_to_id: dict[str, int] = {}
         self._id_to_symbol: dict[int, str] = {}
         self._id_to_info: dict[int, InstrumentInfo] = {}
+        self._lookups: SingleFlight[int] = SingleFlight()
 
     def register(self, symbol: str, instrument_id: int) -> None:
         """Manually register a symbol-to-ID mapping."""
@@ -129,6 +132,9 @@ class InstrumentResolver:
         if cached is not None:
             return cached
 
+        return await self._lookups.do(upper, lambda: self._lookup(symbol_or_id, upper))
+
+    async def _lookup(self, symbol: str, upper: str) -> int:
         result = await self._market_data.search_instruments(
             internal_symbol_full=upper,
             page_size=5,
@@ -142,13 +148,13 @@ class InstrumentResolver:
             return instrument_id
 
         text_result = await self._market_data.search_instruments(
-            search_text=symbol_or_id,
+            search_text=symbol,
             page_size=10,
         )
 
         valid_text = [item for item in text_result.items if item.instrument_id > 0]
         if not valid_text:
-            raise EToroValidationError(f"Instrument not found: {symbol_or_id}")
+            raise EToroValidationError(f"Instrument not found: {symbol}")
 
         instrument_id = valid_text[0].instrument_id
         self._symbol_to_id[upper] = instrument_id
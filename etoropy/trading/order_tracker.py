@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from ..errors.exceptions import EToroError
+from ..models.enums import OrderStatusId
+from ..models.trading import OrderForOpenInfoResponse
+from ..models.websocket import WsPrivateEvent
+
+logger = logging.getLogger("etoropy")
+
+_TERMINAL = (OrderStatusId.EXECUTED, OrderStatusId.FAILED, OrderStatusId.CANCELLED)
+# Terminal events kept for orders nobody was waiting on yet, so a wait that
+# starts after a fast fill still resolves without polling.
+_RECENT_TERMINAL = 1024
+
+
+@dataclass
+class OrderTrackerStats:
+    """Counters for one :class:`OrderTracker`.
+
+    :param events: Private events seen.
+    :param resolved_by_event: Waits resolved from the WebSocket stream.
+    :param resolved_by_poll: Waits resolved by the REST fallback.
+    :param polls: ``GET /orders/{id}`` calls made.
+    :param poll_errors: Polls that raised (the order keeps being polled).
+    """
+
+    events: int = 0
+    resolved_by_event: int = 0
+    resolved_by_poll: int = 0
+    polls: int = 0
+    poll_errors: int = 0
+
+
+class _Tracked:
+    __slots__ = ("future", "waiters", "next_poll", "interval")
+
+    def __init__(self, future: asyncio.Future[WsPrivateEvent], next_poll: float, interval: float) -> None:
+        self.future = future
+        self.waiters = 0
+        self.next_poll = next_poll
+        self.interval = interval
+
+
+class OrderTracker:
+    """Wait for many orders at once with one event handler and one poller.
+
+    Private events are dispatched to waiting orders with a dict lookup by
+    ``order_id``.  Orders still unresolved *grace* seconds after the wait
+    starts are polled over REST by a single shared loop: each poll doubles
+    that order's interval up to *max_poll_interval*, and at most
+    *max_polls_per_round* orders are polled per round, so fifty pending
+    orders cost a handful of requests per second rather than a hundred.
+
+    Concurrent waits on the same order share one future.
+
+    :param get_order: Coroutine function fetching one order's status
+        (e.g. ``rest.info.get_order``).
+    :param grace: Seconds to rely on the stream alone before polling.
+    :param poll_interval: First poll interval per order.
+    :param max_poll_interval: Cap on the per-order poll backoff.
+    :param max_polls_per_round: Orders polled concurrently per round.
+    """
+
+    def __init__(
+        self,
+        get_order: Callable[[int], Awaitable[OrderForOpenInfoResponse]],
+        *,
+        grace: float = 3.0,
+        poll_interval: float = 0.5,
+        max_poll_interval: float = 5.0,
+        max_polls_per_round: int = 5,
+    ) -> None:
+        self._get_order = get_order
+        self._grace = grace
+        self._poll_interval = poll_interval
+        self._max_poll_interval = max_poll_interval
+        self._max_polls_per_round = max_polls_per_round
+        self._tracked: dict[int, _Tracked] = {}
+        self._recent: dict[int, WsPrivateEvent] = {}
+        self._wakeup = asyncio.Event()
+        self._poll_task: asyncio.Task[None] | None = None
+        self.stats = OrderTrackerStats()
+
+    def __len__(self) -> int:
+        return len(self._tracked)
+
+    async def wait(self, order_id: int, timeout: float, grace: float | None = None) -> WsPrivateEvent:
+        """Wait until *order_id* reaches a terminal state.
+
+        :param grace: Override the tracker's *grace* for this order.
+        :returns: The event describing the executed order.
+        :raises EToroError: If the order fails, is cancelled, or *timeout*
+            expires.
+        """
+        tracked = self._tracked.get(order_id)
+        if tracked is None:
+            loop = asyncio.get_running_loop()
+            delay = self._grace if grace is None else grace
+            tracked = _Tracked(loop.create_future(), time.monotonic() + delay, self._poll_interval)
+            self._tracked[order_id] = tracked
+            recent = self._recent.pop(order_id, None)
+            if recent is not None:
+                self._resolve(order_id, recent)
+                self.stats.resolved_by_event += 1
+            else:
+                self._ensure_poller()
+        tracked.waiters += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(tracked.future), timeout)
+        except TimeoutError as exc:
+            raise EToroError(f"Timeout waiting for order {order_id} after {timeout}s") from exc
+        finally:
+            tracked.waiters -= 1
+            if not tracked.waiters and self._tracked.get(order_id) is tracked:
+                del self._tracked[order_id]
+
+    def on_event(self, event: WsPrivateEvent) -> None:
+        """Feed a private event; resolves the matching wait if terminal."""
+        self.stats.events += 1
+        if event.status_id not in _TERMINAL:
+            return
+        if event.order_id in self._tracked:
+            if self._resolve(event.order_id, event):
+                self.stats.resolved_by_event += 1
+        else:
+            self._recent[event.order_id] = event
+            if len(self._recent) > _RECENT_TERMINAL:
+                del self._recent[next(iter(self._recent))]
+
+    def _resolve(self, order_id: int, event: WsPrivateEvent) -> bool:
+        tracked = self._tracked.get(order_id)
+        if tracked is None or tracked.future.done():
+            return False
+        if event.status_id == OrderStatusId.EXECUTED:
+            tracked.future.set_result(event)
+        else:
+            status_name = OrderStatusId(event.status_id).name
+            reason = event.error_message or event.close_reason or "unknown reason"
+            tracked.future.set_exception(
+                EToroError(f"Order {order_id} {status_name}: {reason} (errorCode: {event.error_code or 'none'})")
+            )
+        return True
+
+    def _ensure_poller(self) -> None:
+        if self._poll_task is None or self._poll_task.done():
+            self._poll_task = asyncio.create_task(self._poll_loop())
+        self._wakeup.set()
+
+    async def _poll_loop(self) -> None:
+        while self._tracked:
+            now = time.monotonic()
+            due = sorted((t.next_poll, order_id) for order_id, t in self._tracked.items() if not t.future.done())
+            if not due:
+                await self._sleep(self._poll_interval)
+                continue
+            if due[0][0] > now:
+                await self._sleep(due[0][0] - now)
+                continue
+            batch = [order_id for next_poll, order_id in due[: self._max_polls_per_round] if next_poll <= now]
+            await asyncio.gather(*(self._poll(order_id) for order_id in batch))
+        self._poll_task = None
+
+    async def _sleep(self, delay: float) -> None:
+        self._wakeup.clear()
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._wakeup.wait(), delay)
+
+    async def _poll(self, order_id: int) -> None:
+        tracked = self._tracked.get(order_id)
+        if tracked is None:
+            return
+        self.stats.polls += 1
+        try:
+            info = await self._get_order(order_id)
+        except Exception as exc:
+            self.stats.poll_errors += 1
+            logger.debug("Polling order %d failed: %s", order_id, exc)  # 404 etc -- keep polling
+        else:
+            if info.status_id in _TERMINAL and self._resolve(order_id, _event_from_info(info)):
+                self.stats.resolved_by_poll += 1
+                return
+        tracked.next_poll = time.monotonic() + tracked.interval
+        tracked.interval = min(tracked.interval * 2, self._max_poll_interval)
+
+    async def stop(self) -> None:
+        """Cancel the poller and fail every outstanding wait."""
+        task, self._poll_task = self._poll_task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        for order_id, tracked in self._tracked.items():
+            if not tracked.future.done():
+                tracked.future.set_exception(EToroError(f"Stopped tracking order {order_id}"))
+
+
+def _event_from_info(info: OrderForOpenInfoResponse) -> WsPrivateEvent:
+    return WsPrivateEvent(
+        OrderID=info.order_id,
+        OrderType=info.order_type,
+        StatusID=info.status_id,
+        InstrumentID=info.instrument_id,
+        CID=info.cid,
+        RequestedUnits=info.units,
+        ExecutedUnits=info.units,
+        NetProfit=0,
+        CloseReason="",
+        OpenDateTime=info.request_occurred,
+        RequestOccurred=info.request_occurred,
+        PositionID=info.positions[0].position_id if info.positions else None,
+        Amount=info.amount,
+        ErrorCode=info.error_code,
+        ErrorMessage=info.error_message,
+    )
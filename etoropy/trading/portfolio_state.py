@@ -0,0 +1,332 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from ..models.enums import OrderStatusId, OrderType
+from ..models.trading import PendingOrder, PortfolioResponse, Position
+from ..models.websocket import WsPrivateEvent
+
+logger = logging.getLogger("etoropy")
+
+# Recently closed position IDs remembered so a replayed close event cannot
+# resurrect a position.
+_CLOSED_MEMORY = 10_000
+
+# Order types that become pending opens: limit orders (``orders``) and
+# market orders (``ordersForOpen``, type 17 on the API).  Events of any
+# other type -- close orders included -- never enter the pending lists.
+_MARKET_ORDER_FOR_OPEN = 17
+_OPEN_ORDER_TYPES = frozenset({OrderType.MARKET, OrderType.LIMIT, _MARKET_ORDER_FOR_OPEN})
+
+
+@dataclass
+class PortfolioStateStats:
+    """Counters for one :class:`PortfolioState`.
+
+    :param events: Private events applied.
+    :param syncs: REST snapshots loaded (seed plus reconciles).
+    :param drift: Positions and orders the last snapshot added or removed
+        compared with the event-driven state -- non-zero means events were
+        missed.
+    :param last_sync_at: ``time.monotonic()`` of the last snapshot.
+    """
+
+    events: int = 0
+    syncs: int = 0
+    drift: int = 0
+    last_sync_at: float = 0.0
+
+
+class PortfolioState:
+    """Local mirror of open positions and pending orders.
+
+    Seeded from one REST portfolio snapshot (:meth:`sync`), then kept
+    current by applying ``private`` :class:`WsPrivateEvent` updates
+    (:meth:`apply`): executed open orders add a position, executed close
+    orders remove it (or reduce it, for partial closes), and cancelled or
+    failed orders drop out of the pending lists.  Positions and orders are
+    indexed by ID and by instrument, so lookups do not touch the network.
+
+    Events that arrive while a snapshot is being fetched are applied
+    immediately and replayed on top of the snapshot, so none are lost to
+    the race.  :meth:`start` additionally re-syncs every
+    *reconcile_interval* seconds to repair anything the stream missed;
+    :attr:`stats` reports how much the snapshots corrected.
+
+    :param fetch: Coroutine function returning a fresh
+        :class:`PortfolioResponse` (e.g. ``rest.info.get_portfolio``).
+    :param reconcile_interval: Seconds between background re-syncs
+        (0 = never).
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], Awaitable[PortfolioResponse]],
+        reconcile_interval: float = 60.0,
+    ) -> None:
+        self._fetch = fetch
+        self._reconcile_interval = reconcile_interval
+        self._positions: dict[int, Position] = {}
+        self._mirror_positions: dict[int, Position] = {}
+        self._limit_orders: dict[int, PendingOrder] = {}
+        self._market_orders: dict[int, PendingOrder] = {}
+        self._positions_by_instrument: dict[int, set[int]] = {}
+        self._orders_by_instrument: dict[int, set[int]] = {}
+        self._closed: dict[int, None] = {}
+        self._seeded = False
+        self._syncing: list[WsPrivateEvent] | None = None
+        self._sync_lock = asyncio.Lock()
+        self._reconcile_task: asyncio.Task[None] | None = None
+        self.stats = PortfolioStateStats()
+
+    @property
+    def is_seeded(self) -> bool:
+        """Whether a snapshot has been loaded since the last :meth:`invalidate`."""
+        return self._seeded
+
+    def invalidate(self) -> None:
+        """Mark the mirror stale (e.g. after a WebSocket reconnect lost events).
+
+        The next user should call :meth:`sync` before trusting it.
+        """
+        self._seeded = False
+
+    async def ensure_synced(self) -> None:
+        """:meth:`sync` unless the mirror is already seeded."""
+        if self._seeded:
+            return
+        async with self._sync_lock:
+            if not self._seeded:
+                await self._sync()
+
+    async def sync(self) -> None:
+        """Fetch a REST snapshot and rebuild the mirror from it."""
+        async with self._sync_lock:
+            await self._sync()
+
+    async def _sync(self) -> None:
+        self._syncing = []
+        try:
+            portfolio = await self._fetch()
+            seeded, before = self._seeded, self._keys()
+            self.load(portfolio)
+            # Opens and full closes replay idempotently; a partial close the
+            # snapshot already reflects is deducted twice until the next sync.
+            for event in self._syncing:
+                self._apply(event)
+            if seeded:
+                self.stats.drift = len(before ^ self._keys())
+                if self.stats.drift:
+                    logger.info("Portfolio reconcile corrected %d positions/orders", self.stats.drift)
+        finally:
+            self._syncing = None
+
+    def load(self, portfolio: PortfolioResponse) -> None:
+        """Replace the mirror with *portfolio*."""
+        client = portfolio.client_portfolio
+        self._positions = {p.position_id: p for p in client.positions}
+        self._mirror_positions = {p.position_id: p for m in client.mirrors for p in m.positions}
+        self._limit_orders = {o.order_id: o for o in client.orders}
+        self._market_orders = {o.order_id: o for o in client.orders_for_open}
+        self._positions_by_instrument = {}
+        for position in self._positions.values():
+            self._positions_by_instrument.setdefault(position.instrument_id, set()).add(position.position_id)
+        self._orders_by_instrument = {}
+        for order in self._all_orders().values():
+            self._orders_by_instrument.setdefault(order.instrument_id, set()).add(order.order_id)
+        self._seeded = True
+        self.stats.syncs += 1
+        self.stats.last_sync_at = time.monotonic()
+
+    def apply(self, event: WsPrivateEvent) -> None:
+        """Apply one private order event."""
+        if self._syncing is not None:
+            self._syncing.append(event)
+        self._apply(event)
+
+    def _apply(self, event: WsPrivateEvent) -> None:
+        self.stats.events += 1
+        status = event.status_id
+        if status in (OrderStatusId.CANCELLED, OrderStatusId.FAILED):
+            self._remove_order(event.order_id)
+        elif status == OrderStatusId.EXECUTED:
+            order = self._remove_order(event.order_id)
+            if event.position_id is not None:
+                self._apply_execution(event, order)
+        elif self._is_new_open_order(event):
+            self._add_order(event)
+
+    def _is_new_open_order(self, event: WsPrivateEvent) -> bool:
+        if event.order_type not in _OPEN_ORDER_TYPES or event.close_reason:
+            return False
+        if event.order_id in self._limit_orders or event.order_id in self._market_orders:
+            return False
+        # An order against a position we hold is closing it, not opening one.
+        position_id = event.position_id
+        return position_id is None or (position_id not in self._positions and position_id not in self._mirror_positions)
+
+    def _apply_execution(self, event: WsPrivateEvent, order: PendingOrder | None) -> None:
+        position_id = event.position_id
+        assert position_id is not None
+        position = self._positions.get(position_id)
+        if position is None:
+            mirrored = self._mirror_positions.get(position_id)
+            if mirrored is not None:
+                if event.order_id != mirrored.order_id:
+                    self._close_units(self._mirror_positions, mirrored, event.executed_units)
+                return
+            if position_id in self._closed or event.close_reason:
+                return
+            self._add_position(event, order)
+        elif event.order_id != position.order_id:
+            # A different order executing against a known position closes it.
+            self._close_units(self._positions, position, event.executed_units)
+
+    def _close_units(self, positions: dict[int, Position], position: Position, units: float) -> None:
+        if 0 < units < position.units:
+            ratio = (position.units - units) / position.units
+            positions[position.position_id] = position.model_copy(
+                update={"units": position.units - units, "amount": position.amount * ratio}
+            )
+        elif positions is self._positions:
+            self._remove_position(position)
+        else:
+            del positions[position.position_id]
+            self._remember_closed(position.position_id)
+
+    def _add_position(self, event: WsPrivateEvent, order: PendingOrder | None) -> None:
+        assert event.position_id is not None
+        position = Position.model_validate(
+            {
+                "positionID": event.position_id,
+                "CID": event.cid,
+                "openDateTime": event.open_date_time,
+                "openRate": event.rate or (order.rate if order else 0.0),
+                "instrumentID": event.instrument_id,
+                "isBuy": event.is_buy if event.is_buy is not None else (order.is_buy if order else True),
+                "leverage": event.leverage or (order.leverage if order else 1),
+                "takeProfitRate": order.take_profit_rate if order else 0.0,
+                "stopLossRate": order.stop_loss_rate if order else 0.0,
+                "amount": event.amount or (order.amount if order else 0.0),
+                "orderID": event.order_id,
+                "orderType": event.order_type,
+                "units": event.executed_units or event.requested_units,
+            }
+        )
+        self._positions[position.position_id] = position
+        self._positions_by_instrument.setdefault(position.instrument_id, set()).add(position.position_id)
+
+    def _remove_position(self, position: Position) -> None:
+        del self._positions[position.position_id]
+        ids = self._positions_by_instrument.get(position.instrument_id)
+        if ids is not None:
+            ids.discard(position.position_id)
+        self._remember_closed(position.position_id)
+
+    def _remember_closed(self, position_id: int) -> None:
+        self._closed[position_id] = None
+        if len(self._closed) > _CLOSED_MEMORY:
+            del self._closed[next(iter(self._closed))]
+
+    def _add_order(self, event: WsPrivateEvent) -> None:
+        order = PendingOrder.model_validate(
+            {
+                "orderID": event.order_id,
+                "CID": event.cid,
+                "openDateTime": event.request_occurred or event.open_date_time,
+                "instrumentID": event.instrument_id,
+                "isBuy": event.is_buy if event.is_buy is not None else True,
+                "takeProfitRate": 0.0,
+                "stopLossRate": 0.0,
+                "rate": event.rate or 0.0,
+                "amount": event.amount or 0.0,
+                "leverage": event.leverage or 1,
+                "units": event.requested_units,
+            }
+        )
+        orders = self._limit_orders if event.order_type == OrderType.LIMIT else self._market_orders
+        orders[order.order_id] = order
+        self._orders_by_instrument.setdefault(order.instrument_id, set()).add(order.order_id)
+
+    def _remove_order(self, order_id: int) -> PendingOrder | None:
+        order = self._limit_orders.pop(order_id, None) or self._market_orders.pop(order_id, None)
+        if order is not None:
+            ids = self._orders_by_instrument.get(order.instrument_id)
+            if ids is not None:
+                ids.discard(order_id)
+        return order
+
+    def _all_orders(self) -> dict[int, PendingOrder]:
+        return {**self._limit_orders, **self._market_orders}
+
+    def _keys(self) -> set[tuple[str, int]]:
+        return {("position", id_) for id_ in self._positions} | {("order", id_) for id_ in self._all_orders()}
+
+    def position(self, position_id: int) -> Position | None:
+        """Look up an open position, including positions held through copy-trading mirrors."""
+        return self._positions.get(position_id) or self._mirror_positions.get(position_id)
+
+    def positions(self, instrument_id: int | None = None) -> list[Position]:
+        """Open positions (excluding mirrors), optionally for one instrument."""
+        if instrument_id is None:
+            return list(self._positions.values())
+        return [self._positions[id_] for id_ in self._positions_by_instrument.get(instrument_id, ())]
+
+    @property
+    def position_count(self) -> int:
+        """Number of open positions (excluding mirrors)."""
+        return len(self._positions)
+
+    @property
+    def market_order_count(self) -> int:
+        """Number of pending market orders."""
+        return len(self._market_orders)
+
+    def mirror_positions(self) -> list[Position]:
+        """Positions held through copy-trading mirrors (snapshot only)."""
+        return list(self._mirror_positions.values())
+
+    def order(self, order_id: int) -> PendingOrder | None:
+        """Look up a pending limit or market order."""
+        return self._limit_orders.get(order_id) or self._market_orders.get(order_id)
+
+    def limit_orders(self) -> list[PendingOrder]:
+        return list(self._limit_orders.values())
+
+    def market_orders(self) -> list[PendingOrder]:
+        """Pending market orders (``ordersForOpen``)."""
+        return list(self._market_orders.values())
+
+    def pending_orders(self, instrument_id: int | None = None) -> list[PendingOrder]:
+        """Limit orders followed by market orders, optionally for one instrument."""
+        orders = [*self._limit_orders.values(), *self._market_orders.values()]
+        if instrument_id is None:
+            return orders
+        ids = self._orders_by_instrument.get(instrument_id, set())
+        return [o for o in orders if o.order_id in ids]
+
+    def start(self) -> None:
+        """Start the background reconcile loop (no-op if disabled or running)."""
+        if self._reconcile_interval > 0 and (self._reconcile_task is None or self._reconcile_task.done()):
+            self._reconcile_task = asyncio.create_task(self._reconcile_loop())
+
+    async def stop(self) -> None:
+        """Stop the background reconcile loop."""
+        task, self._reconcile_task = self._reconcile_task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _reconcile_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._reconcile_interval)
+            try:
+                await self.sync()
+            except Exception as exc:
+                logger.warning("Portfolio reconcile failed: %s", exc)
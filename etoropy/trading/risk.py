@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import itertools
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Literal, NoReturn
+
+from ..errors.exceptions import EToroRiskError
+from ..models.enums import OrderType
+from ..models.websocket import WsPrivateEvent
+from .portfolio_state import PortfolioState
+
+# Order IDs of recent private events, so an order whose events beat its REST
+# response is not left reserved forever.
+_RECENT_EVENTS = 1024
+
+# Seconds an accepted order without an order ID (limit orders) stays
+# reserved if no matching event arrives; by then a portfolio reconcile has
+# picked it up.
+_UNMATCHED_TTL = 60.0
+
+
+@dataclass
+class RiskLimits:
+    """Pre-trade limits checked by :class:`RiskManager` (``None`` = no limit).
+
+    :param max_notional_per_instrument: Cap on gross exposure per
+        instrument -- open positions, pending orders and orders in flight,
+        each counted as ``amount * leverage`` (``units * price`` for orders
+        sized in units).
+    :param max_open_positions: Cap on open positions plus pending market
+        orders and opens in flight (copied positions excluded).
+    :param max_orders_per_second: Cap on new orders in any one-second
+        window.  Closes and cancels reduce risk and are never throttled.
+    :param max_leverage: Highest leverage allowed on a new order.
+    :param leverage_caps: Per-instrument leverage caps overriding
+        *max_leverage*.
+    """
+
+    max_notional_per_instrument: float | None = None
+    max_open_positions: int | None = None
+    max_orders_per_second: float | None = None
+    max_leverage: int | None = None
+    leverage_caps: dict[int, int] = field(default_factory=dict)
+
+    @property
+    def needs_exposure(self) -> bool:
+        return self.max_notional_per_instrument is not None or self.max_open_positions is not None
+
+
+@dataclass(frozen=True, slots=True)
+class OrderIntent:
+    """An order about to be submitted, as seen by the risk checks.
+
+    :param kind: ``"open"``, ``"close"`` or ``"cancel"``.
+    :param instrument_id: Instrument traded (``None`` for cancels by order ID).
+    :param notional: Gross exposure the order adds, or ``None`` when it
+        cannot be priced.
+    :param leverage: Requested leverage.
+    :param is_buy: Direction of the order.
+    """
+
+    kind: Literal["open", "close", "cancel"]
+    instrument_id: int | None = None
+    notional: float | None = 0.0
+    leverage: int = 1
+    is_buy: bool = True
+
+
+@dataclass
+class RiskStats:
+    """Counters for one :class:`RiskManager`.
+
+    :param checked: Orders checked.
+    :param rejected: Orders rejected, by rule name.
+    """
+
+    checked: int = 0
+    rejected: dict[str, int] = field(default_factory=dict)
+
+
+class ExposureIndex:
+    """Gross exposure per instrument, without network calls.
+
+    Filled positions and pending orders are read from the
+    :class:`PortfolioState` mirror (itself kept current from ``private``
+    order events); orders submitted but not yet seen on the stream are
+    tracked here as reservations, so a burst of submissions counts
+    against the limits before any of them fills.
+    """
+
+    def __init__(self) -> None:
+        self.state: PortfolioState | None = None
+        self._reservations: dict[int, tuple[int, float]] = {}
+        self._by_order: dict[int, int] = {}
+        self._recent: dict[int, None] = {}
+        self._unmatched: dict[int, deque[tuple[int, float]]] = {}
+        self._tickets = itertools.count(1)
+
+    @property
+    def available(self) -> bool:
+        """Whether a seeded portfolio mirror backs the index."""
+        return self.state is not None and self.state.is_seeded
+
+    def notional(self, instrument_id: int) -> float:
+        """Gross notional of positions, pending orders and in-flight orders on *instrument_id*."""
+        self._expire()
+        total = sum(notional for iid, notional in self._reservations.values() if iid == instrument_id)
+        if self.state is not None:
+            total += sum(p.amount * p.leverage for p in self.state.positions(instrument_id))
+            total += sum(o.amount * o.leverage for o in self.state.pending_orders(instrument_id))
+        return total
+
+    def open_positions(self) -> int:
+        """Open positions plus pending market orders and opens in flight."""
+        self._expire()
+        count = len(self._reservations)
+        if self.state is not None:
+            count += self.state.position_count + self.state.market_order_count
+        return count
+
+    def reserve(self, instrument_id: int, notional: float) -> int:
+        """Count an order being submitted; returns a ticket for :meth:`settle` / :meth:`release`."""
+        ticket = next(self._tickets)
+        self._reservations[ticket] = (instrument_id, notional)
+        return ticket
+
+    def settle(self, ticket: int, order_id: int | None) -> None:
+        """The order was accepted as *order_id*; keep it reserved until its first event.
+
+        Without an order ID (limit orders return only a token) the
+        reservation is released by the next event for a new limit order on
+        the same instrument, or after a minute if none arrives.
+        """
+        reservation = self._reservations.get(ticket)
+        if reservation is None:
+            return
+        if order_id is None:
+            deadline = time.monotonic() + _UNMATCHED_TTL
+            self._unmatched.setdefault(reservation[0], deque()).append((ticket, deadline))
+        elif order_id in self._recent:
+            self.release(ticket)
+        else:
+            self._by_order[order_id] = ticket
+
+    def release(self, ticket: int) -> None:
+        self._reservations.pop(ticket, None)
+
+    def _expire(self) -> None:
+        if not self._unmatched:
+            return
+        now = time.monotonic()
+        for instrument_id, unmatched in list(self._unmatched.items()):
+            while unmatched and unmatched[0][1] <= now:
+                self.release(unmatched.popleft()[0])
+            if not unmatched:
+                del self._unmatched[instrument_id]
+
+    def on_event(self, event: WsPrivateEvent) -> None:
+        """Release the reservation of the order *event* is about -- the mirror now reflects it."""
+        ticket = self._by_order.pop(event.order_id, None)
+        if ticket is not None:
+            self.release(ticket)
+        elif event.order_type == OrderType.LIMIT and event.order_id not in self._recent:
+            unmatched = self._unmatched.get(event.instrument_id)
+            if unmatched:
+                self.release(unmatched.popleft()[0])
+        self._recent[event.order_id] = None
+        if len(self._recent) > _RECENT_EVENTS:
+            del self._recent[next(iter(self._recent))]
+
+
+RiskCheck = Callable[[OrderIntent, ExposureIndex], None]
+
+
+class RiskManager:
+    """Pre-trade risk layer evaluated on every order submission.
+
+    Checks run synchronously against :class:`RiskLimits` and the
+    in-memory :class:`ExposureIndex`, so they cost microseconds and no
+    requests.  A breached limit raises :class:`EToroRiskError` before
+    anything is sent.  Additional rules can be plugged in with
+    :meth:`add_check`.
+
+    The built-in limits apply to opens only: closes and cancels reduce
+    risk, so an emergency ``close_all_positions()`` is never throttled or
+    rejected by them (custom checks still see every intent).
+
+    Notional and position limits need the portfolio mirror (a connected
+    WebSocket with :attr:`EToroConfig.portfolio_mirror`); without it,
+    opens are rejected rather than checked against unknown exposure.
+
+    :param limits: The limits to enforce.
+    """
+
+    def __init__(self, limits: RiskLimits | None = None) -> None:
+        self.limits = limits or RiskLimits()
+        self.exposure = ExposureIndex()
+        self.stats = RiskStats()
+        self._checks: list[RiskCheck] = []
+        self._submitted: deque[float] = deque()
+
+    @property
+    def active(self) -> bool:
+        """Whether any limit or custom check is configured."""
+        limits = self.limits
+        return bool(
+            self._checks
+            or limits.needs_exposure
+            or limits.max_orders_per_second is not None
+            or limits.max_leverage is not None
+            or limits.leverage_caps
+        )
+
+    def add_check(self, check: RiskCheck) -> None:
+        """Run *check* on every order after the built-in limits; it raises
+        :class:`EToroRiskError` to reject the order."""
+        self._checks.append(check)
+
+    def check(self, intent: OrderIntent) -> int | None:
+        """Check *intent* and count it as submitted.
+
+        :returns: An exposure ticket for opens -- pass it to
+            :meth:`ExposureIndex.settle` or :meth:`ExposureIndex.release`
+            once the submission completes.
+        :raises EToroRiskError: If a limit would be breached.
+        """
+        self.stats.checked += 1
+        limits = self.limits
+        opening = intent.kind == "open"
+        now = time.monotonic()
+        if opening and limits.max_orders_per_second is not None:
+            submitted = self._submitted
+            while submitted and now - submitted[0] >= 1.0:
+                submitted.popleft()
+            if len(submitted) >= limits.max_orders_per_second:
+                self._reject("max_orders_per_second", f"more than {limits.max_orders_per_second:g} orders/s")
+        if opening and intent.instrument_id is not None:
+            self._check_open(intent, intent.instrument_id)
+        for check in self._checks:
+            try:
+                check(intent, self.exposure)
+            except EToroRiskError as exc:
+                self.stats.rejected[exc.rule] = self.stats.rejected.get(exc.rule, 0) + 1
+                raise
+        if not opening:
+            return None
+        if limits.max_orders_per_second is not None:
+            self._submitted.append(now)
+        if intent.instrument_id is not None:
+            return self.exposure.reserve(intent.instrument_id, intent.notional or 0.0)
+        return None
+
+    def _check_open(self, intent: OrderIntent, instrument_id: int) -> None:
+        limits = self.limits
+        cap = limits.leverage_caps.get(instrument_id, limits.max_leverage)
+        if cap is not None and intent.leverage > cap:
+            self._reject("max_leverage", f"leverage {intent.leverage} exceeds cap {cap} on instrument {instrument_id}")
+        if not limits.needs_exposure:
+            return
+        exposure = self.exposure
+        if not exposure.available:
+            self._reject("exposure_unknown", "exposure limits need portfolio_mirror=True and a connected WebSocket")
+        if limits.max_open_positions is not None and exposure.open_positions() >= limits.max_open_positions:
+            self._reject("max_open_positions", f"{limits.max_open_positions} positions already open or pending")
+        max_notional = limits.max_notional_per_instrument
+        if max_notional is not None:
+            if intent.notional is None:
+                self._reject(
+                    "max_notional_per_instrument", f"no price to value the order on instrument {instrument_id}"
+                )
+            total = exposure.notional(instrument_id) + intent.notional
+            if total > max_notional:
+                self._reject(
+                    "max_notional_per_instrument",
+                    f"notional {total:,.2f} on instrument {instrument_id} exceeds {max_notional:,.2f}",
+                )
+
+    def _reject(self, rule: str, reason: str) -> NoReturn:
+        self.stats.rejected[rule] = self.stats.rejected.get(rule, 0) + 1
+        raise EToroRiskError(f"Order rejected by risk check: {reason}", rule=rule)
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import asyncio
+import weakref
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Generic, Literal, TypeVar
+
+from ..models.websocket import WsInstrumentRate, WsRateTick
+
+T = TypeVar("T")
+
+OverflowPolicy = Literal["drop_oldest", "conflate", "block"]
+
+DEFAULT_STREAM_MAXSIZE = 1024
+
+
+@dataclass(slots=True)
+class PriceTick:
+    """One price update yielded by :meth:`EToroTrading.prices`."""
+
+    symbol: str
+    instrument_id: int
+    rate: WsInstrumentRate | WsRateTick
+
+
+@dataclass
+class StreamStats:
+    """Counters for one :class:`EventStream`.
+
+    :param delivered: Items handed to the consumer.
+    :param dropped: Items discarded because the queue was full
+        (``"drop_oldest"``) or superseded by a newer item for the same key
+        (``"conflate"``).
+    :param pauses: Times socket reads were paused because the consumer
+        fell behind (``"block"``).
+    :param high_water: Largest queue length observed.
+    """
+
+    delivered: int = 0
+    dropped: int = 0
+    pauses: int = 0
+    high_water: int = 0
+
+
+class EventStream(Generic[T]):
+    """Bounded async iterator fed synchronously by an event handler.
+
+    The producer side (:meth:`put`) never awaits, so it can be called from
+    the WebSocket receive loop; what happens when the consumer falls behind
+    is set by *policy*:
+
+    - ``"drop_oldest"`` -- discard the oldest queued item.
+    - ``"conflate"`` -- keep only the newest item per ``key(item)``; an
+      update for a queued key replaces it in place.  If more than *maxsize*
+      distinct keys are pending, the oldest is dropped.
+    - ``"block"`` -- nothing is dropped; once *maxsize* items are queued,
+      *pause* is called (:meth:`WsClient.pause_reading`) and *resume* once
+      the consumer has drained half of the queue.  While paused, nothing
+      else on the connection is read either, so consume a ``"block"``
+      stream promptly and close it with ``async with``.
+
+    Iteration starts the stream (runs *start* once) and ends after
+    :meth:`aclose`.  A stream dropped without being closed runs the same
+    cleanup (*resume*, *stop*) when it is garbage-collected, provided the
+    producer holds it only through :meth:`sink`.
+
+    :param maxsize: Queue bound.
+    :param policy: Overflow policy.
+    :param key: Conflation key (required for ``"conflate"``).
+    :param start: Coroutine run before the first item is awaited, e.g. to
+        subscribe to topics.
+    :param stop: Called once on :meth:`aclose`, e.g. to remove listeners.
+    :param pause: Called when a ``"block"`` stream fills up.
+    :param resume: Called when a paused ``"block"`` stream has drained.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_STREAM_MAXSIZE,
+        policy: OverflowPolicy = "drop_oldest",
+        *,
+        key: Callable[[T], Hashable] | None = None,
+        start: Callable[[], Awaitable[None]] | None = None,
+        stop: Callable[[], object] | None = None,
+        pause: Callable[[], None] | None = None,
+        resume: Callable[[], None] | None = None,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        if policy not in ("drop_oldest", "conflate", "block"):
+            raise ValueError(f"Unknown overflow policy: {policy!r}")
+        if policy == "conflate" and key is None:
+            raise ValueError("policy 'conflate' requires a key function")
+        self._maxsize = maxsize
+        self._policy = policy
+        self._key = key
+        self._start = start
+        self._stop = stop
+        self._pause = pause
+        self._resume = resume
+        self._queue: deque[T] = deque()
+        self._latest: dict[Hashable, T] = {}
+        self._waiter: asyncio.Future[None] | None = None
+        self._started = False
+        self._closed = False
+        self._paused = False
+        self.stats = StreamStats()
+
+    def put(self, item: T) -> None:
+        """Enqueue *item* according to the overflow policy (never blocks)."""
+        if self._closed:
+            return
+        if self._policy == "conflate":
+            assert self._key is not None
+            key = self._key(item)
+            if key in self._latest:
+                self.stats.dropped += 1
+            elif len(self._latest) >= self._maxsize:
+                del self._latest[next(iter(self._latest))]
+                self.stats.dropped += 1
+            self._latest[key] = item
+            size = len(self._latest)
+        else:
+            if self._policy == "drop_oldest" and len(self._queue) >= self._maxsize:
+                self._queue.popleft()
+                self.stats.dropped += 1
+            self._queue.append(item)
+            size = len(self._queue)
+            if self._policy == "block" and size >= self._maxsize and not self._paused:
+                self._paused = True
+                self.stats.pauses += 1
+                if self._pause is not None:
+                    self._pause()
+        if size > self.stats.high_water:
+            self.stats.high_water = size
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def sink(self) -> Callable[[T], None]:
+        """Return a :meth:`put` callback that does not keep the stream alive.
+
+        Register this with the event source instead of ``stream.put`` so an
+        abandoned stream can be garbage-collected (and its socket pause
+        lifted) while the listener is still attached.
+        """
+        ref = weakref.ref(self)
+
+        def put(item: T) -> None:
+            stream = ref()
+            if stream is not None:
+                stream.put(item)
+
+        return put
+
+    def __len__(self) -> int:
+        return len(self._latest) if self._policy == "conflate" else len(self._queue)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def __aiter__(self) -> EventStream[T]:
+        return self
+
+    async def __anext__(self) -> T:
+        if not self._started:
+            self._started = True
+            if self._start is not None:
+                await self._start()
+        while not len(self):
+            if self._closed:
+                raise StopAsyncIteration
+            self._waiter = asyncio.get_running_loop().create_future()
+            await self._waiter
+        item = self._pop()
+        self.stats.delivered += 1
+        if self._paused and len(self._queue) <= self._maxsize // 2:
+            self._unpause()
+        return item
+
+    def _pop(self) -> T:
+        if self._policy == "conflate":
+            key = next(iter(self._latest))
+            return self._latest.pop(key)
+        return self._queue.popleft()
+
+    def _unpause(self) -> None:
+        self._paused = False
+        if self._resume is not None:
+            self._resume()
+
+    async def aclose(self) -> None:
+        """Stop the stream: detach from the source and end iteration.
+
+        Items still queued are discarded.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.clear()
+        self._latest.clear()
+        if self._paused:
+            self._unpause()
+        if self._stop is not None:
+            self._stop()
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def __del__(self) -> None:
+        if not getattr(self, "_closed", True):  # __init__ may have raised
+            self._closed = True
+            if self._paused:
+                self._unpause()
+            if self._stop is not None:
+                self._stop()
+
+    async def __aenter__(self) -> EventStream[T]:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.aclose()
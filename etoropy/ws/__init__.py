@@ -1,11 +1,22 @@
-from .client import WsClient, WsClientOptions
+from .client import SubscribeResult, WsClient, WsClientOptions
 from .message_parser import ParsedMessage, parse_envelope, parse_messages
+from .pool import WsClientPool
+from .quote_book import Quote, QuoteBook
+from .simulator import FeedSimulator
 from .subscription import WsSubscriptionTracker
+from .tick_buffer import TickBatch, TickBuffer
 
 __all__ = [
+    "FeedSimulator",
     "ParsedMessage",
+    "Quote",
+    "QuoteBook",
+    "SubscribeResult",
+    "TickBatch",
+    "TickBuffer",
     "WsClient",
     "WsClientOptions",
+    "WsClientPool",
     "WsSubscriptionTracker",
     "parse_envelope",
     "parse_messages",
@@ -2,81 +2,204 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import json
 import logging
-from collections.abc import Callable
-from dataclasses import dataclass
+import random
+import time
+from dataclasses import dataclass, field
 from typing import Any
 
 import websockets
 import websockets.asyncio.client
 
+from .. import _json
+from .._events import EventEmitter, LatencyHistogram
 from .._utils import generate_uuid
 from ..config.constants import (
+    DEFAULT_HANDLER_BACKLOG,
+    DEFAULT_HANDLER_CONCURRENCY,
+    DEFAULT_WS_ACK_RETRIES,
+    DEFAULT_WS_ACK_TIMEOUT,
     DEFAULT_WS_AUTH_TIMEOUT,
     DEFAULT_WS_HEARTBEAT_INTERVAL,
     DEFAULT_WS_HEARTBEAT_TIMEOUT,
+    DEFAULT_WS_MAX_FRAME_BYTES,
     DEFAULT_WS_RECONNECT_ATTEMPTS,
     DEFAULT_WS_RECONNECT_DELAY,
+    DEFAULT_WS_RECONNECT_MAX_DELAY,
+    DEFAULT_WS_SUBSCRIBE_BATCH,
     DEFAULT_WS_URL,
 )
 from ..errors.exceptions import EToroAuthError, EToroWebSocketError
-from ..models.websocket import WsEnvelope
-from .message_parser import ParsedInstrumentRate, ParsedPrivateEvent, parse_messages
+from ..models.websocket import WsEnvelope, WsPrivateEvent
+from .message_parser import rate_from_content
+from .quote_book import QuoteBook
 from .subscription import WsSubscriptionTracker
+from .tick_buffer import TickBuffer
 
 logger = logging.getLogger("etoropy")
 
+# Bytes of a Subscribe frame besides its topics: id, operation, snapshot flag.
+_FRAME_OVERHEAD = 128
+
 
 @dataclass
 class WsClientOptions:
-    """Connection options for :class:`WsClient`."""
+    """Connection options for :class:`WsClient`.
+
+    :param lightweight_ticks: Emit ``"instrument:rate"`` payloads as slotted
+        :class:`WsRateTick` objects instead of validated
+        :class:`WsInstrumentRate` models.
+    :param tick_buffer: Also write every rate tick into this columnar
+        :class:`TickBuffer` for batched consumption.
+    :param quote_book: Also record every rate tick's bid/ask in this
+        :class:`QuoteBook` (no rate models are built for it).
+    :param max_concurrent_handlers: Upper bound on async event handlers
+        running at once.
+    :param max_pending_handlers: Upper bound on async event handler calls
+        waiting for a slot.
+    :param reconnect_max_delay: Cap on the exponential reconnect backoff.
+    """
 
     api_key: str = ""
     user_key: str = ""
     ws_url: str = DEFAULT_WS_URL
     reconnect_attempts: int = DEFAULT_WS_RECONNECT_ATTEMPTS
     reconnect_delay: float = DEFAULT_WS_RECONNECT_DELAY
+    reconnect_max_delay: float = DEFAULT_WS_RECONNECT_MAX_DELAY
     auth_timeout: float = DEFAULT_WS_AUTH_TIMEOUT
     heartbeat_interval: float = DEFAULT_WS_HEARTBEAT_INTERVAL
     heartbeat_timeout: float = DEFAULT_WS_HEARTBEAT_TIMEOUT
+    lightweight_ticks: bool = False
+    tick_buffer: TickBuffer | None = None
+    quote_book: QuoteBook | None = None
+    max_concurrent_handlers: int = DEFAULT_HANDLER_CONCURRENCY
+    max_pending_handlers: int = DEFAULT_HANDLER_BACKLOG
+
 
+@dataclass
+class ReconnectStats:
+    """Reconnect and stream-continuity counters for one :class:`WsClient`.
+
+    :param reconnects: Successful reconnects.
+    :param failed_attempts: Reconnect attempts that failed.
+    :param out_of_order: Rate ticks dropped because their ``PriceRateID``
+        (or ``Date``) went backwards for the instrument.
+    :param last_downtime_s: Close to re-authenticated, for the last reconnect.
+    :param last_outage_s: Close to first rate tick, for the last reconnect.
+    :param first_tick_latency: Re-subscribed to first rate tick.
+    """
 
-EventHandler = Callable[..., Any]
+    reconnects: int = 0
+    failed_attempts: int = 0
+    out_of_order: int = 0
+    last_downtime_s: float = 0.0
+    last_outage_s: float = 0.0
+    first_tick_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+
+@dataclass
+class SubscribeResult:
+    """Outcome of :meth:`WsClient.subscribe_many` / :meth:`WsClient.unsubscribe_many`.
+
+    :param acked: Topics the server acknowledged.
+    :param failed: Topics whose frame was rejected or never acknowledged,
+        mapped to the last error.
+    :param latency: Seconds from the call to the acknowledgement of the
+        frame carrying each topic, retries included.
+    :param frames: Frames sent, retries included.
+    :param retries: Frames re-sent after a failure.
+    """
 
+    acked: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+    latency: dict[str, float] = field(default_factory=dict)
+    frames: int = 0
+    retries: int = 0
 
-class WsClient:
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+    def merge(self, other: SubscribeResult) -> None:
+        self.acked.extend(other.acked)
+        self.failed.update(other.failed)
+        self.latency.update(other.latency)
+        self.frames += other.frames
+        self.retries += other.retries
+
+
+def _chunk_topics(topics: list[str], max_topics: int, max_bytes: int) -> list[list[str]]:
+    # Greedy packing: fill each frame up to max_topics or max_bytes,
+    # whichever comes first (a topic costs its length plus quotes and comma).
+    chunks: list[list[str]] = []
+    chunk: list[str] = []
+    size = _FRAME_OVERHEAD
+    for topic in topics:
+        cost = len(topic) + 3
+        if chunk and (len(chunk) >= max_topics or size + cost > max_bytes):
+            chunks.append(chunk)
+            chunk = []
+            size = _FRAME_OVERHEAD
+        chunk.append(topic)
+        size += cost
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+class WsClient(EventEmitter):
     """Low-level WebSocket client for the eToro streaming API.
 
-    Handles authentication, automatic reconnection with exponential backoff,
-    heartbeat (via the ``websockets`` library's built-in ``ping_interval``),
-    and topic subscription tracking.
+    Handles authentication, automatic reconnection with jittered, capped
+    exponential backoff, heartbeat (via the ``websockets`` library's
+    built-in ``ping_interval``), and topic subscription tracking.
+
+    After a reconnect every tracked topic is re-subscribed with a snapshot
+    and ``"resync"`` is emitted so caches can be refreshed.  Rate ticks
+    whose ``PriceRateID`` (or ``Date``) goes backwards for an instrument are
+    dropped and reported the same way; see :attr:`reconnect_stats`.
+
+    :meth:`subscribe` and :meth:`unsubscribe` send in the background and
+    report send failures as ``"error"``; :meth:`subscribe_many` and
+    :meth:`unsubscribe_many` batch large topic lists into few frames and
+    wait for the server's acknowledgements.
 
     Message dispatch uses a lightweight event-emitter pattern:
-    :meth:`on` / :meth:`off` / :meth:`once`.
+    :meth:`on` / :meth:`off` / :meth:`once`.  Coroutine handlers are
+    scheduled as tasks and ``on(..., executor="thread")`` moves a handler
+    off the event loop (see :class:`~etoropy._events.EventEmitter`).
 
     Emitted events::
 
         "open"            -> ()                     # TCP connection established
         "authenticated"   -> ()                     # auth handshake succeeded
         "message"         -> (WsEnvelope)           # raw data envelope
-        "instrument:rate" -> (instrument_id, WsInstrumentRate)
+        "instrument:rate" -> (instrument_id, WsInstrumentRate | WsRateTick)
         "private:event"   -> (WsPrivateEvent)       # order status changes
         "close"           -> (code, reason)          # connection closed
+        "resync"          -> (reason, topics)        # "reconnect" | "sequence"
         "error"           -> (Exception)
 
+    Each frame is decoded once; the :class:`WsEnvelope` model is only
+    built while a ``"message"`` listener is registered.
+
     :param options: Connection and reconnection settings.
     """
 
     def __init__(self, options: WsClientOptions) -> None:
+        super().__init__(options.max_concurrent_handlers, options.max_pending_handlers)
         self._api_key = options.api_key
         self._user_key = options.user_key
         self._ws_url = options.ws_url
         self._max_reconnect_attempts = options.reconnect_attempts
         self._reconnect_delay = options.reconnect_delay
+        self._reconnect_max_delay = options.reconnect_max_delay
         self._auth_timeout = options.auth_timeout
         self._heartbeat_interval = options.heartbeat_interval
         self._heartbeat_timeout = options.heartbeat_timeout
+        self._lightweight_ticks = options.lightweight_ticks
+        self._tick_buffer = options.tick_buffer
+        self._quote_book = options.quote_book
 
         self._ws: websockets.asyncio.client.ClientConnection | None = None
         self._authenticated = False
@@ -86,45 +209,15 @@ class WsClient:
         self._receive_task: asyncio.Task[None] | None = None
         self._heartbeat_task: asyncio.Task[None] | None = None
         self._last_pong_at: float = 0.0
-
-        self._listeners: dict[str, list[EventHandler]] = {}
-
-    def on(self, event: str, handler: EventHandler) -> WsClient:
-        """Register *handler* for *event*."""
-        self._listeners.setdefault(event, []).append(handler)
-        return self
-
-    def off(self, event: str, handler: EventHandler) -> WsClient:
-        """Unregister *handler* from *event*."""
-        handlers = self._listeners.get(event)
-        if handlers and handler in handlers:
-            handlers.remove(handler)
-        return self
-
-    def once(self, event: str, handler: EventHandler) -> WsClient:
-        """Register *handler* for *event*, then auto-unregister after the first call."""
-
-        def wrapper(*args: Any, **kwargs: Any) -> Any:
-            self.off(event, wrapper)
-            return handler(*args, **kwargs)
-
-        return self.on(event, wrapper)
-
-    def _emit(self, event: str, *args: Any) -> bool:
-        handlers = self._listeners.get(event)
-        if not handlers:
-            return False
-        for handler in list(handlers):
-            handler(*args)
-        return True
-
-    def remove_all_listeners(self, event: str | None = None) -> WsClient:
-        """Remove all listeners, or only those for *event* if given."""
-        if event:
-            self._listeners.pop(event, None)
-        else:
-            self._listeners.clear()
-        return self
+        self._read_gate = asyncio.Event()
+        self._read_gate.set()
+        self._read_pauses = 0
+        self._last_seq: dict[int, Any] = {}
+        self._closed_at = 0.0
+        self._resubscribed_at: float | None = None
+        self._reconnect_stats = ReconnectStats()
+        self._pending_acks: dict[str, asyncio.Future[dict[str, Any]]] = {}
+        self._send_tasks: set[asyncio.Future[None]] = set()
 
     @property
     def last_pong_at(self) -> float:
@@ -136,6 +229,14 @@ class WsClient:
         """Whether the WebSocket connection is open."""
         return self._ws is not None and self._ws.state.name == "OPEN"
 
+    def is_connected_for(self, topic: str) -> bool:
+        """Whether *topic* can be streamed; same as :attr:`is_connected`.
+
+        Mirrors :meth:`WsClientPool.is_connected_for`, where only the shard
+        owning *topic* has to be connected.
+        """
+        return self.is_connected
+
     @property
     def is_authenticated(self) -> bool:
         """Whether authentication has completed successfully."""
@@ -155,12 +256,12 @@ class WsClient:
             ping_timeout=self._heartbeat_timeout if self._heartbeat_timeout > 0 else None,
         )
 
-        self._reconnect_attempts = 0
         logger.info("WebSocket connected")
         self._emit("open")
 
         self._receive_task = asyncio.create_task(self._receive_loop())
         await self._authenticate()
+        self._reconnect_attempts = 0
 
     async def _authenticate(self) -> None:
         auth_msg = {
@@ -210,7 +311,7 @@ class WsClient:
             "data": {"topics": topics, "snapshot": snapshot},
         }
         logger.debug("Subscribing to: %s", ", ".join(topics))
-        asyncio.ensure_future(self._send(msg))
+        self._send_in_background(msg)
 
     def unsubscribe(self, topics: list[str]) -> None:
         """Unsubscribe from WebSocket topics."""
@@ -221,11 +322,144 @@ class WsClient:
             "data": {"topics": topics},
         }
         logger.debug("Unsubscribing from: %s", ", ".join(topics))
-        asyncio.ensure_future(self._send(msg))
+        self._send_in_background(msg)
+
+    def is_subscribed(self, topic: str) -> bool:
+        """Whether *topic* is among the tracked subscriptions."""
+        return self._subscriptions.has(topic)
+
+    async def subscribe_many(
+        self,
+        topics: list[str],
+        snapshot: bool = False,
+        *,
+        max_topics_per_frame: int = DEFAULT_WS_SUBSCRIBE_BATCH,
+        max_frame_bytes: int = DEFAULT_WS_MAX_FRAME_BYTES,
+        ack_timeout: float = DEFAULT_WS_ACK_TIMEOUT,
+        retries: int = DEFAULT_WS_ACK_RETRIES,
+    ) -> SubscribeResult:
+        """Subscribe to many topics in as few frames as possible and wait for acks.
+
+        Topics are packed into frames of at most *max_topics_per_frame*
+        topics and *max_frame_bytes* bytes; the frames are sent concurrently
+        and each waits for the server reply carrying its ``id``.  A frame
+        that is rejected or not acknowledged within *ack_timeout* is re-sent
+        up to *retries* times with backoff.  Topics that still fail are
+        reported in :attr:`SubscribeResult.failed` and are not re-subscribed
+        after a reconnect.
+
+        :param topics: Topic strings; duplicates are sent once.
+        :param snapshot: Request an initial data snapshot on subscribe.
+        :returns: Acknowledged and failed topics with per-topic latency.
+        """
+        topics = list(dict.fromkeys(topics))
+        self._subscriptions.add(topics)
+        result = await self._request_many(
+            "Subscribe", topics, {"snapshot": snapshot}, max_topics_per_frame, max_frame_bytes, ack_timeout, retries
+        )
+        if result.failed:
+            self._subscriptions.remove(list(result.failed))
+        return result
+
+    async def unsubscribe_many(
+        self,
+        topics: list[str],
+        *,
+        max_topics_per_frame: int = DEFAULT_WS_SUBSCRIBE_BATCH,
+        max_frame_bytes: int = DEFAULT_WS_MAX_FRAME_BYTES,
+        ack_timeout: float = DEFAULT_WS_ACK_TIMEOUT,
+        retries: int = DEFAULT_WS_ACK_RETRIES,
+    ) -> SubscribeResult:
+        """Unsubscribe from many topics; see :meth:`subscribe_many`."""
+        topics = list(dict.fromkeys(topics))
+        self._subscriptions.remove(topics)
+        return await self._request_many(
+            "Unsubscribe", topics, {}, max_topics_per_frame, max_frame_bytes, ack_timeout, retries
+        )
+
+    async def _request_many(
+        self,
+        operation: str,
+        topics: list[str],
+        data: dict[str, Any],
+        max_topics: int,
+        max_bytes: int,
+        ack_timeout: float,
+        retries: int,
+    ) -> SubscribeResult:
+        result = SubscribeResult()
+        started = time.monotonic()
+
+        async def send_chunk(chunk: list[str]) -> None:
+            error: Exception | None = None
+            for attempt in range(retries + 1):
+                if attempt:
+                    result.retries += 1
+                    await asyncio.sleep(self._backoff(attempt - 1))
+                result.frames += 1
+                try:
+                    await self._request(operation, {"topics": chunk, **data}, ack_timeout)
+                except (EToroWebSocketError, OSError, websockets.ConnectionClosed) as exc:
+                    error = exc
+                    logger.warning("%s of %d topics failed (attempt %d): %s", operation, len(chunk), attempt + 1, exc)
+                    continue
+                elapsed = time.monotonic() - started
+                result.acked.extend(chunk)
+                result.latency.update(dict.fromkeys(chunk, elapsed))
+                return
+            result.failed.update(dict.fromkeys(chunk, str(error)))
+
+        chunks = _chunk_topics(topics, max_topics, max_bytes)
+        logger.debug("%s: %d topics in %d frames", operation, len(topics), len(chunks))
+        await asyncio.gather(*(send_chunk(chunk) for chunk in chunks))
+        return result
+
+    async def _request(self, operation: str, data: dict[str, Any], timeout: float) -> dict[str, Any]:
+        msg_id = generate_uuid()
+        ack: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._pending_acks[msg_id] = ack
+        try:
+            await self._send({"id": msg_id, "operation": operation, "data": data})
+            return await asyncio.wait_for(ack, timeout)
+        except TimeoutError as exc:
+            raise EToroWebSocketError(f"{operation} not acknowledged within {timeout}s") from exc
+        finally:
+            self._pending_acks.pop(msg_id, None)
+
+    def _resolve_ack(self, ack: asyncio.Future[dict[str, Any]], raw: dict[str, Any]) -> None:
+        if ack.done():
+            return
+        error_code = raw.get("errorCode")
+        if error_code or raw.get("success") is False:
+            detail = raw.get("errorMessage") or raw.get("error") or ""
+            ack.set_exception(
+                EToroWebSocketError(f"{raw.get('operation', 'Request')} rejected: {error_code} {detail}".rstrip())
+            )
+        else:
+            ack.set_result(raw)
+
+    def _fail_pending_acks(self, reason: str) -> None:
+        for ack in self._pending_acks.values():
+            if not ack.done():
+                ack.set_exception(EToroWebSocketError(reason))
+
+    def _send_in_background(self, msg: Any) -> None:
+        task = asyncio.ensure_future(self._send(msg))
+        self._send_tasks.add(task)
+        task.add_done_callback(self._send_done)
+
+    def _send_done(self, task: asyncio.Future[None]) -> None:
+        self._send_tasks.discard(task)
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            logger.error("WebSocket send failed: %s", exc)
+            self._emit("error", exc)
 
     async def disconnect(self) -> None:
         """Close the WebSocket connection gracefully."""
         self._intentional_close = True
+        if self._send_tasks:
+            # Let queued (un)subscribe frames go out before the close frame.
+            await asyncio.gather(*self._send_tasks, return_exceptions=True)
         if self._receive_task and not self._receive_task.done():
             self._receive_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
@@ -237,28 +471,65 @@ class WsClient:
         self._authenticated = False
         self._subscriptions.clear()
 
+    def pause_reading(self) -> None:
+        """Stop reading frames after the current one until :meth:`resume_reading`.
+
+        Unread frames stay in the socket, so the server sees TCP
+        backpressure.  Calls nest: reading resumes once every
+        :meth:`pause_reading` has been matched by :meth:`resume_reading`.
+        """
+        self._read_pauses += 1
+        self._read_gate.clear()
+
+    def resume_reading(self) -> None:
+        """Undo one :meth:`pause_reading` call."""
+        self._read_pauses = max(0, self._read_pauses - 1)
+        if not self._read_pauses:
+            self._read_gate.set()
+
+    @property
+    def reading_paused(self) -> bool:
+        return not self._read_gate.is_set()
+
     async def _receive_loop(self) -> None:
-        assert self._ws is not None
+        ws = self._ws
+        assert ws is not None
         try:
-            async for raw in self._ws:
+            async for raw in ws:
                 if isinstance(raw, bytes):
                     continue
                 self._handle_message(raw)
+                if not self._read_gate.is_set():
+                    await self._read_gate.wait()
+            # Iteration ends without raising on a clean (1000/1001) close.
+            if ws.state.name == "CLOSED":
+                await self._on_closed(ws.close_code or 1000, ws.close_reason or "")
         except websockets.ConnectionClosed as exc:
-            logger.info("WebSocket closed: %d %s", exc.code, exc.reason)
-            self._authenticated = False
-            self._emit("close", exc.code, exc.reason)
-            if not self._intentional_close:
-                await self._attempt_reconnect()
+            await self._on_closed(exc.code, exc.reason)
         except asyncio.CancelledError:
             pass
         except Exception as exc:
             logger.error("WebSocket error: %s", exc)
             self._emit("error", exc)
 
+    async def _on_closed(self, code: int, reason: str) -> None:
+        logger.info("WebSocket closed: %d %s", code, reason)
+        self._authenticated = False
+        self._closed_at = time.monotonic()
+        self._fail_pending_acks(f"WebSocket closed: {code} {reason}".rstrip())
+        self._emit("close", code, reason)
+        if not self._intentional_close:
+            await self._attempt_reconnect()
+
     def _handle_message(self, data: str) -> None:
         try:
-            raw = json.loads(data)
+            raw = _json.loads(data)
+
+            if self._pending_acks:
+                ack = self._pending_acks.get(raw.get("id"))
+                if ack is not None:
+                    self._resolve_ack(ack, raw)
+                    return
 
             if raw.get("operation") == "Authenticate" or raw.get("type") == "Authenticate":
                 if raw.get("errorCode"):
@@ -268,47 +539,142 @@ class WsClient:
                 self._emit("authenticated")
                 return
 
-            if raw.get("messages") and isinstance(raw["messages"], list):
-                envelope = WsEnvelope.model_validate(raw)
-                self._emit("message", envelope)
-
-                parsed = parse_messages(envelope)
-                for msg in parsed:
-                    if msg.type == "instrument:rate" and isinstance(msg.data, ParsedInstrumentRate):
-                        self._emit("instrument:rate", msg.data.instrument_id, msg.data.rate)
-                    elif msg.type == "private:event" and isinstance(msg.data, ParsedPrivateEvent):
-                        self._emit("private:event", msg.data.event)
+            messages = raw.get("messages")
+            if messages and isinstance(messages, list):
+                if self._listeners.get("message"):
+                    self._emit("message", WsEnvelope.model_validate(raw))
+                self._dispatch_messages(messages)
         except Exception:
             logger.error("Failed to parse WebSocket message: %s", data[:200])
 
-    async def _attempt_reconnect(self) -> None:
-        if self._reconnect_attempts >= self._max_reconnect_attempts:
-            logger.error("Max reconnect attempts (%d) reached", self._max_reconnect_attempts)
-            self._emit("error", EToroWebSocketError("Max reconnect attempts reached"))
-            return
+    def _dispatch_messages(self, messages: list[dict[str, Any]]) -> None:
+        buffer = self._tick_buffer
+        quotes = self._quote_book
+        received_at = time.time() if buffer is not None else 0.0
+        last_seq = self._last_seq
+        for msg in messages:
+            topic = msg.get("topic", "")
+            if topic.startswith("instrument:"):
+                instrument_id = int(topic[11:])
+                content = _json.loads(msg["content"])
+                if "Ask" in content:
+                    seq = content.get("PriceRateID") or content.get("Date")
+                    if seq:
+                        last = last_seq.get(instrument_id)
+                        if last is not None and type(last) is type(seq) and seq < last:
+                            self._reconnect_stats.out_of_order += 1
+                            self._emit("resync", "sequence", [topic])
+                            continue
+                        last_seq[instrument_id] = seq
+                    if self._resubscribed_at is not None:
+                        self._record_first_tick()
+                if buffer is not None and "Ask" in content and "Bid" in content:
+                    buffer.write(
+                        instrument_id,
+                        content["Bid"],
+                        content["Ask"],
+                        content.get("LastExecution", 0.0),
+                        received_at,
+                        content.get("PriceRateID", 0),
+                    )
+                if quotes is not None and "Ask" in content and "Bid" in content:
+                    quotes.update(
+                        instrument_id,
+                        content["Bid"],
+                        content["Ask"],
+                        content.get("LastExecution", 0.0),
+                        content.get("PriceRateID", 0),
+                        content.get("Date", ""),
+                    )
+                if not self._listeners.get("instrument:rate"):
+                    continue
+                rate = rate_from_content(content, self._lightweight_ticks)
+                if rate is not None:
+                    self._emit("instrument:rate", instrument_id, rate)
+            elif topic == "private":
+                self._emit("private:event", WsPrivateEvent.model_validate(_json.loads(msg["content"])))
 
-        delay = self._reconnect_delay * (2**self._reconnect_attempts)
-        self._reconnect_attempts += 1
+    @property
+    def tick_buffer(self) -> TickBuffer | None:
+        """The :class:`TickBuffer` rate ticks are written into, if configured."""
+        return self._tick_buffer
 
-        logger.info(
-            "Reconnecting in %.1fs (attempt %d/%d)",
-            delay,
-            self._reconnect_attempts,
-            self._max_reconnect_attempts,
-        )
+    @property
+    def quote_book(self) -> QuoteBook | None:
+        """The :class:`QuoteBook` rate ticks are recorded in, if configured."""
+        return self._quote_book
 
-        await asyncio.sleep(delay)
+    @property
+    def reconnect_stats(self) -> ReconnectStats:
+        return self._reconnect_stats
+
+    def _record_first_tick(self) -> None:
+        assert self._resubscribed_at is not None
+        now = time.monotonic()
+        self._reconnect_stats.first_tick_latency.record(int((now - self._resubscribed_at) * 1e9))
+        self._reconnect_stats.last_outage_s = now - self._closed_at
+        self._resubscribed_at = None
+
+    def _backoff(self, attempt: int) -> float:
+        # "Equal jitter": half the capped exponential delay, plus up to the
+        # other half at random, so shards and processes spread out.
+        ceiling = min(self._reconnect_max_delay, self._reconnect_delay * 2.0 ** min(attempt, 32))
+        return ceiling / 2 + random.uniform(0, ceiling / 2)
 
-        try:
-            await self.connect()
+    async def _attempt_reconnect(self) -> None:
+        while not self._intentional_close:
+            if self._reconnect_attempts >= self._max_reconnect_attempts:
+                logger.error("Max reconnect attempts (%d) reached", self._max_reconnect_attempts)
+                self._emit("error", EToroWebSocketError("Max reconnect attempts reached"))
+                return
+
+            delay = self._backoff(self._reconnect_attempts)
+            self._reconnect_attempts += 1
+            logger.info(
+                "Reconnecting in %.2fs (attempt %d/%d)",
+                delay,
+                self._reconnect_attempts,
+                self._max_reconnect_attempts,
+            )
+            await asyncio.sleep(delay)
+            if self._intentional_close:
+                return
+
+            try:
+                await self.connect()
+            except Exception as exc:
+                self._reconnect_stats.failed_attempts += 1
+                logger.error("Reconnection failed: %s", exc)
+                await self._abort_connection()
+                continue
+
+            self._reconnect_stats.reconnects += 1
+            self._reconnect_stats.last_downtime_s = time.monotonic() - self._closed_at
+            # Sequence numbers may restart with the new session; the
+            # snapshots requested below set the new baseline.
+            self._last_seq.clear()
             topics = self._subscriptions.get_all()
             if topics:
                 logger.info("Re-subscribing to %d topics", len(topics))
-                self.subscribe(topics)
-        except Exception as exc:
-            logger.error("Reconnection failed: %s", exc)
+                self.subscribe(topics, snapshot=True)
+                self._resubscribed_at = time.monotonic()
+            self._emit("resync", "reconnect", topics)
+            return
+
+    async def _abort_connection(self) -> None:
+        # Tear down a half-open connection (e.g. auth failed) without its
+        # receive loop starting a second reconnect cycle.
+        task = self._receive_task
+        if task is not None and task is not asyncio.current_task() and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        if self._ws is not None:
+            with contextlib.suppress(Exception):
+                await self._ws.close()
+            self._ws = None
 
     async def _send(self, msg: Any) -> None:
         if not self._ws:
             raise EToroWebSocketError("WebSocket not connected")
-        await self._ws.send(json.dumps(msg))
+        await self._ws.send(_json.dumps(msg))
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-import json
 import logging
 from dataclasses import dataclass
 from typing import Any
 
 from pydantic import ValidationError
 
-from ..models.websocket import WsEnvelope, WsInstrumentRate, WsPrivateEvent
+from .. import _json
+from ..models.websocket import WsEnvelope, WsInstrumentRate, WsPrivateEvent, WsRateTick
 
 logger = logging.getLogger("etoropy")
 
@@ -30,7 +30,7 @@ class ParsedMessage:
 
 
 def parse_envelope(data: str) -> WsEnvelope:
-    return WsEnvelope.model_validate(json.loads(data))
+    return WsEnvelope.model_validate(_json.loads(data))
 
 
 def parse_messages(envelope: WsEnvelope) -> list[ParsedMessage]:
@@ -51,12 +51,9 @@ def parse_messages(envelope: WsEnvelope) -> list[ParsedMessage]:
         if msg.topic.startswith("instrument:"):
             parts = msg.topic.split(":")
             instrument_id = int(parts[1])
-            content = json.loads(msg.content)
-            try:
-                rate = WsInstrumentRate.model_validate(content)
-            except ValidationError:
+            rate = _validate_rate(_json.loads(msg.content))
+            if rate is None:
                 # Heartbeat/notification messages with only Date+PriceRateID — skip
-                logger.debug("Skipping instrument message without rate data: %s", content)
                 continue
             results.append(
                 ParsedMessage(
@@ -65,7 +62,7 @@ def parse_messages(envelope: WsEnvelope) -> list[ParsedMessage]:
                 )
             )
         elif msg.topic == "private":
-            event = WsPrivateEvent.model_validate(json.loads(msg.content))
+            event = WsPrivateEvent.model_validate(_json.loads(msg.content))
             results.append(
                 ParsedMessage(
                     type="private:event",
@@ -76,3 +73,30 @@ def parse_messages(envelope: WsEnvelope) -> list[ParsedMessage]:
             results.append(ParsedMessage(type="unknown", data=msg))
 
     return results
+
+
+def decode_rate(content: str, lightweight: bool = False) -> WsInstrumentRate | WsRateTick | None:
+    """Decode the ``content`` of an ``instrument:<id>`` message.
+
+    :param lightweight: Return a :class:`WsRateTick` instead of a validated
+        :class:`WsInstrumentRate`.
+    :returns: ``None`` for heartbeat/notification messages without a rate.
+    """
+    return rate_from_content(_json.loads(content), lightweight)
+
+
+def rate_from_content(data: dict[str, Any], lightweight: bool = False) -> WsInstrumentRate | WsRateTick | None:
+    """Like :func:`decode_rate`, for content that has already been decoded."""
+    if lightweight:
+        if "Ask" not in data or "Bid" not in data:
+            return None
+        return WsRateTick.from_content(data)
+    return _validate_rate(data)
+
+
+def _validate_rate(data: Any) -> WsInstrumentRate | None:
+    try:
+        return WsInstrumentRate.model_validate(data)
+    except ValidationError:
+        logger.debug("Skipping instrument message without rate data: %s", data)
+        return None
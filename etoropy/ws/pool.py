@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable, Coroutine
+from dataclasses import replace
+from typing import Any
+
+from .._events import EventEmitter
+from .client import SubscribeResult, WsClient, WsClientOptions
+from .quote_book import QuoteBook
+from .tick_buffer import TickBuffer
+
+logger = logging.getLogger("etoropy")
+
+
+class WsClientPool(EventEmitter):
+    """Shard WebSocket subscriptions across several :class:`WsClient` connections.
+
+    ``instrument:<id>`` topics go to shard ``id % shards``; any other topic
+    (e.g. ``"private"``) goes to shard 0.  Each shard authenticates,
+    heartbeats and reconnects on its own, re-subscribing only its topics.
+
+    The pool exposes the same event API as :class:`WsClient`: events from
+    every shard are re-emitted here.  Shard events are only listened to
+    while the pool has a listener for them, so the per-client fast paths
+    (no envelope / rate models without listeners) still apply.
+
+    :param options: Connection options shared by every shard.
+    :param shards: Number of connections.
+    """
+
+    def __init__(self, options: WsClientOptions, shards: int = 2) -> None:
+        if shards < 1:
+            raise ValueError("shards must be >= 1")
+        super().__init__(options.max_concurrent_handlers, options.max_pending_handlers)
+        self._tick_buffer = options.tick_buffer
+        self._quote_book = options.quote_book
+        self._shards = [WsClient(replace(options)) for _ in range(shards)]
+        self._forwarders: dict[str, Callable[..., None]] = {}
+
+    @property
+    def shards(self) -> list[WsClient]:
+        return list(self._shards)
+
+    def shard_for(self, topic: str) -> WsClient:
+        """Return the shard that owns *topic*."""
+        if topic.startswith("instrument:"):
+            return self._shards[int(topic[11:]) % len(self._shards)]
+        return self._shards[0]
+
+    def _listeners_changed(self) -> None:
+        for event in [e for e in self._forwarders if not self._listeners.get(e)]:
+            forward = self._forwarders.pop(event)
+            for shard in self._shards:
+                shard.off(event, forward)
+        for event, listeners in self._listeners.items():
+            if listeners and event not in self._forwarders:
+                forward = self._forwarder(event)
+                self._forwarders[event] = forward
+                for shard in self._shards:
+                    shard.on(event, forward)
+
+    def _forwarder(self, event: str) -> Callable[..., None]:
+        def forward(*args: Any) -> None:
+            self._emit(event, *args)
+
+        return forward
+
+    async def connect(self) -> None:
+        """Connect and authenticate every shard concurrently.
+
+        If any shard fails, every shard is disconnected again before the
+        first error is raised, so no half-connected pool is left behind.
+
+        :raises EToroAuthError: If any shard fails to authenticate.
+        """
+        results = await asyncio.gather(*(shard.connect() for shard in self._shards), return_exceptions=True)
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            await self.disconnect()
+            raise errors[0]
+        logger.info("WebSocket pool connected (%d shards)", len(self._shards))
+
+    async def disconnect(self) -> None:
+        """Close every shard."""
+        await asyncio.gather(*(shard.disconnect() for shard in self._shards))
+
+    def subscribe(self, topics: list[str], snapshot: bool = False) -> None:
+        """Subscribe to *topics*, each on its owning shard."""
+        for shard, group in self._group(topics).items():
+            shard.subscribe(group, snapshot)
+
+    def unsubscribe(self, topics: list[str]) -> None:
+        """Unsubscribe from *topics* on their owning shards."""
+        for shard, group in self._group(topics).items():
+            shard.unsubscribe(group)
+
+    def is_subscribed(self, topic: str) -> bool:
+        """Whether *topic* is subscribed on its owning shard."""
+        return self.shard_for(topic).is_subscribed(topic)
+
+    async def subscribe_many(self, topics: list[str], snapshot: bool = False, **kwargs: Any) -> SubscribeResult:
+        """Subscribe on every owning shard concurrently; see :meth:`WsClient.subscribe_many`."""
+        return await self._many(
+            [shard.subscribe_many(group, snapshot, **kwargs) for shard, group in self._group(topics).items()]
+        )
+
+    async def unsubscribe_many(self, topics: list[str], **kwargs: Any) -> SubscribeResult:
+        """Unsubscribe on every owning shard concurrently; see :meth:`WsClient.unsubscribe_many`."""
+        return await self._many(
+            [shard.unsubscribe_many(group, **kwargs) for shard, group in self._group(topics).items()]
+        )
+
+    @staticmethod
+    async def _many(requests: list[Coroutine[Any, Any, SubscribeResult]]) -> SubscribeResult:
+        result = SubscribeResult()
+        for shard_result in await asyncio.gather(*requests):
+            result.merge(shard_result)
+        return result
+
+    def _group(self, topics: list[str]) -> dict[WsClient, list[str]]:
+        groups: dict[WsClient, list[str]] = {}
+        for topic in topics:
+            groups.setdefault(self.shard_for(topic), []).append(topic)
+        return groups
+
+    def pause_reading(self) -> None:
+        """Pause reading on every shard (see :meth:`WsClient.pause_reading`)."""
+        for shard in self._shards:
+            shard.pause_reading()
+
+    def resume_reading(self) -> None:
+        """Undo one :meth:`pause_reading` call on every shard."""
+        for shard in self._shards:
+            shard.resume_reading()
+
+    @property
+    def reading_paused(self) -> bool:
+        return any(shard.reading_paused for shard in self._shards)
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether every shard's connection is open."""
+        return all(shard.is_connected for shard in self._shards)
+
+    def is_connected_for(self, topic: str) -> bool:
+        """Whether the shard that owns *topic* is connected.
+
+        Unlike :attr:`is_connected` this stays ``True`` while an unrelated
+        shard is reconnecting.
+        """
+        return self.shard_for(topic).is_connected
+
+    @property
+    def is_authenticated(self) -> bool:
+        """Whether every shard has authenticated."""
+        return all(shard.is_authenticated for shard in self._shards)
+
+    @property
+    def connected_shards(self) -> int:
+        return sum(shard.is_connected for shard in self._shards)
+
+    @property
+    def tick_buffer(self) -> TickBuffer | None:
+        """The :class:`TickBuffer` shared by all shards, if configured."""
+        return self._tick_buffer
+
+    @property
+    def quote_book(self) -> QuoteBook | None:
+        """The :class:`QuoteBook` shared by all shards, if configured."""
+        return self._quote_book
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import time
+from array import array
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class Quote:
+    """Latest streamed quote for one instrument, as held by :class:`QuoteBook`.
+
+    :param updated_at: ``time.monotonic()`` when the quote was received.
+    """
+
+    instrument_id: int
+    bid: float
+    ask: float
+    last_execution: float
+    price_rate_id: int
+    date: str
+    updated_at: float
+
+    @property
+    def age(self) -> float:
+        """Seconds since the quote was received."""
+        return time.monotonic() - self.updated_at
+
+
+class QuoteBook:
+    """Latest bid/ask per instrument, updated from the WebSocket stream.
+
+    Each instrument is assigned a slot on first sight; prices live in
+    parallel ``array`` columns indexed by that slot, so updates are a dict
+    lookup plus a few in-place stores and the book stays compact for
+    thousands of instruments.
+
+    Staleness is tracked with ``time.monotonic()``: :meth:`get` returns
+    ``None`` for quotes older than *max_age*.  :meth:`invalidate` marks
+    quotes stale without forgetting their slots.
+
+    :param max_age: Default freshness limit in seconds for :meth:`get`.
+    """
+
+    def __init__(self, max_age: float = 5.0) -> None:
+        self.max_age = max_age
+        self._slots: dict[int, int] = {}
+        self._bid: array[float] = array("d")
+        self._ask: array[float] = array("d")
+        self._last_execution: array[float] = array("d")
+        self._updated_at: array[float] = array("d")
+        self._price_rate_id: array[int] = array("q")
+        self._date: list[str] = []
+
+    def update(
+        self,
+        instrument_id: int,
+        bid: float,
+        ask: float,
+        last_execution: float = 0.0,
+        price_rate_id: int = 0,
+        date: str = "",
+    ) -> None:
+        """Record the latest quote for *instrument_id*."""
+        now = time.monotonic()
+        slot = self._slots.get(instrument_id)
+        if slot is None:
+            self._slots[instrument_id] = len(self._date)
+            self._bid.append(bid)
+            self._ask.append(ask)
+            self._last_execution.append(last_execution)
+            self._updated_at.append(now)
+            self._price_rate_id.append(price_rate_id)
+            self._date.append(date)
+            return
+        self._bid[slot] = bid
+        self._ask[slot] = ask
+        self._last_execution[slot] = last_execution
+        self._updated_at[slot] = now
+        self._price_rate_id[slot] = price_rate_id
+        self._date[slot] = date
+
+    def get(self, instrument_id: int, max_age: float | None = None) -> Quote | None:
+        """Return the quote for *instrument_id* if it is fresh.
+
+        :param max_age: Override the book's default freshness limit.
+        :returns: ``None`` if the instrument has no quote or it is stale.
+        """
+        slot = self._slots.get(instrument_id)
+        if slot is None:
+            return None
+        limit = self.max_age if max_age is None else max_age
+        if time.monotonic() - self._updated_at[slot] > limit:
+            return None
+        return self._quote(instrument_id, slot)
+
+    def peek(self, instrument_id: int) -> Quote | None:
+        """Return the last quote for *instrument_id* regardless of age."""
+        slot = self._slots.get(instrument_id)
+        return None if slot is None else self._quote(instrument_id, slot)
+
+    def _quote(self, instrument_id: int, slot: int) -> Quote:
+        return Quote(
+            instrument_id,
+            self._bid[slot],
+            self._ask[slot],
+            self._last_execution[slot],
+            self._price_rate_id[slot],
+            self._date[slot],
+            self._updated_at[slot],
+        )
+
+    def invalidate(self, instrument_ids: list[int] | None = None) -> None:
+        """Mark quotes stale -- all of them, or only *instrument_ids*."""
+        if instrument_ids is None:
+            for slot in range(len(self._updated_at)):
+                self._updated_at[slot] = float("-inf")
+            return
+        for instrument_id in instrument_ids:
+            index = self._slots.get(instrument_id)
+            if index is not None:
+                self._updated_at[index] = float("-inf")
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, instrument_id: object) -> bool:
+        return instrument_id in self._slots
@@ -0,0 +1,299 @@
+"""Local stand-in for the eToro WebSocket feed, for load tests and benchmarks.
+
+:class:`FeedSimulator` speaks the part of the streaming protocol that
+:class:`~etoropy.ws.client.WsClient` uses -- ``Authenticate``,
+``Subscribe`` and ``Unsubscribe`` requests, each answered with the request
+``id`` -- and streams ``instrument:<id>`` rate envelopes for the subscribed
+instruments, plus periodic ``private`` order events.
+
+Every rate carries a ``PriceRateID`` that increases across the whole
+simulator and a ``Date`` of the wall-clock send time, so consumers can
+check ordering and measure end-to-end latency.
+
+Run standalone (prints the URL, then serves until interrupted)::
+
+    python -m etoropy.ws.simulator --rate 5000 --burst-factor 4 --burst-period 1 --burst-duration 0.1
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import itertools
+import random
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, Self
+
+from websockets.asyncio.server import Server, ServerConnection, serve
+
+from .. import _json
+
+
+@dataclass
+class SimulatorStats:
+    """Counters for one :class:`FeedSimulator`.
+
+    :param connections: Connections accepted.
+    :param frames: Rate envelopes sent.
+    :param ticks: Rate messages sent (``frames`` x ticks per frame).
+    :param private_events: ``private`` order events sent.
+    """
+
+    connections: int = 0
+    frames: int = 0
+    ticks: int = 0
+    private_events: int = 0
+
+
+class FeedSimulator:
+    """Serve a synthetic eToro WebSocket feed on a local port.
+
+    Each connection streams its subscribed instruments round-robin, packed
+    *ticks_per_frame* rates to an envelope, at *ticks_per_second* -- a
+    per-connection rate, like the real feed's per-socket bandwidth.  For
+    the first *burst_duration* seconds of every *burst_period* the rate is
+    multiplied by *burst_factor*.  A connection that falls behind schedule
+    sends its backlog as fast as the socket accepts it.
+
+    Use as an async context manager::
+
+        async with FeedSimulator(ticks_per_second=10_000) as sim:
+            etoro = EToroTrading(EToroConfig(api_key="k", user_key="u", ws_url=sim.url))
+
+    :param ticks_per_second: Steady per-connection rate.
+    :param ticks_per_frame: Rate messages per envelope.
+    :param burst_factor: Rate multiplier during bursts.
+    :param burst_period: Seconds between burst starts; ``0`` disables bursts.
+    :param burst_duration: Length of each burst in seconds.
+    :param private_interval: Seconds between ``private`` order events on
+        connections subscribed to ``"private"``; ``0`` disables them.
+    :param api_key: If set, ``Authenticate`` requests with another API key
+        are rejected.
+    :param user_key: Like *api_key*, for the user key.
+    :param host: Interface to bind.
+    :param port: Port to bind; ``0`` picks a free one.
+    :param seed: Seed for the simulated prices.
+    """
+
+    def __init__(
+        self,
+        *,
+        ticks_per_second: float = 1_000.0,
+        ticks_per_frame: int = 10,
+        burst_factor: float = 1.0,
+        burst_period: float = 0.0,
+        burst_duration: float = 0.0,
+        private_interval: float = 0.0,
+        api_key: str | None = None,
+        user_key: str | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: int | None = None,
+    ) -> None:
+        if ticks_per_second <= 0:
+            raise ValueError("ticks_per_second must be > 0")
+        if ticks_per_frame < 1:
+            raise ValueError("ticks_per_frame must be >= 1")
+        self._ticks_per_second = ticks_per_second
+        self._ticks_per_frame = ticks_per_frame
+        self._burst_factor = burst_factor
+        self._burst_period = burst_period
+        self._burst_duration = burst_duration
+        self._private_interval = private_interval
+        self._api_key = api_key
+        self._user_key = user_key
+        self._host = host
+        self._port = port
+        self._random = random.Random(seed)
+        self._prices: dict[int, float] = {}
+        self._price_rate_ids = itertools.count(1)
+        self._order_ids = itertools.count(1)
+        self._server: Server | None = None
+        self.connections: list[ServerConnection] = []
+        self.subscriptions: dict[ServerConnection, list[str]] = {}
+        self.stats = SimulatorStats()
+
+    async def start(self) -> str:
+        """Start listening and return the ``ws://`` URL."""
+        self._server = await serve(self._handler, self._host, self._port)
+        return self.url
+
+    async def stop(self) -> None:
+        """Close every connection and stop listening."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.stop()
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("FeedSimulator is not started")
+        host, port = next(iter(self._server.sockets)).getsockname()[:2]
+        return f"ws://{host}:{port}"
+
+    async def drop(self, conn: ServerConnection | None = None, code: int = 1011, reason: str = "") -> None:
+        """Close *conn* (or every connection) to exercise client reconnects."""
+        targets = [conn] if conn is not None else list(self.connections)
+        await asyncio.gather(*(c.close(code, reason) for c in targets))
+
+    def _rate_at(self, elapsed: float) -> float:
+        if self._burst_period > 0 and elapsed % self._burst_period < self._burst_duration:
+            return self._ticks_per_second * self._burst_factor
+        return self._ticks_per_second
+
+    async def _handler(self, conn: ServerConnection) -> None:
+        self.connections.append(conn)
+        self.stats.connections += 1
+        topics = self.subscriptions.setdefault(conn, [])
+        subscribed = asyncio.Event()
+        tasks: list[asyncio.Task[None]] = []
+        try:
+            async for raw in conn:
+                msg = _json.loads(raw)
+                operation = msg.get("operation")
+                reply: dict[str, Any] = {"id": msg.get("id"), "operation": operation}
+                data = msg.get("data") or {}
+                if operation == "Authenticate":
+                    if (self._api_key is not None and data.get("apiKey") != self._api_key) or (
+                        self._user_key is not None and data.get("userKey") != self._user_key
+                    ):
+                        reply["errorCode"] = "Unauthorized"
+                elif operation == "Subscribe":
+                    topics.extend(t for t in data.get("topics", ()) if t not in topics)
+                    if not tasks:
+                        tasks.append(asyncio.create_task(self._stream_rates(conn, topics, subscribed)))
+                        if self._private_interval > 0:
+                            tasks.append(asyncio.create_task(self._stream_private(conn, topics)))
+                    subscribed.set()
+                elif operation == "Unsubscribe":
+                    removed = set(data.get("topics", ()))
+                    topics[:] = [t for t in topics if t not in removed]
+                else:
+                    reply["errorCode"] = "UnknownOperation"
+                await conn.send(_json.dumps(reply))
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _stream_rates(self, conn: ServerConnection, topics: list[str], subscribed: asyncio.Event) -> None:
+        loop = asyncio.get_running_loop()
+        start = next_at = loop.time()
+        position = 0
+        while True:
+            instruments = [t for t in topics if t.startswith("instrument:")]
+            if not instruments:
+                subscribed.clear()
+                await subscribed.wait()
+                next_at = loop.time()
+                continue
+            count = min(self._ticks_per_frame, len(instruments))
+            batch = [instruments[(position + k) % len(instruments)] for k in range(count)]
+            position += count
+            await conn.send(self._rate_frame(batch))
+            self.stats.frames += 1
+            self.stats.ticks += count
+            next_at += count / self._rate_at(next_at - start)
+            await asyncio.sleep(max(0.0, next_at - loop.time()))
+
+    def _rate_frame(self, topics: list[str]) -> str:
+        date = datetime.now(UTC).isoformat(timespec="microseconds").replace("+00:00", "Z")
+        messages = []
+        for topic in topics:
+            instrument_id = int(topic[11:])
+            price = self._prices.get(instrument_id) or 50.0 + instrument_id % 200
+            price = round(max(0.01, price * (1 + self._random.gauss(0, 2e-4))), 4)
+            self._prices[instrument_id] = price
+            spread = round(price * 2e-4, 4)
+            content = {
+                "Ask": price + spread,
+                "Bid": price,
+                "LastExecution": price,
+                "Date": date,
+                "PriceRateID": next(self._price_rate_ids),
+            }
+            messages.append(
+                {
+                    "topic": topic,
+                    "content": _json.dumps(content),
+                    "id": str(content["PriceRateID"]),
+                    "type": "Trading.Instrument.Rate",
+                }
+            )
+        return _json.dumps({"messages": messages})
+
+    async def _stream_private(self, conn: ServerConnection, topics: list[str]) -> None:
+        while True:
+            await asyncio.sleep(self._private_interval)
+            if "private" not in topics:
+                continue
+            instruments = [int(t[11:]) for t in topics if t.startswith("instrument:")] or [1001]
+            instrument_id = self._random.choice(instruments)
+            order_id = next(self._order_ids)
+            units = round(self._random.uniform(1, 100), 2)
+            content = {
+                "OrderID": order_id,
+                "OrderType": 17,
+                "StatusID": 3,
+                "InstrumentID": instrument_id,
+                "CID": 1,
+                "RequestedUnits": units,
+                "ExecutedUnits": units,
+                "PositionID": 1_000_000 + order_id,
+                "Rate": self._prices.get(instrument_id, 100.0),
+                "IsBuy": True,
+                "Leverage": 1,
+                "OpenDateTime": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
+            }
+            message = {
+                "topic": "private",
+                "content": _json.dumps(content),
+                "id": f"o{order_id}",
+                "type": "Trading.OrderForOpen",
+            }
+            await conn.send(_json.dumps({"messages": [message]}))
+            self.stats.private_events += 1
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    simulator = FeedSimulator(
+        ticks_per_second=args.rate,
+        ticks_per_frame=args.ticks_per_frame,
+        burst_factor=args.burst_factor,
+        burst_period=args.burst_period,
+        burst_duration=args.burst_duration,
+        private_interval=args.private_interval,
+        host=args.host,
+        port=args.port,
+    )
+    async with simulator:
+        print(simulator.url, flush=True)
+        await asyncio.Future()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve a synthetic eToro WebSocket feed.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--rate", type=float, default=1_000.0, help="ticks per second per connection")
+    parser.add_argument("--ticks-per-frame", type=int, default=10)
+    parser.add_argument("--burst-factor", type=float, default=1.0)
+    parser.add_argument("--burst-period", type=float, default=0.0)
+    parser.add_argument("--burst-duration", type=float, default=0.0)
+    parser.add_argument("--private-interval", type=float, default=0.0)
+    args = parser.parse_args(argv)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_serve(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+from array import array
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+_COLUMNS = (
+    ("instrument_id", "q"),
+    ("bid", "d"),
+    ("ask", "d"),
+    ("last_execution", "d"),
+    ("timestamp", "d"),
+    ("price_rate_id", "q"),
+)
+
+
+@dataclass
+class TickBatch:
+    """A block of ticks read from a :class:`TickBuffer`, one array per column.
+
+    Rows are in arrival order.  ``timestamp`` is the local receive time
+    (``time.time()``) of the frame that carried the tick.
+    """
+
+    instrument_id: array[int]
+    bid: array[float]
+    ask: array[float]
+    last_execution: array[float]
+    timestamp: array[float]
+    price_rate_id: array[int]
+
+    def __len__(self) -> int:
+        return len(self.instrument_id)
+
+    def rows(self) -> Iterator[tuple[int, float, float, float, float, int]]:
+        """Iterate ``(instrument_id, bid, ask, last_execution, timestamp, price_rate_id)`` tuples."""
+        return zip(
+            self.instrument_id,
+            self.bid,
+            self.ask,
+            self.last_execution,
+            self.timestamp,
+            self.price_rate_id,
+            strict=True,
+        )
+
+    def as_numpy(self) -> dict[str, Any]:
+        """Return the columns as NumPy arrays (zero-copy views; requires ``numpy``)."""
+        np: Any = importlib.import_module("numpy")
+        return {name: np.frombuffer(getattr(self, name), dtype=code) for name, code in _COLUMNS}
+
+
+class TickBuffer:
+    """Fixed-capacity columnar ring buffer for streamed instrument rates.
+
+    :class:`WsClient` writes each tick straight into preallocated
+    ``array`` columns -- no per-tick model or wrapper objects -- and
+    consumers drain them in batches with :meth:`read` or :meth:`batches`,
+    which suits vectorized processing (see :meth:`TickBatch.as_numpy`).
+
+    When the buffer is full the oldest unread ticks are overwritten and
+    counted in :attr:`dropped`.
+
+    Example::
+
+        buffer = TickBuffer(capacity=65_536)
+        ws = WsClient(WsClientOptions(..., tick_buffer=buffer))
+        async for batch in buffer.batches():
+            cols = batch.as_numpy()
+            spread = cols["ask"] - cols["bid"]
+
+    :param capacity: Number of ticks retained.
+    """
+
+    def __init__(self, capacity: int = 65_536) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self._capacity = capacity
+        self._instrument_id = array("q", bytes(8 * capacity))
+        self._bid = array("d", bytes(8 * capacity))
+        self._ask = array("d", bytes(8 * capacity))
+        self._last_execution = array("d", bytes(8 * capacity))
+        self._timestamp = array("d", bytes(8 * capacity))
+        self._price_rate_id = array("q", bytes(8 * capacity))
+        self._written = 0
+        self._read = 0
+        self._dropped = 0
+        self._waiter: asyncio.Future[None] | None = None
+
+    def write(
+        self,
+        instrument_id: int,
+        bid: float,
+        ask: float,
+        last_execution: float,
+        timestamp: float,
+        price_rate_id: int,
+    ) -> None:
+        """Append one tick, overwriting the oldest if the buffer is full."""
+        i = self._written % self._capacity
+        self._instrument_id[i] = instrument_id
+        self._bid[i] = bid
+        self._ask[i] = ask
+        self._last_execution[i] = last_execution
+        self._timestamp[i] = timestamp
+        self._price_rate_id[i] = price_rate_id
+        self._written += 1
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def read(self, max_items: int | None = None) -> TickBatch:
+        """Remove and return up to *max_items* unread ticks (all by default)."""
+        overrun = self._written - self._read - self._capacity
+        if overrun > 0:
+            self._dropped += overrun
+            self._read += overrun
+
+        end = self._written
+        if max_items is not None:
+            end = min(end, self._read + max_items)
+        start = self._read
+        self._read = end
+
+        offset = start % self._capacity
+        count = end - start
+        return TickBatch(
+            self._slice(self._instrument_id, offset, count),
+            self._slice(self._bid, offset, count),
+            self._slice(self._ask, offset, count),
+            self._slice(self._last_execution, offset, count),
+            self._slice(self._timestamp, offset, count),
+            self._slice(self._price_rate_id, offset, count),
+        )
+
+    def _slice(self, column: array[Any], offset: int, count: int) -> array[Any]:
+        end = offset + count
+        if end <= self._capacity:
+            return column[offset:end]
+        return column[offset:] + column[: end - self._capacity]
+
+    async def wait(self, timeout: float | None = None) -> bool:
+        """Wait until at least one unread tick is available.
+
+        :returns: ``False`` if *timeout* elapsed first.
+        """
+        if self.pending:
+            return True
+        if self._waiter is None or self._waiter.done():
+            self._waiter = asyncio.get_running_loop().create_future()
+        try:
+            await asyncio.wait_for(asyncio.shield(self._waiter), timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    async def batches(self, max_items: int | None = None) -> AsyncIterator[TickBatch]:
+        """Yield batches of unread ticks as they arrive, forever."""
+        while True:
+            await self.wait()
+            yield self.read(max_items)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def pending(self) -> int:
+        """Unread ticks currently held (at most :attr:`capacity`)."""
+        return min(self._written - self._read, self._capacity)
+
+    @property
+    def total_written(self) -> int:
+        return self._written
+
+    @property
+    def dropped(self) -> int:
+        """Ticks overwritten before they were read."""
+        return self._dropped + max(0, self._written - self._read - self._capacity)
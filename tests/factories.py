@@ -0,0 +1,118 @@
+"""Payload factories and client helpers shared by the unit tests."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from typing import Any
+
+import pytest
+
+from etoropy.config.settings import EToroConfig
+from etoropy.models.enums import OrderStatusId
+from etoropy.models.trading import OrderForOpenResponse, PortfolioResponse
+from etoropy.models.websocket import WsPrivateEvent
+from etoropy.trading.client import EToroTrading
+from etoropy.ws.client import WsClient
+
+
+def rate_message(instrument_id: int, *, bid: float, ask: float, **fields: Any) -> dict[str, Any]:
+    """An ``instrument:<id>`` rate message as found in a WebSocket frame; *fields* use the wire names."""
+    return {
+        "topic": f"instrument:{instrument_id}",
+        "content": json.dumps({"Bid": bid, "Ask": ask, **fields}),
+        "id": f"r{instrument_id}",
+        "type": "Trading.Instrument.Rate",
+    }
+
+
+def position_data(
+    position_id: int,
+    instrument_id: int,
+    *,
+    order_id: int | None = None,
+    units: float = 10.0,
+    amount: float | None = None,
+    leverage: int = 1,
+) -> dict[str, Any]:
+    """A portfolio ``positions`` entry opened at 100.0 (order ID defaults to ``position_id * 10``)."""
+    return {
+        "positionID": position_id,
+        "CID": 1,
+        "openDateTime": "2026-01-01T00:00:00Z",
+        "openRate": 100.0,
+        "instrumentID": instrument_id,
+        "isBuy": True,
+        "leverage": leverage,
+        "takeProfitRate": 0.0,
+        "stopLossRate": 0.0,
+        "amount": units * 100.0 if amount is None else amount,
+        "orderID": position_id * 10 if order_id is None else order_id,
+        "orderType": 1,
+        "units": units,
+    }
+
+
+def portfolio_response(
+    positions: Iterable[dict[str, Any]] = (),
+    orders: Iterable[dict[str, Any]] = (),
+    mirror_positions: Iterable[dict[str, Any]] | None = None,
+) -> PortfolioResponse:
+    """A portfolio snapshot, with one copy-trading mirror if *mirror_positions* is given."""
+    client: dict[str, Any] = {"positions": list(positions), "orders": list(orders)}
+    if mirror_positions is not None:
+        client["mirrors"] = [
+            {
+                "mirrorID": 9,
+                "CID": 1,
+                "parentCID": 2,
+                "stopLossPercentage": 0,
+                "isPaused": False,
+                "copyExistingPositions": False,
+                "availableAmount": 0,
+                "stopLossAmount": 0,
+                "initialInvestment": 0,
+                "depositSummary": 0,
+                "withdrawalSummary": 0,
+                "positions": list(mirror_positions),
+            }
+        ]
+    return PortfolioResponse.model_validate({"clientPortfolio": client})
+
+
+def private_event(order_id: int, status: OrderStatusId, **fields: Any) -> WsPrivateEvent:
+    """A ``private`` order event for instrument 1001; *fields* use the wire aliases."""
+    return WsPrivateEvent.model_validate(
+        {"OrderID": order_id, "OrderType": 1, "StatusID": status, "InstrumentID": 1001, "CID": 1, **fields}
+    )
+
+
+def opened_order(order_id: int, instrument_id: int = 1001) -> OrderForOpenResponse:
+    """The response to a market order accepted as *order_id*."""
+    return OrderForOpenResponse.model_validate(
+        {
+            "token": "t",
+            "orderForOpen": {
+                "instrumentID": instrument_id,
+                "amount": 100.0,
+                "isBuy": True,
+                "leverage": 1,
+                "orderID": order_id,
+                "orderType": 17,
+                "statusID": 1,
+                "CID": 1,
+            },
+        }
+    )
+
+
+def trading_client(monkeypatch: pytest.MonkeyPatch) -> tuple[EToroTrading, list[list[str]]]:
+    """An :class:`EToroTrading` whose WebSocket reports itself connected without a server.
+
+    Returns the client and the list that records its ``ws.subscribe()`` calls.
+    """
+    monkeypatch.setattr(WsClient, "is_connected", property(lambda self: True))
+    etoro = EToroTrading(EToroConfig(api_key="k", user_key="u"))
+    subscribed: list[list[str]] = []
+    monkeypatch.setattr(etoro.ws, "subscribe", lambda topics, snapshot=False: subscribed.append(topics))
+    return etoro, subscribed
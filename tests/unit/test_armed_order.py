@@ -0,0 +1,104 @@
+import importlib.util
+import json
+from collections.abc import Iterator
+
+import httpx
+import pytest
+import respx
+
+from etoropy import _json
+from etoropy.config.settings import EToroConfig
+from etoropy.errors.exceptions import EToroValidationError
+from etoropy.http.client import HttpClient
+from etoropy.models.trading import LimitOrderRequest, MarketOrderByAmountRequest, MarketOrderByUnitsRequest
+from etoropy.rest.trading_execution import TradingExecutionClient
+from etoropy.trading.client import EToroTrading, OrderOptions
+
+AVAILABLE = [name for name in ("orjson", "msgspec") if importlib.util.find_spec(name)] + ["json"]
+
+OPENED = {
+    "token": "t",
+    "orderForOpen": {
+        "instrumentID": 1001,
+        "amount": 100.0,
+        "isBuy": True,
+        "leverage": 1,
+        "orderID": 77,
+        "orderType": 17,
+        "statusID": 1,
+        "CID": 1,
+    },
+}
+
+
+@pytest.fixture(params=AVAILABLE)
+def backend(request: pytest.FixtureRequest) -> Iterator[str]:
+    previous = _json.backend
+    _json.use(request.param)
+    yield request.param
+    _json.use(previous)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_fire_sends_the_armed_body_with_overrides(backend: str, config: EToroConfig) -> None:
+    http = HttpClient(config, rate_limiter=False)
+    execution = TradingExecutionClient(http, "demo")
+    route = respx.post(f"{config.base_url}/api/v1/trading/execution/demo/market-open-orders/by-amount").mock(
+        return_value=httpx.Response(200, json=OPENED)
+    )
+    request = MarketOrderByAmountRequest(InstrumentID=1001, IsBuy=True, Leverage=2, Amount=100, StopLossRate=90.5)
+    armed = execution.arm_market_order(request)
+
+    response = await armed.fire()
+    assert response.order_for_open.order_id == 77
+    sent = route.calls.last.request
+    assert sent.content == armed.body
+    assert json.loads(sent.content) == request.model_dump(mode="json", by_alias=True, exclude_none=True)
+    assert sent.headers["x-api-key"] == "test-api-key"
+    assert sent.headers["Content-Type"] == "application/json"
+
+    await armed.fire(amount=250.25)
+    assert json.loads(route.calls.last.request.content) == {
+        "InstrumentID": 1001,
+        "IsBuy": True,
+        "Leverage": 2,
+        "Amount": 250.25,
+        "StopLossRate": 90.5,
+    }
+    await http.aclose()
+
+
+def test_render_fills_only_the_given_slots(backend: str, config: EToroConfig) -> None:
+    execution = TradingExecutionClient(HttpClient(config, rate_limiter=False), "real")
+    limit = execution.arm_limit_order(
+        LimitOrderRequest(
+            InstrumentID=1, IsBuy=False, Leverage=1, Amount=50, Rate=10.5, StopLossRate=0, TakeProfitRate=0
+        )
+    )
+    assert limit.path.endswith("/trading/execution/limit-orders")
+    assert json.loads(limit.render(rate=11.0)) | {"Rate": 10.5} == json.loads(limit.body)
+    assert json.loads(limit.render(amount=75, rate=11.0))["Amount"] == 75.0
+    assert json.loads(limit.render(amount=75, rate=11.0))["Rate"] == 11.0
+
+    units = execution.arm_market_order(
+        MarketOrderByUnitsRequest(InstrumentID=1, IsBuy=True, Leverage=1, AmountInUnits=3)
+    )
+    assert units.path.endswith("/by-units")
+    assert json.loads(units.render(amount=4))["AmountInUnits"] == 4.0
+
+    with pytest.raises(EToroValidationError):
+        units.render(rate=1.0)
+    for bad in (0.0, -5.0, float("nan"), float("inf")):
+        with pytest.raises(EToroValidationError):
+            limit.render(amount=bad)
+
+
+@pytest.mark.asyncio
+async def test_trading_client_arms_resolved_orders(config: EToroConfig) -> None:
+    etoro = EToroTrading(config)
+    armed = await etoro.arm_market_order(1001, is_buy=False, units=2.5, options=OrderOptions(leverage=5))
+    assert json.loads(armed.body) == {"InstrumentID": 1001, "IsBuy": False, "Leverage": 5, "AmountInUnits": 2.5}
+    with pytest.raises(EToroValidationError):
+        await etoro.arm_market_order(1001, is_buy=True)
+    await etoro.rest.aclose()
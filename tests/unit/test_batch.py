@@ -0,0 +1,181 @@
+import asyncio
+
+import pytest
+
+from etoropy.config.settings import EToroConfig
+from etoropy.errors.exceptions import EToroApiError, EToroBatchError, EToroValidationError
+from etoropy.models.common import TokenResponse
+from etoropy.models.enums import OrderStatusId
+from etoropy.models.trading import (
+    ClosePositionRequest,
+    MarketOrderByAmountRequest,
+    OrderForCloseResponse,
+    OrderForOpenResponse,
+    PortfolioResponse,
+)
+from etoropy.models.websocket import WsPrivateEvent
+from etoropy.trading.batch import CancelOrder, ClosePosition, MarketOrder
+from etoropy.trading.client import EToroTrading
+from etoropy.ws.simulator import FeedSimulator
+from tests.factories import opened_order, portfolio_response, position_data
+
+
+@pytest.mark.asyncio
+async def test_batch_is_bounded_and_reports_each_item(monkeypatch: pytest.MonkeyPatch) -> None:
+    etoro = EToroTrading(EToroConfig(api_key="k", user_key="u", rate_limit_max_requests=4))
+    in_flight = 0
+    peak = 0
+
+    async def request(order_id: int) -> TokenResponse:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.002)
+        in_flight -= 1
+        if order_id % 10 == 3:
+            raise EToroApiError(f"order {order_id} not found", 404)
+        return TokenResponse(token=str(order_id))
+
+    monkeypatch.setattr(etoro.rest.execution, "cancel_market_open_order", request)
+    monkeypatch.setattr(etoro.rest.execution, "cancel_limit_order", request)
+
+    assert etoro.batch_concurrency == 4
+    result = await etoro.execute_batch([CancelOrder(i, limit=i % 2 == 0) for i in range(40)])
+
+    assert peak == 4
+    assert [item.index for item in result.items] == list(range(40))
+    assert len(result.succeeded) == 36
+    assert [item.op.order_id for item in result.failed] == [3, 13, 23, 33]  # type: ignore[union-attr]
+    assert isinstance(result.failed[0].error, EToroApiError)
+    assert result.throughput > 0
+    with pytest.raises(EToroBatchError, match="4 of 40") as exc_info:
+        result.raise_for_errors()
+    assert exc_info.value.result is result
+    assert exc_info.value.__cause__ is result.failed[0].error
+    await etoro.rest.aclose()
+
+
+@pytest.mark.asyncio
+async def test_close_all_positions_includes_mirrors_and_survives_failures(monkeypatch: pytest.MonkeyPatch) -> None:
+    etoro = EToroTrading(EToroConfig(api_key="k", user_key="u"))
+    closed: list[tuple[int, int]] = []
+
+    async def get_portfolio() -> PortfolioResponse:
+        return portfolio_response(
+            [position_data(1, 1001), position_data(2, 1002)], mirror_positions=[position_data(9, 1009)]
+        )
+
+    async def close_position(position_id: int, request: ClosePositionRequest) -> OrderForCloseResponse:
+        if position_id == 2:
+            raise EToroApiError("market closed", 400)
+        closed.append((position_id, request.instrument_id))
+        return OrderForCloseResponse(token="t")
+
+    monkeypatch.setattr(etoro.rest.info, "get_portfolio", get_portfolio)
+    monkeypatch.setattr(etoro.rest.execution, "close_position", close_position)
+
+    with pytest.raises(EToroBatchError, match="1 of 2") as exc_info:
+        await etoro.close_all_positions()
+    assert closed == [(1, 1001)]
+    assert [item.op.position_id for item in exc_info.value.result.failed] == [2]  # type: ignore[union-attr]
+
+    closed.clear()
+    result = await etoro.close_all_positions(raise_on_error=False)
+    assert closed == [(1, 1001)]
+    assert [item.op.position_id for item in result.failed] == [2]  # type: ignore[union-attr]
+
+    closed.clear()
+    result = await etoro.close_all_positions(include_mirrors=True, raise_on_error=False)
+    assert closed == [(1, 1001), (9, 1009)]
+    assert len(result.items) == 3
+
+    # Without an instrument ID the position is looked up first.
+    closed.clear()
+    result = await etoro.execute_batch([ClosePosition(9, units_to_deduct=1.0), ClosePosition(404)])
+    assert closed == [(9, 1009)]
+    assert isinstance(result.items[1].error, EToroValidationError)
+    await etoro.rest.aclose()
+
+
+@pytest.mark.asyncio
+async def test_cancel_all_raises_after_every_cancel_ran(monkeypatch: pytest.MonkeyPatch) -> None:
+    etoro = EToroTrading(EToroConfig(api_key="k", user_key="u"))
+    cancelled: list[int] = []
+
+    def pending(order_id: int) -> dict[str, object]:
+        return {
+            "orderID": order_id,
+            "CID": 1,
+            "openDateTime": "2026-01-01T00:00:00Z",
+            "instrumentID": 1001,
+            "isBuy": True,
+            "takeProfitRate": 0.0,
+            "stopLossRate": 0.0,
+            "rate": 100.0,
+            "amount": 100.0,
+            "leverage": 1,
+            "units": 1.0,
+        }
+
+    async def get_portfolio() -> PortfolioResponse:
+        return PortfolioResponse.model_validate({"clientPortfolio": {"ordersForOpen": [pending(5), pending(6)]}})
+
+    async def cancel_market_open_order(order_id: int) -> TokenResponse:
+        if order_id == 5:
+            raise EToroApiError("already filled", 400)
+        cancelled.append(order_id)
+        return TokenResponse(token="t")
+
+    monkeypatch.setattr(etoro.rest.info, "get_portfolio", get_portfolio)
+    monkeypatch.setattr(etoro.rest.execution, "cancel_market_open_order", cancel_market_open_order)
+
+    with pytest.raises(EToroBatchError, match="1 of 2"):
+        await etoro.cancel_all_orders()
+    assert cancelled == [6]
+
+    result = await etoro.cancel_all_orders(raise_on_error=False)
+    assert len(result.failed) == 1
+    await etoro.rest.aclose()
+
+
+@pytest.mark.asyncio
+async def test_market_orders_wait_for_fills(monkeypatch: pytest.MonkeyPatch) -> None:
+    async with FeedSimulator() as sim:
+        etoro = EToroTrading(EToroConfig(api_key="k", user_key="u", ws_url=sim.url))
+        submitted: list[MarketOrderByAmountRequest] = []
+
+        async def open_by_amount(request: MarketOrderByAmountRequest) -> OrderForOpenResponse:
+            submitted.append(request)
+            return opened_order(len(submitted))
+
+        async def never(order_id: int) -> None:
+            raise AssertionError("should not poll")
+
+        monkeypatch.setattr(etoro.rest.execution, "open_market_order_by_amount", open_by_amount)
+        monkeypatch.setattr(etoro.rest.info, "get_order", never)
+        await etoro.connect()
+
+        task = asyncio.create_task(
+            etoro.execute_batch([MarketOrder(1001, amount=100, is_buy=i == 0) for i in range(3)], wait_for_fills=True)
+        )
+        while len(submitted) < 3:
+            await asyncio.sleep(0.001)
+        for order_id, status in ((1, OrderStatusId.EXECUTED), (2, OrderStatusId.FAILED), (3, OrderStatusId.EXECUTED)):
+            event = WsPrivateEvent.model_validate(
+                {"OrderID": order_id, "OrderType": 17, "StatusID": status, "InstrumentID": 1001, "CID": 1}
+            )
+            etoro.ws._emit("private:event", event)
+        result = await task
+
+        assert [r.is_buy for r in submitted] == [True, False, False]
+        assert [item.fill.order_id if item.fill else None for item in result.items] == [1, None, 3]
+        assert result.items[1].response is not None
+        assert "FAILED" in str(result.items[1].error)
+        await etoro.disconnect()
+
+
+def test_market_order_needs_amount_or_units() -> None:
+    with pytest.raises(EToroValidationError):
+        MarketOrder("AAPL")
+    with pytest.raises(EToroValidationError):
+        MarketOrder("AAPL", amount=1.0, units=1.0)
@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+from etoropy.config.settings import EToroConfig
+from etoropy.trading.client import EToroTrading
+from etoropy.trading.conflation import TickConflator
+from tests.factories import rate_message
+
+
+@pytest.mark.asyncio
+async def test_delivers_latest_per_key_once_per_interval() -> None:
+    delivered: list[tuple[int, float]] = []
+    conflator: TickConflator[float] = TickConflator(0.02, lambda key, item: delivered.append((key, item)))
+
+    for i in range(100):
+        conflator.put(1001, float(i))
+        conflator.put(1002, -float(i))
+    assert delivered == []
+
+    await asyncio.sleep(0.05)
+
+    assert delivered == [(1001, 99.0), (1002, -99.0)]
+    assert conflator.stats.dropped == 198
+    assert conflator.stats.delivered == 2
+    assert conflator.stats.high_water == 2
+
+
+@pytest.mark.asyncio
+async def test_flush_and_discard() -> None:
+    delivered: list[int] = []
+    conflator: TickConflator[int] = TickConflator(60, lambda key, item: delivered.append(key))
+    conflator.put(1, 1)
+    conflator.put(2, 2)
+
+    conflator.discard([1])
+    conflator.flush()
+
+    assert delivered == [2]
+    assert len(conflator) == 0
+
+
+def test_interval_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        TickConflator(0, lambda key, item: None)
+
+
+@pytest.mark.asyncio
+async def test_stream_prices_conflates_price_events(monkeypatch: pytest.MonkeyPatch) -> None:
+    etoro = EToroTrading(EToroConfig(api_key="k", user_key="u"))
+    monkeypatch.setattr(etoro.ws, "subscribe", lambda topics, snapshot=False: None)
+    prices: list[tuple[int, float]] = []
+    etoro.on("price", lambda symbol, instrument_id, rate: prices.append((instrument_id, rate.bid)))
+
+    await etoro.stream_prices([1001], conflate_interval=0.02)
+    for i in range(50):
+        etoro.ws._dispatch_messages([rate_message(1001, ask=i + 0.1, bid=float(i))])
+    etoro.ws._dispatch_messages([rate_message(1002, ask=5.0, bid=4.9)])
+
+    assert prices == [(1002, 4.9)]
+    quote = etoro.quotes.get(1001)
+    assert quote is not None and quote.bid == 49.0
+
+    await asyncio.sleep(0.05)
+
+    assert prices == [(1002, 4.9), (1001, 49.0)]
+    assert etoro.conflation_stats.dropped == 49
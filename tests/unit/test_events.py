@@ -0,0 +1,190 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from etoropy._events import EventEmitter, LatencyHistogram
+from etoropy.errors.exceptions import EToroHandlerError
+
+
+@pytest.mark.asyncio
+async def test_async_handlers_are_awaited() -> None:
+    emitter = EventEmitter()
+    received: list[int] = []
+
+    async def handler(value: int) -> None:
+        await asyncio.sleep(0)
+        received.append(value)
+
+    emitter.on("tick", handler)
+    emitter.once("tick", handler)
+    emitter._emit("tick", 1)
+    emitter._emit("tick", 2)
+    assert emitter.pending_handlers == 3
+
+    await emitter.wait_for_handlers()
+
+    assert sorted(received) == [1, 1, 2]
+    assert emitter.pending_handlers == 0
+    assert [s.mode for s in emitter.handler_stats("tick")] == ["async"]
+
+
+@pytest.mark.asyncio
+async def test_async_handler_concurrency_is_bounded() -> None:
+    emitter = EventEmitter(max_concurrent_handlers=2)
+    running = 0
+    peak = 0
+
+    async def handler() -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    emitter.on("tick", handler)
+    for _ in range(6):
+        emitter._emit("tick")
+    await emitter.wait_for_handlers()
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_async_handler_backlog_is_bounded() -> None:
+    emitter = EventEmitter(max_concurrent_handlers=1, max_pending_handlers=2)
+    calls: list[int] = []
+    release = asyncio.Event()
+
+    async def handler(value: int) -> None:
+        calls.append(value)
+        await release.wait()
+
+    emitter.on("tick", handler)
+    for value in range(5):
+        emitter._emit("tick", value)
+    await asyncio.sleep(0)
+
+    # One running, two waiting -- and the waiting ones not even called yet.
+    assert calls == [0]
+    assert emitter.pending_handlers == 3
+    assert emitter.handler_stats("tick")[0].dropped == 2
+
+    release.set()
+    await emitter.wait_for_handlers()
+    assert calls == [0, 3, 4]
+    assert emitter.pending_handlers == 0
+
+
+@pytest.mark.asyncio
+async def test_async_handler_errors_are_logged(caplog: pytest.LogCaptureFixture) -> None:
+    emitter = EventEmitter()
+
+    async def handler() -> None:
+        raise RuntimeError("boom")
+
+    emitter.on("tick", handler)
+    emitter._emit("tick")
+    await emitter.wait_for_handlers()
+
+    assert "boom" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_executor_handlers_run_off_loop() -> None:
+    emitter = EventEmitter()
+    threads: list[str] = []
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="handler")
+
+    def handler(value: int) -> None:
+        threads.append(threading.current_thread().name)
+
+    emitter.on("tick", handler, executor=pool)
+    emitter.on("tick", handler, executor="thread")
+    emitter._emit("tick", 1)
+    await emitter.wait_for_handlers()
+    pool.shutdown()
+
+    assert len(threads) == 2
+    assert threading.main_thread().name not in threads
+    assert [s.mode for s in emitter.handler_stats()] == ["executor", "executor"]
+    assert all(s.latency.count == 1 for s in emitter.handler_stats())
+
+
+def test_handler_latency_is_recorded_per_handler() -> None:
+    emitter = EventEmitter()
+
+    def fast() -> None:
+        pass
+
+    def slow() -> None:
+        time.sleep(0.002)
+
+    emitter.on("tick", fast).on("tick", slow)
+    for _ in range(5):
+        emitter._emit("tick")
+
+    stats = {s.handler.rsplit(".", 1)[-1]: s for s in emitter.handler_stats()}
+    assert stats["fast"].latency.count == stats["slow"].latency.count == 5
+    assert stats["slow"].latency.mean_us > stats["fast"].latency.mean_us
+    assert stats["slow"].latency.percentile(50) >= 2000
+
+
+def test_histogram_percentiles() -> None:
+    hist = LatencyHistogram()
+    for ns in [100] * 98 + [1_000_000, 5_000_000]:
+        hist.record(ns)
+
+    assert hist.count == 100
+    assert hist.percentile(50) == 0.128  # bucket upper bound: 2**7 ns
+    assert hist.percentile(99) == pytest.approx(1_048.576)
+    assert hist.percentile(100) == 5_000.0
+    assert hist.max_us == 5_000.0
+
+
+def test_failing_handler_is_isolated_and_reported() -> None:
+    emitter = EventEmitter()
+    received: list[int] = []
+    errors: list[Exception] = []
+
+    def broken(value: int) -> None:
+        raise ValueError("bad strategy")
+
+    emitter.on("tick", broken).on("tick", received.append).on("error", errors.append)
+    emitter._emit("tick", 1)
+    emitter._emit("tick", 2)
+
+    assert received == [1, 2]
+    assert len(errors) == 2
+    assert isinstance(errors[0], EToroHandlerError)
+    assert errors[0].event == "tick"
+    assert errors[0].handler.endswith("broken")
+    assert isinstance(errors[0].__cause__, ValueError)
+    assert [s.errors for s in emitter.handler_stats("tick")] == [2, 0]
+
+
+def test_failing_error_handler_is_logged(caplog: pytest.LogCaptureFixture) -> None:
+    emitter = EventEmitter()
+
+    def broken(*args: object) -> None:
+        raise RuntimeError("boom")
+
+    emitter.on("tick", broken).on("error", broken)
+    emitter._emit("tick")
+
+    assert "boom" in caplog.text
+
+
+def test_dispatch_latency_per_event() -> None:
+    emitter = EventEmitter()
+    emitter.on("a", lambda: None).on("b", lambda: time.sleep(0.001))
+    emitter._emit("a")
+    emitter._emit("b")
+    emitter._emit("b")
+
+    stats = emitter.dispatch_stats()
+    assert stats["a"].count == 1
+    assert stats["b"].count == 2
+    assert stats["b"].max_us >= 1000
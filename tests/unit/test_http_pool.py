@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+from collections.abc import AsyncIterator
+
+import httpx
+import pytest
+
+from etoropy.config.settings import EToroConfig
+from etoropy.http.client import HttpClient, RequestOptions
+
+
+class KeepAliveServer:
+    """Minimal HTTP/1.1 keep-alive server that counts accepted connections."""
+
+    def __init__(self, delay_s: float = 0.005) -> None:
+        self.delay_s = delay_s
+        self.connections = 0
+        self.requests = 0
+        self._server: asyncio.Server | None = None
+
+    @property
+    def base_url(self) -> str:
+        assert self._server is not None
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+
+    async def stop(self) -> None:
+        assert self._server is not None
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                self.requests += 1
+                await asyncio.sleep(self.delay_s)
+                body = b"{}" if not head.startswith(b"HEAD") else b""
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: 2\r\n\r\n" + body)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.fixture
+async def server() -> AsyncIterator[KeepAliveServer]:
+    srv = KeepAliveServer()
+    await srv.start()
+    yield srv
+    await srv.stop()
+
+
+def _config(base_url: str, **overrides: object) -> EToroConfig:
+    return EToroConfig(api_key="k", user_key="u", base_url=base_url, rate_limit=False, **overrides)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_fan_out_stays_within_pool_size(server: KeepAliveServer) -> None:
+    client = HttpClient(_config(server.base_url, http_max_connections=4, http_max_keepalive_connections=4))
+
+    await asyncio.gather(
+        *(client.request(RequestOptions(method="GET", path="/rates", query={"id": i})) for i in range(40))
+    )
+
+    stats = client.connection_stats
+    assert server.connections <= 4
+    assert stats.requests == 40
+    assert stats.connections_opened == server.connections
+    assert stats.reused_requests >= 36
+    assert stats.reuse_ratio >= 0.9
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_opens_connections_ahead_of_requests(server: KeepAliveServer) -> None:
+    client = HttpClient(_config(server.base_url, http_prewarm_connections=3))
+
+    await client.warm_up()
+    assert server.connections == 3
+    assert client.connection_stats.prewarmed_connections == 3
+    assert client.connection_stats.requests == 0
+
+    await asyncio.gather(
+        *(client.request(RequestOptions(method="GET", path="/rates", query={"id": i})) for i in range(3))
+    )
+    assert server.connections == 3
+    stats = client.connection_stats
+    assert (stats.requests, stats.connections_opened) == (3, 0)
+    assert stats.reuse_ratio == 1.0
+    await client.aclose()
+
+
+def test_pool_settings_come_from_config() -> None:
+    client = HttpClient(
+        _config(
+            "https://example.invalid",
+            timeout=30.0,
+            connect_timeout=2.0,
+            pool_timeout=1.0,
+            http_max_connections=8,
+        )
+    )
+    timeout = client._client.timeout
+    assert isinstance(timeout, httpx.Timeout)
+    assert (timeout.connect, timeout.read, timeout.write, timeout.pool) == (2.0, 30.0, 30.0, 1.0)
+
+
+@pytest.mark.skipif(importlib.util.find_spec("h2") is not None, reason="h2 is installed")
+def test_http2_without_h2_falls_back(caplog: pytest.LogCaptureFixture) -> None:
+    client = HttpClient(_config("https://example.invalid", http2=True))
+    assert client._http2 is False
+    assert "h2" in caplog.text
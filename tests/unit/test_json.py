@@ -0,0 +1,80 @@
+import importlib.util
+import json
+import sys
+from collections.abc import Iterator
+
+import httpx
+import pytest
+import respx
+
+from etoropy import _json
+from etoropy.config.settings import EToroConfig
+from etoropy.http.client import HttpClient, RequestOptions
+from etoropy.models.trading import MarketOrderByAmountRequest
+
+AVAILABLE = [name for name in ("orjson", "msgspec") if importlib.util.find_spec(name)] + ["json"]
+
+
+@pytest.fixture(params=AVAILABLE)
+def backend(request: pytest.FixtureRequest) -> Iterator[str]:
+    previous = _json.backend
+    _json.use(request.param)
+    yield request.param
+    _json.use(previous)
+
+
+def test_round_trip(backend: str) -> None:
+    doc = {"a": [1, 2.5, None, True], "s": "é€", "nested": {"k": "v"}}
+
+    assert _json.loads(_json.dumps(doc)) == doc
+    assert _json.loads(_json.dumps_bytes(doc)) == doc
+    assert _json.dumps({"a": 1}) == '{"a":1}'
+    assert _json.backend == backend
+
+
+def test_decode_errors_are_raised(backend: str) -> None:
+    with pytest.raises(Exception):  # noqa: B017 -- backend-specific error types
+        _json.loads("{not json")
+
+
+def test_unknown_backend_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        _json.use("yaml")
+
+
+@pytest.mark.parametrize("forced", ["yaml", "msgspec"])
+def test_bad_env_backend_falls_back_to_stdlib(
+    forced: str, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    previous = _json.backend
+    monkeypatch.setenv("ETORO_JSON_BACKEND", forced)
+    monkeypatch.setitem(sys.modules, "msgspec", None)
+    try:
+        with caplog.at_level("WARNING", logger="etoropy"):
+            _json._auto_detect()
+        assert _json.backend == "json"
+        assert "ETORO_JSON_BACKEND" in caplog.text
+    finally:
+        _json.use(previous)
+
+
+def test_missing_backend_is_rejected_when_chosen_explicitly(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    with pytest.raises(ImportError):
+        _json.use("orjson")
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_http_client_uses_backend_for_bodies(backend: str, config: EToroConfig) -> None:
+    client = HttpClient(config, rate_limiter=False)
+    route = respx.post(f"{config.base_url}/api/v1/orders").mock(return_value=httpx.Response(200, json={"ok": 1}))
+
+    body = MarketOrderByAmountRequest(InstrumentID=1001, IsBuy=True, Leverage=1, Amount=100)
+    result = await client.request(RequestOptions(method="POST", path="/api/v1/orders", body=body))
+
+    assert result == {"ok": 1}
+    sent = json.loads(route.calls.last.request.content)
+    assert sent == {"InstrumentID": 1001, "IsBuy": True, "Leverage": 1, "Amount": 100}
+    assert route.calls.last.request.headers["Content-Type"] == "application/json"
+    await client.aclose()
@@ -0,0 +1,121 @@
+import asyncio
+
+import pytest
+
+from etoropy.config.settings import EToroConfig
+from etoropy.errors.exceptions import EToroError
+from etoropy.models.enums import OrderStatusId
+from etoropy.models.trading import OrderForOpenInfoResponse
+from etoropy.trading.client import EToroTrading
+from etoropy.trading.order_tracker import OrderTracker
+from etoropy.ws.simulator import FeedSimulator
+from tests.factories import private_event
+
+
+def _info(order_id: int, status: OrderStatusId) -> OrderForOpenInfoResponse:
+    return OrderForOpenInfoResponse.model_validate(
+        {
+            "token": "t",
+            "orderID": order_id,
+            "CID": 1,
+            "statusID": status,
+            "orderType": 1,
+            "instrumentID": 1001,
+            "amount": 100.0,
+            "units": 1.0,
+            "positions": [],
+        }
+    )
+
+
+async def _never(order_id: int) -> OrderForOpenInfoResponse:
+    raise AssertionError("should not poll")
+
+
+@pytest.mark.asyncio
+async def test_many_waits_resolve_from_events() -> None:
+    tracker = OrderTracker(_never, grace=10.0)
+    waits = [asyncio.create_task(tracker.wait(order_id, timeout=1.0)) for order_id in range(50)]
+    await asyncio.sleep(0)
+    assert len(tracker) == 50
+
+    for order_id in reversed(range(50)):
+        tracker.on_event(private_event(order_id, OrderStatusId.FILLING))
+        tracker.on_event(private_event(order_id, OrderStatusId.EXECUTED, PositionID=order_id))
+    results = await asyncio.gather(*waits)
+
+    assert [r.position_id for r in results] == list(range(50))
+    assert tracker.stats.resolved_by_event == 50
+    assert len(tracker) == 0
+
+
+@pytest.mark.asyncio
+async def test_terminal_event_before_wait_resolves_without_polling() -> None:
+    tracker = OrderTracker(_never, grace=0.0)
+    tracker.on_event(private_event(7, OrderStatusId.EXECUTED))
+
+    assert (await tracker.wait(7, timeout=1.0)).order_id == 7
+
+
+@pytest.mark.asyncio
+async def test_failures_and_timeouts_raise() -> None:
+    tracker = OrderTracker(_never, grace=10.0)
+    failing = asyncio.create_task(tracker.wait(1, timeout=1.0))
+    await asyncio.sleep(0)
+    tracker.on_event(private_event(1, OrderStatusId.FAILED, ErrorMessage="insufficient funds", ErrorCode=12))
+
+    with pytest.raises(EToroError, match="FAILED: insufficient funds"):
+        await failing
+    with pytest.raises(EToroError, match="Timeout"):
+        await tracker.wait(2, timeout=0.01)
+    assert len(tracker) == 0
+
+
+@pytest.mark.asyncio
+async def test_fallback_polling_is_shared_bounded_and_backed_off() -> None:
+    in_flight = 0
+    peak = 0
+    polled: dict[int, list[float]] = {}
+    executed: set[int] = set()
+
+    async def get_order(order_id: int) -> OrderForOpenInfoResponse:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        polled.setdefault(order_id, []).append(asyncio.get_running_loop().time())
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        status = OrderStatusId.EXECUTED if order_id in executed else OrderStatusId.PENDING
+        return _info(order_id, status)
+
+    tracker = OrderTracker(get_order, grace=0.0, poll_interval=0.01, max_poll_interval=0.04, max_polls_per_round=3)
+    waits = [asyncio.create_task(tracker.wait(order_id, timeout=2.0)) for order_id in range(10)]
+    await asyncio.sleep(0.15)
+    executed.update(range(10))
+    results = await asyncio.gather(*waits)
+
+    assert [r.order_id for r in results] == list(range(10))
+    assert peak <= 3
+    assert tracker.stats.resolved_by_poll == 10
+    gaps = [b - a for a, b in zip(polled[0], polled[0][1:], strict=False)]
+    assert gaps[-1] > gaps[0]
+
+
+@pytest.mark.asyncio
+async def test_trading_client_shares_one_tracker(monkeypatch: pytest.MonkeyPatch) -> None:
+    async with FeedSimulator() as sim:
+        etoro = EToroTrading(EToroConfig(api_key="k", user_key="u", ws_url=sim.url))
+        monkeypatch.setattr(etoro.rest.info, "get_order", _never)
+        await etoro.connect()
+        handlers = etoro.ws.listener_count("private:event")
+
+        waits = [asyncio.create_task(etoro.wait_for_order(order_id, timeout_s=5.0)) for order_id in range(20)]
+        await asyncio.sleep(0.01)
+        for order_id in range(20):
+            etoro.ws._emit("private:event", private_event(order_id, OrderStatusId.EXECUTED))
+        await asyncio.gather(*waits)
+
+        assert etoro.ws.listener_count("private:event") == handlers
+        assert etoro.ws.is_subscribed("private")
+        assert sim.subscriptions[sim.connections[0]] == ["private"]
+        await etoro.disconnect()
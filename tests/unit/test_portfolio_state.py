@@ -0,0 +1,151 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from etoropy.config.settings import EToroConfig
+from etoropy.models.enums import OrderStatusId, OrderType
+from etoropy.models.trading import ClosePositionRequest, PortfolioResponse
+from etoropy.trading.client import EToroTrading
+from etoropy.trading.portfolio_state import PortfolioState
+from etoropy.ws.simulator import FeedSimulator
+from tests.factories import portfolio_response, position_data, private_event
+
+_MIRROR = [position_data(900, 1001, order_id=9000)]
+
+
+def _order(order_id: int, instrument_id: int) -> dict[str, Any]:
+    return {
+        "orderID": order_id,
+        "CID": 1,
+        "openDateTime": "2026-01-01T00:00:00Z",
+        "instrumentID": instrument_id,
+        "isBuy": False,
+        "takeProfitRate": 120.0,
+        "stopLossRate": 80.0,
+        "rate": 101.0,
+        "amount": 500.0,
+        "leverage": 2,
+        "units": 5.0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_events_keep_the_mirror_current() -> None:
+    async def fetch() -> PortfolioResponse:
+        return portfolio_response(
+            [position_data(1, 1001, order_id=11), position_data(2, 1002, order_id=12)],
+            [_order(50, 1001)],
+            mirror_positions=_MIRROR,
+        )
+
+    state = PortfolioState(fetch)
+    await state.sync()
+    assert [p.position_id for p in state.positions(1001)] == [1]
+    assert state.position(900) is not None  # mirror position
+    assert [o.order_id for o in state.pending_orders(1001)] == [50]
+
+    # The limit order fills into a new position that inherits its settings.
+    state.apply(private_event(50, OrderStatusId.EXECUTED, PositionID=3, ExecutedUnits=5.0, Rate=101.5))
+    opened = state.position(3)
+    assert opened is not None
+    assert (opened.open_rate, opened.is_buy, opened.leverage, opened.stop_loss_rate) == (101.5, False, 2, 80.0)
+    assert state.order(50) is None
+    # Re-delivered open event is idempotent.
+    state.apply(private_event(50, OrderStatusId.EXECUTED, PositionID=3, ExecutedUnits=5.0))
+    assert len(state.positions(1001)) == 2
+
+    # Partial then full close through separate close orders.
+    state.apply(private_event(60, OrderStatusId.EXECUTED, PositionID=1, ExecutedUnits=4.0))
+    assert state.position(1).units == 6.0  # type: ignore[union-attr]
+    state.apply(private_event(61, OrderStatusId.EXECUTED, PositionID=1, ExecutedUnits=6.0, CloseReason="Manual"))
+    assert state.position(1) is None
+    assert [p.position_id for p in state.positions(1001)] == [3]
+
+    # New pending order, then cancelled.
+    state.apply(private_event(70, OrderStatusId.PENDING, OrderType=OrderType.LIMIT, RequestedUnits=1.0))
+    assert [o.order_id for o in state.limit_orders()] == [70]
+    state.apply(private_event(70, OrderStatusId.CANCELLED))
+    assert state.pending_orders() == []
+
+    # Pending close orders and unknown order types are not pending opens.
+    state.apply(private_event(71, OrderStatusId.PENDING, PositionID=3))
+    state.apply(private_event(72, OrderStatusId.PENDING, OrderType=18))
+    assert state.pending_orders() == []
+
+    # Closing a copied position removes it from the mirror positions.
+    state.apply(private_event(80, OrderStatusId.EXECUTED, PositionID=900, ExecutedUnits=10.0))
+    assert state.position(900) is None
+    assert state.mirror_positions() == []
+
+
+@pytest.mark.asyncio
+async def test_events_during_sync_are_replayed_and_drift_is_reported() -> None:
+    release = asyncio.Event()
+    snapshots = [
+        portfolio_response([position_data(1, 1001, order_id=11)], mirror_positions=_MIRROR),
+        portfolio_response(
+            [position_data(1, 1001, order_id=11), position_data(5, 1005, order_id=15)], mirror_positions=_MIRROR
+        ),
+    ]
+
+    async def fetch() -> PortfolioResponse:
+        await release.wait()
+        return snapshots.pop(0)
+
+    state = PortfolioState(fetch)
+    release.set()
+    await state.sync()
+
+    release.clear()
+    task = asyncio.create_task(state.sync())
+    await asyncio.sleep(0)
+    # Position 1 closes while the (stale) snapshot is in flight.
+    state.apply(private_event(20, OrderStatusId.EXECUTED, PositionID=1, ExecutedUnits=10.0))
+    release.set()
+    await task
+
+    assert state.position(1) is None
+    assert state.position(5) is not None
+    assert state.stats.drift == 1
+    assert state.stats.syncs == 2
+
+
+@pytest.mark.asyncio
+async def test_trading_client_closes_from_the_mirror(monkeypatch: pytest.MonkeyPatch) -> None:
+    async with FeedSimulator() as sim:
+        config = EToroConfig(
+            api_key="k", user_key="u", ws_url=sim.url, portfolio_mirror=True, portfolio_reconcile_interval=0
+        )
+        etoro = EToroTrading(config)
+        fetches = 0
+        closed: list[tuple[int, int]] = []
+
+        async def get_portfolio() -> PortfolioResponse:
+            nonlocal fetches
+            fetches += 1
+            return portfolio_response(
+                [position_data(1, 1001, order_id=11), position_data(2, 1002, order_id=12)], mirror_positions=_MIRROR
+            )
+
+        async def close_position(position_id: int, request: ClosePositionRequest) -> None:
+            closed.append((position_id, request.instrument_id))
+
+        monkeypatch.setattr(etoro.rest.info, "get_portfolio", get_portfolio)
+        monkeypatch.setattr(etoro.rest.execution, "close_position", close_position)
+        await etoro.connect()
+
+        await etoro.close_position(1)
+        await etoro.close_position(2)
+        await etoro.close_position(900)
+        assert fetches == 1
+        assert closed == [(1, 1001), (2, 1002), (900, 1001)]
+
+        etoro.ws._emit("private:event", private_event(30, OrderStatusId.EXECUTED, PositionID=1, ExecutedUnits=10.0))
+        assert [p.position_id for p in await etoro.get_positions()] == [2]
+        assert fetches == 1
+
+        etoro.ws._emit("resync", "reconnect", ["private"])
+        await etoro.get_positions()
+        assert fetches == 2
+        await etoro.disconnect()
@@ -0,0 +1,84 @@
+import httpx
+import pytest
+import respx
+
+from etoropy.config.settings import EToroConfig
+from etoropy.trading.client import EToroTrading
+from etoropy.ws.quote_book import QuoteBook
+from tests.factories import rate_message, trading_client
+
+
+def test_update_and_get() -> None:
+    book = QuoteBook(max_age=60)
+    book.update(1001, 1.5, 1.6, 1.55, 7, "2026-01-01")
+    book.update(1002, 9.0, 9.1)
+    book.update(1001, 1.7, 1.8, price_rate_id=8)
+
+    quote = book.get(1001)
+
+    assert quote is not None
+    assert (quote.bid, quote.ask, quote.price_rate_id) == (1.7, 1.8, 8)
+    assert quote.age >= 0
+    assert len(book) == 2 and 1002 in book
+    assert book.get(9999) is None
+
+
+def test_stale_and_invalidated_quotes_are_not_served() -> None:
+    book = QuoteBook(max_age=60)
+    book.update(1001, 1.5, 1.6)
+    book.update(1002, 9.0, 9.1)
+
+    assert book.get(1001, max_age=-1) is None
+
+    book.invalidate([1001])
+    assert book.get(1001) is None
+    assert book.get(1002) is not None
+    assert book.peek(1001) is not None
+
+    book.invalidate()
+    assert book.get(1002) is None
+
+
+def test_stream_updates_quote_book_without_price_listeners(monkeypatch: pytest.MonkeyPatch) -> None:
+    etoro, _ = trading_client(monkeypatch)
+
+    etoro.ws._dispatch_messages([rate_message(1001, bid=1.9, ask=2.0, PriceRateID=3)])
+
+    quote = etoro.quotes.get(1001)
+    assert quote is not None and (quote.bid, quote.ask, quote.price_rate_id) == (1.9, 2.0, 3)
+    # The book is fed from the decoded frame; no rate models are built for it.
+    assert etoro.ws.listener_count("instrument:rate") == 0
+
+
+def test_quote_book_is_off_with_zero_max_age() -> None:
+    etoro = EToroTrading(EToroConfig(api_key="k", user_key="u", quote_max_age=0))
+    etoro.ws._dispatch_messages([rate_message(1001, bid=1.9, ask=2.0)])
+    assert etoro.ws.quote_book is None
+    assert 1001 not in etoro.quotes
+
+
+@pytest.mark.asyncio
+async def test_get_quotes_reads_the_book_in_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    etoro, _ = trading_client(monkeypatch)
+    etoro.ws._dispatch_messages([rate_message(1001, bid=1.9, ask=2.0, PriceRateID=3)])
+
+    quotes = await etoro.get_quotes([1002, 1001])
+    assert quotes[0] is None
+    assert quotes[1] is not None and (quotes[1].bid, quotes[1].ask, quotes[1].price_rate_id) == (1.9, 2.0, 3)
+    await etoro.rest.aclose()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_get_rates_always_uses_rest(monkeypatch: pytest.MonkeyPatch) -> None:
+    etoro, _ = trading_client(monkeypatch)
+    route = respx.get(f"{etoro._config.base_url}/api/v1/market-data/instruments/rates").mock(
+        return_value=httpx.Response(200, json={"rates": [{"instrumentID": 1001, "ask": 5.0, "bid": 4.9}]})
+    )
+    etoro.ws._dispatch_messages([rate_message(1001, bid=1.9, ask=2.0)])
+
+    rates = await etoro.get_rates([1001])
+
+    assert rates[0].ask == 5.0
+    assert route.call_count == 1
+    await etoro.rest.aclose()
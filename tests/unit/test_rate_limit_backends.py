@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import asyncio
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from etoropy.config.settings import EToroConfig
+from etoropy.http.client import HttpClient
+from etoropy.http.rate_limit_backends import FileRateLimitBackend, StoreRateLimitBackend
+from etoropy.http.rate_limiter import RateLimiter, RateLimiterOptions
+
+
+class FakeSortedSetStore:
+    """In-process stand-in for the handful of Redis commands the backend uses."""
+
+    def __init__(self) -> None:
+        self.sets: dict[str, dict[str, float]] = {}
+        self.values: dict[str, tuple[str, float | None]] = {}
+
+    async def zadd(self, name: str, mapping: dict[str, float]) -> int:
+        self.sets.setdefault(name, {}).update(mapping)
+        return len(mapping)
+
+    async def zrem(self, name: str, *values: str) -> int:
+        members = self.sets.get(name, {})
+        return sum(members.pop(v, None) is not None for v in values)
+
+    async def zremrangebyscore(self, name: str, min: float, max: float) -> int:
+        members = self.sets.get(name, {})
+        doomed = [m for m, score in members.items() if min <= score <= max]
+        for m in doomed:
+            del members[m]
+        return len(doomed)
+
+    async def zcard(self, name: str) -> int:
+        return len(self.sets.get(name, {}))
+
+    async def zrange(self, name: str, start: int, end: int, withscores: bool = False) -> list[Any]:
+        ordered = sorted(self.sets.get(name, {}).items(), key=lambda item: item[1])
+        window = ordered[start : end + 1 if end >= 0 else None]
+        return window if withscores else [m for m, _ in window]
+
+    async def get(self, name: str) -> str | None:
+        entry = self.values.get(name)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at < time.time():
+            del self.values[name]
+            return None
+        return value
+
+    async def set(self, name: str, value: str, px: int | None = None) -> bool:
+        self.values[name] = (value, time.time() + px / 1000 if px else None)
+        return True
+
+
+@pytest.mark.asyncio
+async def test_store_backend_shares_window_between_limiters() -> None:
+    backend = StoreRateLimitBackend(FakeSortedSetStore())
+    a = RateLimiter(RateLimiterOptions(max_requests=3, window_s=10.0, backend=backend))
+    b = RateLimiter(RateLimiterOptions(max_requests=3, window_s=10.0, backend=backend))
+
+    await a.acquire()
+    await b.acquire()
+    await a.acquire()
+    assert await backend.try_acquire("default", 3, 10.0) > 0
+
+    blocked = asyncio.create_task(b.acquire())
+    await asyncio.sleep(0.05)
+    assert not blocked.done()
+    assert b.queue_size == 1
+    b.dispose()
+    a.dispose()
+    await blocked
+
+
+@pytest.mark.asyncio
+async def test_store_backend_grants_after_window_slides() -> None:
+    backend = StoreRateLimitBackend(FakeSortedSetStore())
+    a = RateLimiter(RateLimiterOptions(max_requests=2, window_s=0.05, backend=backend))
+    b = RateLimiter(RateLimiterOptions(max_requests=2, window_s=0.05, backend=backend))
+
+    start = time.monotonic()
+    await asyncio.gather(*(limiter.acquire() for limiter in (a, b, a, b, a)))
+    assert time.monotonic() - start >= 0.04
+
+
+class CancelOnGrant:
+    """Wraps a backend and cancels *task* as a slot is claimed for it."""
+
+    def __init__(self, backend: Any, late: bool) -> None:
+        self.backend = backend
+        self.late = late
+        self.task: asyncio.Task[None] | None = None
+
+    async def try_acquire(self, key: str, max_requests: int, window_s: float) -> float:
+        wait_s = await self.backend.try_acquire(key, max_requests, window_s)
+        assert self.task is not None
+        if self.late:
+            # Runs after the limiter grants the slot but before the caller resumes.
+            asyncio.get_running_loop().call_soon(self.task.cancel)
+        else:
+            self.task.cancel()
+        return wait_s
+
+    async def release(self, key: str) -> None:
+        await self.backend.release(key)
+
+    async def penalize(self, key: str, retry_after_s: float) -> None:
+        await self.backend.penalize(key, retry_after_s)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("late", [False, True])
+async def test_cancelled_grant_is_released_to_the_backend(tmp_path: Path, late: bool) -> None:
+    for backend in (StoreRateLimitBackend(FakeSortedSetStore()), FileRateLimitBackend(tmp_path / f"{late}.json")):
+        wrapper = CancelOnGrant(backend, late)
+        limiter = RateLimiter(RateLimiterOptions(max_requests=1, window_s=10.0, backend=wrapper))
+        wrapper.task = asyncio.create_task(limiter.acquire())
+        with pytest.raises(asyncio.CancelledError):
+            await wrapper.task
+        for _ in range(100):
+            if not limiter._background and limiter._dispatcher is None:
+                break
+            await asyncio.sleep(0.001)
+
+        assert await backend.try_acquire("default", 1, 10.0) == 0.0
+        limiter.dispose()
+
+
+class FailingRelease(CancelOnGrant):
+    async def release(self, key: str) -> None:
+        raise ConnectionError("store unavailable")
+
+
+@pytest.mark.asyncio
+async def test_failed_release_of_a_cancelled_grant_is_logged(caplog: pytest.LogCaptureFixture) -> None:
+    wrapper = FailingRelease(StoreRateLimitBackend(FakeSortedSetStore()), late=False)
+    limiter = RateLimiter(RateLimiterOptions(max_requests=2, window_s=10.0, backend=wrapper))
+    wrapper.task = asyncio.create_task(limiter.acquire())
+    with caplog.at_level("WARNING", logger="etoropy"):
+        with pytest.raises(asyncio.CancelledError):
+            await wrapper.task
+        for _ in range(100):
+            if limiter._dispatcher is None:
+                break
+            await asyncio.sleep(0.001)
+
+    assert "failed to release a slot" in caplog.text
+    assert limiter._dispatcher is None
+    limiter.dispose()
+
+
+@pytest.mark.asyncio
+async def test_store_backend_penalty_is_shared() -> None:
+    store = FakeSortedSetStore()
+    backend = StoreRateLimitBackend(store)
+    await backend.penalize("default", 5.0)
+    wait_s = await backend.try_acquire("default", 10, 1.0)
+    assert 4.0 < wait_s <= 5.0
+    assert await backend.try_acquire("other", 10, 1.0) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_limiter_penalize_propagates_to_backend() -> None:
+    store = FakeSortedSetStore()
+    backend = StoreRateLimitBackend(store)
+    limiter = RateLimiter(RateLimiterOptions(backend=backend, key="market"))
+    limiter.penalize(5.0)
+    await asyncio.sleep(0)
+    assert await backend.try_acquire("market", 10, 1.0) > 0
+
+
+@pytest.mark.asyncio
+async def test_file_backend_shares_window(tmp_path: Path) -> None:
+    path = tmp_path / "limits.json"
+    first = FileRateLimitBackend(path)
+    second = FileRateLimitBackend(path)
+
+    assert await first.try_acquire("default", 2, 10.0) == 0.0
+    assert await second.try_acquire("default", 2, 10.0) == 0.0
+    assert await first.try_acquire("default", 2, 10.0) > 0
+    assert await second.try_acquire("other", 2, 10.0) == 0.0
+
+
+def test_file_backend_is_shared_across_processes(tmp_path: Path) -> None:
+    path = tmp_path / "limits.json"
+    script = (
+        "import asyncio, sys\n"
+        "from etoropy.http.rate_limit_backends import FileRateLimitBackend\n"
+        "b = FileRateLimitBackend(sys.argv[1])\n"
+        "granted = sum(asyncio.run(b.try_acquire('default', 5, 60.0)) == 0.0 for _ in range(4))\n"
+        "print(granted)\n"
+    )
+    procs = [
+        subprocess.Popen([sys.executable, "-c", script, str(path)], stdout=subprocess.PIPE, text=True) for _ in range(3)
+    ]
+    granted = sum(int(p.communicate(timeout=30)[0]) for p in procs)
+    assert granted == 5
+
+
+def test_http_client_uses_shared_path_from_config(tmp_path: Path) -> None:
+    config = EToroConfig(
+        api_key="k",
+        user_key="u",
+        rate_limit_shared_path=str(tmp_path / "limits.json"),
+        rate_limit_groups={"/market-data": (20, 10.0)},
+    )
+    client = HttpClient(config)
+    assert client._rate_limiter is not None
+    assert isinstance(client._rate_limiter._backend, FileRateLimitBackend)
+    market = client.rate_limiter_for("/api/v1/market-data/exchanges")
+    assert market is not None
+    assert market._key == "/market-data"
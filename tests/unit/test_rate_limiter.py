@@ -1,10 +1,13 @@
 import asyncio
 
+import httpx
 import pytest
+import respx
 
 from etoropy.config.settings import EToroConfig
-from etoropy.http.client import HttpClient
-from etoropy.http.rate_limiter import RateLimiter, RateLimiterOptions
+from etoropy.errors.exceptions import EToroRateLimitError
+from etoropy.http.client import HttpClient, RequestOptions
+from etoropy.http.rate_limiter import RateLimiter, RateLimiterOptions, RateLimiterRegistry, RequestPriority
 
 
 @pytest.mark.asyncio
@@ -33,6 +36,135 @@ async def test_dispose() -> None:
     await limiter.acquire()
 
 
+@pytest.mark.asyncio
+async def test_waiters_are_served_in_fifo_order() -> None:
+    limiter = RateLimiter(RateLimiterOptions(max_requests=2, window_s=0.05))
+    order: list[int] = []
+
+    async def worker(n: int) -> None:
+        await limiter.acquire()
+        order.append(n)
+
+    tasks = [asyncio.create_task(worker(n)) for n in range(6)]
+    await asyncio.sleep(0)
+    assert limiter.queue_size == 4
+    await asyncio.gather(*tasks)
+    assert order == list(range(6))
+    assert limiter.queue_size == 0
+
+
+@pytest.mark.asyncio
+async def test_waiter_does_not_block_on_sleeping_peer() -> None:
+    limiter = RateLimiter(RateLimiterOptions(max_requests=1, window_s=0.05))
+    await limiter.acquire()
+    start = asyncio.get_running_loop().time()
+    await asyncio.gather(*(limiter.acquire() for _ in range(3)))
+    elapsed = asyncio.get_running_loop().time() - start
+    # Three more slots need three more windows, not more.
+    assert elapsed < 0.05 * 3 + 0.1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_is_removed_from_queue() -> None:
+    limiter = RateLimiter(RateLimiterOptions(max_requests=1, window_s=10.0))
+    await limiter.acquire()
+    task = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.queue_size == 1
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert limiter.queue_size == 0
+    assert limiter.current_usage == 1
+
+
+@pytest.mark.asyncio
+async def test_cancel_after_grant_returns_slot() -> None:
+    limiter = RateLimiter(RateLimiterOptions(max_requests=1, window_s=10.0))
+    await limiter.acquire()
+    task = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    # Simulate the window sliding: the slot is handed to the waiter,
+    # which is then cancelled before it gets to run.
+    limiter._timestamps.clear()
+    limiter._release()
+    assert limiter.current_usage == 1
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert limiter.current_usage == 0
+
+
+@pytest.mark.asyncio
+async def test_penalty_delays_queued_waiters() -> None:
+    limiter = RateLimiter(RateLimiterOptions(max_requests=5, window_s=10.0))
+    limiter.penalize(0.05)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await limiter.acquire()
+    assert loop.time() - start >= 0.04
+
+
+@pytest.mark.asyncio
+async def test_dispose_releases_waiters() -> None:
+    limiter = RateLimiter(RateLimiterOptions(max_requests=1, window_s=10.0))
+    await limiter.acquire()
+    task = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    limiter.dispose()
+    await asyncio.wait_for(task, timeout=1.0)
+    assert limiter.queue_size == 0
+
+
+@pytest.mark.asyncio
+async def test_higher_priority_lane_is_served_first() -> None:
+    limiter = RateLimiter(RateLimiterOptions(max_requests=1, window_s=0.03))
+    await limiter.acquire()
+    order: list[str] = []
+
+    async def worker(name: str, priority: RequestPriority) -> None:
+        await limiter.acquire(priority)
+        order.append(name)
+
+    tasks = [
+        asyncio.create_task(worker("bulk", RequestPriority.BULK)),
+        asyncio.create_task(worker("rates", RequestPriority.NORMAL)),
+        asyncio.create_task(worker("order", RequestPriority.EXECUTION)),
+    ]
+    await asyncio.gather(*tasks)
+    assert order == ["order", "rates", "bulk"]
+
+
+@pytest.mark.asyncio
+async def test_starved_waiter_is_promoted() -> None:
+    limiter = RateLimiter(RateLimiterOptions(max_requests=1, window_s=0.03, starvation_s=0.0))
+    await limiter.acquire()
+    order: list[str] = []
+
+    async def worker(name: str, priority: RequestPriority) -> None:
+        await limiter.acquire(priority)
+        order.append(name)
+
+    bulk = asyncio.create_task(worker("bulk", RequestPriority.BULK))
+    await asyncio.sleep(0)
+    order_task = asyncio.create_task(worker("order", RequestPriority.EXECUTION))
+    await asyncio.gather(bulk, order_task)
+    assert order == ["bulk", "order"]
+    assert limiter.lane_stats[RequestPriority.BULK].promoted == 1
+
+
+@pytest.mark.asyncio
+async def test_lane_stats_track_grants_and_waits() -> None:
+    limiter = RateLimiter(RateLimiterOptions(max_requests=1, window_s=0.03))
+    await limiter.acquire(RequestPriority.EXECUTION)
+    await limiter.acquire(RequestPriority.EXECUTION)
+    stats = limiter.lane_stats[RequestPriority.EXECUTION]
+    assert stats.acquired == 2
+    assert stats.queued == 0
+    assert stats.max_wait_s > 0
+    assert stats.mean_wait_s > 0
+
+
 def test_http_client_uses_config_rate_limit_values() -> None:
     config = EToroConfig(
         api_key="k",
@@ -68,3 +200,88 @@ def test_http_client_explicit_options_override_config() -> None:
     assert client._rate_limiter is not None
     assert client._rate_limiter._max_requests == 50
     assert client._rate_limiter._window_s == 30.0
+
+
+def test_rest_clients_use_priority_lanes(config: EToroConfig) -> None:
+    from etoropy.rest.rest_client import RestClient
+
+    rest = RestClient(config, HttpClient(config, rate_limiter=False))
+    assert rest.execution._priority == RequestPriority.EXECUTION
+    assert rest.info._priority == RequestPriority.ACCOUNT
+    assert rest.market_data._priority == RequestPriority.NORMAL
+    assert rest.feeds._priority == RequestPriority.BULK
+
+
+def test_registry_routes_by_longest_prefix() -> None:
+    default = RateLimiter()
+    market = RateLimiter()
+    execution = RateLimiter()
+    registry = RateLimiterRegistry(default, {"/market-data": market, "/trading/execution/": execution})
+    registry.add("/market-data/instruments/rates", rates := RateLimiter())
+
+    assert registry.get("/api/v1/market-data/exchanges") is market
+    assert registry.get("/api/v1/market-data/instruments/rates") is rates
+    assert registry.get("/api/v1/trading/execution/demo/limit-orders") is execution
+    assert registry.get("/api/v1/trading/info/demo/pnl") is default
+    assert registry.get("/api/v1/market-datafeed") is default
+
+
+def test_http_client_builds_group_limiters_from_config() -> None:
+    config = EToroConfig(api_key="k", user_key="u", rate_limit_groups={"/market-data": (40, 5.0)})
+    client = HttpClient(config)
+    limiter = client.rate_limiter_for("/api/v1/market-data/exchanges")
+    assert limiter is not None
+    assert limiter is not client._rate_limiter
+    assert (limiter.max_requests, limiter.window_s) == (40, 5.0)
+    assert client.rate_limiter_for("/api/v1/watchlists") is client._rate_limiter
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_429_penalizes_only_its_group() -> None:
+    config = EToroConfig(
+        api_key="k",
+        user_key="u",
+        retry_attempts=0,
+        rate_limit_groups={"/market-data": (20, 10.0)},
+    )
+    client = HttpClient(config)
+    respx.get(f"{config.base_url}/api/v1/market-data/exchanges").mock(
+        return_value=httpx.Response(429, headers={"Retry-After": "5"})
+    )
+
+    with pytest.raises(EToroRateLimitError):
+        await client.request(RequestOptions(method="GET", path="/api/v1/market-data/exchanges"))
+
+    market = client.rate_limiter_for("/api/v1/market-data/exchanges")
+    assert market is not None and market.is_penalized
+    assert client._rate_limiter is not None and not client._rate_limiter.is_penalized
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_adaptive_limits_follow_response_headers() -> None:
+    config = EToroConfig(api_key="k", user_key="u", rate_limit_adaptive=True)
+    client = HttpClient(config)
+    respx.get(f"{config.base_url}/api/v1/watchlists").mock(
+        return_value=httpx.Response(
+            200,
+            json={},
+            headers={"X-RateLimit-Limit": "60", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "3"},
+        )
+    )
+
+    await client.request(RequestOptions(method="GET", path="/api/v1/watchlists"))
+
+    assert client._rate_limiter is not None
+    assert client._rate_limiter.max_requests == 60
+    assert client._rate_limiter.is_penalized
+    await client.aclose()
+
+
+def test_parse_retry_after_accepts_seconds_and_dates() -> None:
+    assert HttpClient._parse_retry_after("2.5") == 2.5
+    assert HttpClient._parse_retry_after(None) is None
+    assert HttpClient._parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert HttpClient._parse_retry_after("garbage") is None
@@ -0,0 +1,167 @@
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from etoropy.config.settings import EToroConfig
+from etoropy.errors.exceptions import EToroApiError
+from etoropy.http.cache import ResponseCache
+from etoropy.http.client import HttpClient, RequestOptions
+
+EXCHANGES = "/api/v1/market-data/exchanges"
+
+
+def _client(**settings: object) -> HttpClient:
+    config = EToroConfig(api_key="k", user_key="u", cache_enabled=True, retry_attempts=0, **settings)  # type: ignore[arg-type]
+    return HttpClient(config, rate_limiter=False)
+
+
+def test_ttl_for_matches_longest_prefix() -> None:
+    cache = ResponseCache({"/market-data": 10.0, "/market-data/exchanges": 60.0, "/curated-lists": 0})
+
+    assert cache.ttl_for(EXCHANGES) == 60.0
+    assert cache.ttl_for("/api/v1/market-data/search?q=x") == 10.0
+    assert cache.ttl_for("/api/v1/market-database") is None
+    assert cache.ttl_for("/api/v1/curated-lists") is None
+    assert cache.ttl_for("/api/v1/watchlists") is None
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction() -> None:
+    cache = ResponseCache({"/x": 60.0}, max_entries=2)
+
+    async def load(etag: str | None) -> tuple[object, str | None]:
+        return object(), None
+
+    for key in ("a", "b", "a", "c"):
+        await cache.get_or_load(key, 60.0, load)
+
+    assert len(cache) == 2
+    assert cache.stats.evictions == 1
+    assert (cache.stats.hits, cache.stats.misses) == (1, 3)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_cancel_joined_waiters() -> None:
+    cache = ResponseCache({"/x": 60.0})
+    calls = 0
+
+    async def load(etag: str | None) -> tuple[object, str | None]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls, None
+
+    leader = asyncio.create_task(cache.get_or_load("k", 60.0, load))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(cache.get_or_load("k", 60.0, load))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == 2
+    assert leader.cancelled()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_reference_data_is_served_from_cache() -> None:
+    client = _client()
+    route = respx.get(f"{client._config.base_url}{EXCHANGES}").mock(
+        return_value=httpx.Response(200, json={"exchangeInfo": []})
+    )
+
+    for _ in range(3):
+        assert await client.request(RequestOptions(method="GET", path=EXCHANGES)) == {"exchangeInfo": []}
+
+    assert route.call_count == 1
+    assert client.cache_stats is not None
+    assert (client.cache_stats.hits, client.cache_stats.misses) == (2, 1)
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_uncached_paths_always_hit_the_network() -> None:
+    client = _client()
+    route = respx.get(f"{client._config.base_url}/api/v1/watchlists").mock(return_value=httpx.Response(200, json={}))
+
+    await client.request(RequestOptions(method="GET", path="/api/v1/watchlists"))
+    await client.request(RequestOptions(method="GET", path="/api/v1/watchlists"))
+
+    assert route.call_count == 2
+    assert client.cache is not None and len(client.cache) == 0
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_concurrent_misses_are_coalesced() -> None:
+    client = _client()
+
+    async def slow(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.02)
+        return httpx.Response(200, json={"exchangeInfo": []})
+
+    route = respx.get(f"{client._config.base_url}{EXCHANGES}").mock(side_effect=slow)
+
+    results = await asyncio.gather(*(client.request(RequestOptions(method="GET", path=EXCHANGES)) for _ in range(10)))
+
+    assert route.call_count == 1
+    assert all(r == {"exchangeInfo": []} for r in results)
+    assert client.cache_stats is not None and client.cache_stats.coalesced == 9
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_errors_reach_coalesced_callers_and_are_not_cached() -> None:
+    client = _client()
+
+    async def failing(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        return httpx.Response(404, text="nope")
+
+    route = respx.get(f"{client._config.base_url}{EXCHANGES}").mock(side_effect=failing)
+
+    results = await asyncio.gather(
+        *(client.request(RequestOptions(method="GET", path=EXCHANGES)) for _ in range(3)),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, EToroApiError) for r in results)
+    assert client.cache is not None and len(client.cache) == 0
+
+    route.mock(return_value=httpx.Response(200, json={"exchangeInfo": []}))
+    assert await client.request(RequestOptions(method="GET", path=EXCHANGES)) == {"exchangeInfo": []}
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_expired_entry_is_revalidated_with_etag() -> None:
+    client = _client(cache_ttls={"/market-data/exchanges": 0.01})
+    seen: list[str | None] = []
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json={"exchangeInfo": [1]}, headers={"ETag": '"v1"'})
+
+    respx.get(f"{client._config.base_url}{EXCHANGES}").mock(side_effect=respond)
+
+    first = await client.request(RequestOptions(method="GET", path=EXCHANGES))
+    await asyncio.sleep(0.02)
+    second = await client.request(RequestOptions(method="GET", path=EXCHANGES))
+
+    assert first == second == {"exchangeInfo": [1]}
+    assert seen == [None, '"v1"']
+    assert client.cache_stats is not None and client.cache_stats.revalidated == 1
+    await client.aclose()
+
+
+def test_cache_is_opt_in(config: EToroConfig) -> None:
+    client = HttpClient(config)
+    assert client.cache is None
+    assert client.cache_stats is None
@@ -1,5 +1,10 @@
+import httpx
 import pytest
+import respx
 
+from etoropy.config.settings import EToroConfig
+from etoropy.errors.exceptions import EToroApiError
+from etoropy.http.client import HttpClient, RequestOptions
 from etoropy.http.retry import RetryOptions, retry
 
 
@@ -75,3 +80,32 @@ async def test_retry_no_retry_on_non_retryable() -> None:
             ),
         )
     assert call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_zero_attempts_still_calls_once() -> None:
+    calls = 0
+
+    async def fn() -> str:
+        nonlocal calls
+        calls += 1
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        await retry(fn, RetryOptions(attempts=0, should_retry=lambda _: True))
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_http_client_with_retries_disabled_raises_the_request_error() -> None:
+    config = EToroConfig(api_key="k", user_key="u", retry_attempts=0)
+    client = HttpClient(config, rate_limiter=False)
+    route = respx.get(f"{config.base_url}/api/v1/ping").mock(return_value=httpx.Response(503))
+
+    with pytest.raises(EToroApiError) as exc_info:
+        await client.request(RequestOptions(method="GET", path="/api/v1/ping"))
+
+    assert exc_info.value.status_code == 503
+    assert route.call_count == 1
+    await client.aclose()
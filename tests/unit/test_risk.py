@@ -0,0 +1,185 @@
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+import respx
+
+from etoropy.config.settings import EToroConfig
+from etoropy.errors.exceptions import EToroRiskError
+from etoropy.models.common import TokenResponse
+from etoropy.models.enums import OrderStatusId, OrderType
+from etoropy.models.trading import MarketOrderByAmountRequest, OrderForOpenResponse, PortfolioResponse
+from etoropy.trading.client import EToroTrading, OrderOptions
+from etoropy.trading.portfolio_state import PortfolioState
+from etoropy.trading.risk import ExposureIndex, OrderIntent, RiskLimits, RiskManager
+from etoropy.ws.simulator import FeedSimulator
+from tests.factories import opened_order, portfolio_response, position_data, private_event
+
+
+async def _seeded(*positions: dict[str, Any]) -> PortfolioState:
+    async def fetch() -> PortfolioResponse:
+        return portfolio_response(positions)
+
+    state = PortfolioState(fetch)
+    await state.sync()
+    return state
+
+
+@pytest.mark.asyncio
+async def test_exposure_counts_positions_and_orders_in_flight() -> None:
+    risk = RiskManager(RiskLimits(max_notional_per_instrument=1000.0, max_open_positions=3))
+    risk.exposure.state = await _seeded(position_data(1, 1001, amount=300.0, leverage=2))
+
+    ticket = risk.check(OrderIntent("open", 1001, 300.0))
+    assert ticket is not None
+    assert risk.exposure.notional(1001) == 900.0
+    with pytest.raises(EToroRiskError, match="exceeds 1,000.00") as exc_info:
+        risk.check(OrderIntent("open", 1001, 200.0))
+    assert exc_info.value.rule == "max_notional_per_instrument"
+    assert risk.check(OrderIntent("open", 1002, 200.0)) is not None  # other instrument
+
+    # Accepted as order 50; it stays reserved until the stream reports it.
+    risk.exposure.settle(ticket, 50)
+    assert risk.exposure.notional(1001) == 900.0
+    risk.exposure.on_event(private_event(50, OrderStatusId.FAILED))
+    assert risk.exposure.notional(1001) == 600.0
+
+    with pytest.raises(EToroRiskError, match="positions already open"):
+        risk.check(OrderIntent("open", 1003, 1.0))
+        risk.check(OrderIntent("open", 1003, 1.0))
+    assert risk.stats.rejected == {"max_notional_per_instrument": 1, "max_open_positions": 1}
+
+
+def test_settle_after_the_event_releases_immediately() -> None:
+    exposure = ExposureIndex()
+    ticket = exposure.reserve(1001, 100.0)
+    exposure.on_event(private_event(7, OrderStatusId.EXECUTED, PositionID=70))
+    exposure.settle(ticket, 7)
+    assert exposure.notional(1001) == 0.0
+
+
+def test_limit_orders_stay_reserved_until_their_event() -> None:
+    exposure = ExposureIndex()
+    first, second = exposure.reserve(1001, 100.0), exposure.reserve(1001, 50.0)
+    exposure.settle(first, None)
+    exposure.settle(second, None)
+    assert exposure.notional(1001) == 150.0
+
+    exposure.on_event(private_event(8, OrderStatusId.PENDING, OrderType=OrderType.LIMIT, InstrumentID=1002))
+    exposure.on_event(private_event(9, OrderStatusId.PENDING))  # not a limit order
+    assert exposure.notional(1001) == 150.0
+    exposure.on_event(private_event(10, OrderStatusId.PENDING, OrderType=OrderType.LIMIT))
+    exposure.on_event(private_event(10, OrderStatusId.CANCELLED, OrderType=OrderType.LIMIT))  # same order again
+    assert exposure.notional(1001) == 50.0
+
+
+def test_rate_leverage_and_custom_checks() -> None:
+    risk = RiskManager(RiskLimits(max_orders_per_second=3, max_leverage=5, leverage_caps={1001: 2}))
+    assert risk.active
+
+    with pytest.raises(EToroRiskError, match="cap 2"):
+        risk.check(OrderIntent("open", 1001, 100.0, leverage=3))
+    risk.check(OrderIntent("open", 1002, 100.0, leverage=5))
+    for _ in range(10):  # risk-reducing orders are never throttled
+        risk.check(OrderIntent("close", 1001))
+        risk.check(OrderIntent("cancel"))
+    risk.check(OrderIntent("open", 1002, 100.0))
+    risk.check(OrderIntent("open", 1002, 100.0))
+    with pytest.raises(EToroRiskError) as exc_info:
+        risk.check(OrderIntent("open", 1002, 100.0))
+    assert exc_info.value.rule == "max_orders_per_second"
+
+    def no_shorts(intent: OrderIntent, exposure: ExposureIndex) -> None:
+        if intent.kind == "open" and not intent.is_buy:
+            raise EToroRiskError("shorts are disabled", rule="no_shorts")
+
+    custom = RiskManager()
+    assert not custom.active
+    custom.add_check(no_shorts)
+    with pytest.raises(EToroRiskError, match="shorts"):
+        custom.check(OrderIntent("open", 1001, 10.0, is_buy=False))
+    assert custom.stats.rejected == {"no_shorts": 1}
+
+
+def test_exposure_limits_fail_closed_without_the_mirror() -> None:
+    risk = RiskManager(RiskLimits(max_open_positions=10))
+    with pytest.raises(EToroRiskError) as exc_info:
+        risk.check(OrderIntent("open", 1001, 10.0))
+    assert exc_info.value.rule == "exposure_unknown"
+    assert risk.check(OrderIntent("close", 1001)) is None
+
+
+@pytest.mark.asyncio
+async def test_trading_client_rejects_before_sending(monkeypatch: pytest.MonkeyPatch) -> None:
+    etoro = EToroTrading(EToroConfig(api_key="k", user_key="u", risk_max_orders_per_second=2, risk_max_leverage=10))
+    sent: list[int] = []
+    opened: list[MarketOrderByAmountRequest] = []
+
+    async def cancel(order_id: int) -> TokenResponse:
+        sent.append(order_id)
+        return TokenResponse(token="t")
+
+    async def open_by_amount(request: MarketOrderByAmountRequest) -> OrderForOpenResponse:
+        opened.append(request)
+        return opened_order(len(opened))
+
+    monkeypatch.setattr(etoro.rest.execution, "cancel_limit_order", cancel)
+    monkeypatch.setattr(etoro.rest.execution, "open_market_order_by_amount", open_by_amount)
+    with pytest.raises(EToroRiskError, match="leverage 20"):
+        await etoro.buy_by_amount(1001, 100, OrderOptions(leverage=20))
+    await etoro.buy_by_amount(1001, 100)
+    await etoro.buy_by_amount(1001, 100)
+    with pytest.raises(EToroRiskError, match="orders/s"):
+        await etoro.buy_by_amount(1001, 100)
+    for order_id in range(5):
+        await etoro.cancel_limit_order(order_id)
+    assert len(opened) == 2
+    assert sent == [0, 1, 2, 3, 4]
+    await etoro.rest.aclose()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_trading_client_tracks_exposure_from_fills(monkeypatch: pytest.MonkeyPatch) -> None:
+    async with FeedSimulator() as sim:
+        config = EToroConfig(
+            api_key="k",
+            user_key="u",
+            ws_url=sim.url,
+            portfolio_mirror=True,
+            portfolio_reconcile_interval=0,
+            risk_max_notional_per_instrument=500,
+        )
+        etoro = EToroTrading(config)
+        fetches = 0
+        order_ids = iter(range(1, 100))
+        respx.post(f"{config.base_url}/api/v1/trading/execution/demo/market-open-orders/by-amount").mock(
+            side_effect=lambda request: httpx.Response(
+                200, json=opened_order(next(order_ids)).model_dump(by_alias=True)
+            )
+        )
+
+        async def get_portfolio() -> PortfolioResponse:
+            nonlocal fetches
+            fetches += 1
+            return portfolio_response([position_data(1, 1001, units=1.0, amount=200.0)])
+
+        monkeypatch.setattr(etoro.rest.info, "get_portfolio", get_portfolio)
+        await etoro.connect()
+
+        await etoro.buy_by_amount(1001, 200)
+        armed = await etoro.arm_market_order(1001, is_buy=True, amount=150)
+        with pytest.raises(EToroRiskError):
+            await armed.fire()  # 200 held + 200 in flight + 150
+        assert await armed.fire(amount=50)
+
+        # The first order fills; exposure moves from in-flight to the mirror.
+        etoro.ws._emit("private:event", private_event(1, OrderStatusId.EXECUTED, PositionID=2, Amount=200.0))
+        assert etoro.risk.exposure.notional(1001) == 450.0
+        etoro.ws._emit("private:event", private_event(3, OrderStatusId.EXECUTED, PositionID=1, ExecutedUnits=1.0))
+        await asyncio.sleep(0)
+        assert etoro.risk.exposure.notional(1001) == 250.0
+        await etoro.buy_by_amount(1001, 200)
+        assert fetches == 1
+        await etoro.disconnect()
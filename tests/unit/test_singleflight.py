@@ -0,0 +1,142 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+import respx
+
+from etoropy.config.settings import EToroConfig
+from etoropy.http.client import HttpClient, RequestOptions
+from etoropy.http.singleflight import SingleFlight
+from etoropy.trading.client import EToroTrading
+from etoropy.trading.instrument_resolver import InstrumentResolver
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution() -> None:
+    flights: SingleFlight[int] = SingleFlight()
+    calls = 0
+
+    async def fn() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return 42
+
+    results = await asyncio.gather(*(flights.do("k", fn) for _ in range(5)))
+
+    assert results == [42] * 5
+    assert calls == 1
+    assert flights.shared == 4
+    assert flights.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared_and_not_remembered() -> None:
+    flights: SingleFlight[int] = SingleFlight()
+    calls = 0
+
+    async def fn() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(*(flights.do("k", fn) for _ in range(3)), return_exceptions=True)
+
+    assert all(isinstance(r, ValueError) for r in results)
+    assert calls == 1
+    with pytest.raises(ValueError):
+        await flights.do("k", fn)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_hands_over_to_joined_caller() -> None:
+    flights: SingleFlight[int] = SingleFlight()
+    calls = 0
+
+    async def fn() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    leader = asyncio.create_task(flights.do("k", fn))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flights.do("k", fn))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == 2
+    assert leader.cancelled()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_identical_gets_are_coalesced(config: EToroConfig) -> None:
+    client = HttpClient(config, rate_limiter=False)
+
+    async def slow(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.02)
+        return httpx.Response(200, json={"ok": True})
+
+    route = respx.get(f"{config.base_url}/api/v1/watchlists").mock(side_effect=slow)
+
+    results = await asyncio.gather(
+        *(client.request(RequestOptions(method="GET", path="/api/v1/watchlists")) for _ in range(5))
+    )
+
+    assert results == [{"ok": True}] * 5
+    assert route.call_count == 1
+    assert client.coalesced_requests == 4
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_coalescing_can_be_disabled() -> None:
+    config = EToroConfig(api_key="k", user_key="u", coalesce_requests=False)
+    client = HttpClient(config, rate_limiter=False)
+    route = respx.get(f"{config.base_url}/api/v1/watchlists").mock(return_value=httpx.Response(200, json={}))
+
+    await asyncio.gather(*(client.request(RequestOptions(method="GET", path="/api/v1/watchlists")) for _ in range(3)))
+
+    assert route.call_count == 3
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_get_portfolio_shares_one_parsed_response(config: EToroConfig) -> None:
+    etoro = EToroTrading(config)
+    portfolio = object()
+
+    async def fetch() -> object:
+        await asyncio.sleep(0.01)
+        return portfolio
+
+    etoro.rest.info.get_portfolio = AsyncMock(side_effect=fetch)  # type: ignore[method-assign]
+
+    results = await asyncio.gather(*(etoro.get_portfolio() for _ in range(4)))
+
+    assert all(r is portfolio for r in results)
+    etoro.rest.info.get_portfolio.assert_awaited_once()
+    await etoro.rest.aclose()
+
+
+@pytest.mark.asyncio
+async def test_resolver_coalesces_concurrent_lookups() -> None:
+    market_data = AsyncMock()
+
+    async def search(**kwargs: object) -> object:
+        await asyncio.sleep(0.01)
+        item = AsyncMock(instrument_id=1001)
+        return AsyncMock(items=[item])
+
+    market_data.search_instruments.side_effect = search
+    resolver = InstrumentResolver(market_data)
+
+    results = await asyncio.gather(*(resolver.resolve("aapl") for _ in range(5)))
+
+    assert results == [1001] * 5
+    market_data.search_instruments.assert_awaited_once()
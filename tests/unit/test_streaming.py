@@ -0,0 +1,104 @@
+import json
+from collections.abc import AsyncIterator
+
+import httpx
+import pytest
+import respx
+
+from etoropy.config.settings import EToroConfig
+from etoropy.errors.exceptions import EToroApiError
+from etoropy.http.client import HttpClient, RequestOptions
+from etoropy.http.streaming import iter_json_array
+from etoropy.rest.market_data import MarketDataClient
+from etoropy.rest.trading_info import TradingInfoClient
+
+
+async def _chunks(body: str, size: int = 1) -> AsyncIterator[bytes]:
+    raw = body.encode()
+    for i in range(0, len(raw), size):
+        yield raw[i : i + size]
+
+
+async def _collect(body: str, key: str | None = None, size: int = 1) -> list[object]:
+    return [item async for item in iter_json_array(_chunks(body, size), key)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [1, 3, 7, 4096])
+async def test_top_level_array_any_chunking(size: int) -> None:
+    items = [{"a": 1, "s": "x,]"}, [1, 2], 123, 4.5e3, "é€", True, None]
+    assert await _collect(json.dumps(items, ensure_ascii=False), size=size) == items
+
+
+@pytest.mark.asyncio
+async def test_keyed_array_skips_other_members() -> None:
+    body = json.dumps({"meta": {"rates": "decoy", "n": [1, 2]}, "rates": [{"id": 1}, {"id": 2}], "tail": 0})
+    assert await _collect(body, "rates") == [{"id": 1}, {"id": 2}]
+
+
+@pytest.mark.asyncio
+async def test_bare_array_ignores_key_and_missing_key_yields_nothing() -> None:
+    assert await _collect("[1, 2]", "rates") == [1, 2]
+    assert await _collect('{"other": [1]}', "rates") == []
+    assert await _collect(" [ ] ") == []
+    assert await _collect("") == []
+
+
+@pytest.mark.asyncio
+async def test_malformed_body_raises() -> None:
+    with pytest.raises(json.JSONDecodeError):
+        await _collect("[1 2]")
+    with pytest.raises(json.JSONDecodeError):
+        await _collect('[{"a": 1}')
+    with pytest.raises(json.JSONDecodeError):
+        await _collect("42")
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_http_client_stream(config: EToroConfig) -> None:
+    client = HttpClient(config, rate_limiter=False)
+    respx.get(f"{config.base_url}/api/v1/big").mock(
+        return_value=httpx.Response(200, content=json.dumps({"rates": list(range(100))}).encode())
+    )
+
+    items = [i async for i in client.stream(RequestOptions(method="GET", path="/api/v1/big"), "rates")]
+
+    assert items == list(range(100))
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_http_client_stream_raises_api_errors() -> None:
+    config = EToroConfig(api_key="k", user_key="u", retry_attempts=0)
+    client = HttpClient(config, rate_limiter=False)
+    respx.get(f"{config.base_url}/api/v1/big").mock(return_value=httpx.Response(404, text="missing"))
+
+    with pytest.raises(EToroApiError) as exc_info:
+        _ = [i async for i in client.stream(RequestOptions(method="GET", path="/api/v1/big"))]
+
+    assert exc_info.value.response_body == "missing"
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_iter_rates_validates_items(http_client: HttpClient, config: EToroConfig) -> None:
+    respx.get(f"{config.base_url}/api/v1/market-data/instruments/rates").mock(
+        return_value=httpx.Response(
+            200,
+            json={"rates": [{"instrumentID": 1, "ask": 1.5, "bid": 1.4}, {"instrumentID": 2, "ask": 9.0, "bid": 8.9}]},
+        )
+    )
+
+    rates = [rate async for rate in MarketDataClient(http_client).iter_rates()]
+
+    assert [(r.instrument_id, r.ask) for r in rates] == [(1, 1.5), (2, 9.0)]
+    await http_client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_iter_trade_history_is_empty_in_demo(http_client: HttpClient) -> None:
+    assert [t async for t in TradingInfoClient(http_client, "demo").iter_trade_history("2024-01-01")] == []
+    await http_client.aclose()
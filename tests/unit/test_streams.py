@@ -0,0 +1,136 @@
+import asyncio
+import gc
+
+import pytest
+
+from etoropy.models.websocket import WsPrivateEvent, WsRateTick
+from etoropy.trading.streams import EventStream
+from tests.factories import trading_client
+
+
+async def _drain(stream: EventStream[int], n: int) -> list[int]:
+    return [await anext(stream) for _ in range(n)]
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_counts_dropped() -> None:
+    stream: EventStream[int] = EventStream(3, "drop_oldest")
+    for i in range(5):
+        stream.put(i)
+
+    assert await _drain(stream, 3) == [2, 3, 4]
+    assert stream.stats.dropped == 2
+    assert stream.stats.delivered == 3
+    assert stream.stats.high_water == 3
+
+
+@pytest.mark.asyncio
+async def test_conflate_keeps_latest_per_key_in_place() -> None:
+    stream: EventStream[tuple[str, int]] = EventStream(10, "conflate", key=lambda item: item[0])
+    for item in [("a", 1), ("b", 1), ("a", 2), ("c", 1), ("a", 3)]:
+        stream.put(item)
+
+    assert [await anext(stream) for _ in range(3)] == [("a", 3), ("b", 1), ("c", 1)]
+    assert stream.stats.dropped == 2
+
+
+def test_conflate_requires_key() -> None:
+    with pytest.raises(ValueError):
+        EventStream(10, "conflate")
+
+
+@pytest.mark.asyncio
+async def test_block_pauses_and_resumes_source() -> None:
+    calls: list[str] = []
+    stream: EventStream[int] = EventStream(
+        4, "block", pause=lambda: calls.append("pause"), resume=lambda: calls.append("resume")
+    )
+    for i in range(6):
+        stream.put(i)
+
+    assert calls == ["pause"]
+    assert stream.stats.dropped == 0
+    assert await _drain(stream, 3) == [0, 1, 2]
+    assert calls == ["pause"]
+    assert await _drain(stream, 1) == [3]
+    assert calls == ["pause", "resume"]
+    assert stream.stats.pauses == 1
+
+
+@pytest.mark.asyncio
+async def test_consumer_waits_and_aclose_ends_iteration() -> None:
+    stream: EventStream[int] = EventStream()
+    received: list[int] = []
+
+    async def consume() -> None:
+        async for item in stream:
+            received.append(item)
+
+    task = asyncio.create_task(consume())
+    await asyncio.sleep(0)
+    stream.put(1)
+    await asyncio.sleep(0)
+    await stream.aclose()
+    await asyncio.wait_for(task, 1.0)
+
+    assert received == [1]
+    stream.put(2)
+    assert len(stream) == 0
+
+
+@pytest.mark.asyncio
+async def test_prices_stream_filters_and_detaches(monkeypatch: pytest.MonkeyPatch) -> None:
+    etoro, subscribed = trading_client(monkeypatch)
+    stream = etoro.prices([1001], policy="conflate")
+
+    first = asyncio.create_task(anext(stream))
+    await asyncio.sleep(0.01)
+    assert subscribed == [["instrument:1001"]]
+
+    etoro.ws._emit("instrument:rate", 1002, WsRateTick(ask=9.0, bid=8.9))
+    etoro.ws._emit("instrument:rate", 1001, WsRateTick(ask=2.0, bid=1.9))
+    tick = await asyncio.wait_for(first, 1.0)
+    assert (tick.instrument_id, tick.rate.bid) == (1001, 1.9)
+
+    await stream.aclose()
+    assert not etoro._listeners.get("price")
+
+
+@pytest.mark.asyncio
+async def test_block_policy_pauses_ws_reading(monkeypatch: pytest.MonkeyPatch) -> None:
+    etoro, _ = trading_client(monkeypatch)
+    stream = etoro.order_events(maxsize=2, policy="block")
+    pending = asyncio.create_task(anext(stream))
+    await asyncio.sleep(0)
+
+    for order_id in range(4):
+        etoro.ws._emit(
+            "private:event",
+            WsPrivateEvent(OrderID=order_id, OrderType=1, StatusID=1, InstrumentID=1001, CID=1),
+        )
+    assert (await pending).order_id == 0
+    assert etoro.ws.reading_paused
+
+    assert [(await anext(stream)).order_id for _ in range(2)] == [1, 2]
+    assert not etoro.ws.reading_paused
+    await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_abandoned_block_stream_resumes_reading(monkeypatch: pytest.MonkeyPatch) -> None:
+    etoro, _ = trading_client(monkeypatch)
+    stream = etoro.order_events(maxsize=2, policy="block")
+    pending = asyncio.create_task(anext(stream))
+    await asyncio.sleep(0)
+    for order_id in range(3):
+        etoro.ws._emit(
+            "private:event",
+            WsPrivateEvent(OrderID=order_id, OrderType=1, StatusID=1, InstrumentID=1001, CID=1),
+        )
+    await pending
+    assert etoro.ws.reading_paused
+
+    del stream, pending
+    gc.collect()
+    assert not etoro.ws.reading_paused
+    assert not etoro._listeners.get("order:update")
@@ -0,0 +1,108 @@
+import asyncio
+import importlib.util
+import json
+
+import pytest
+
+from etoropy.config.settings import EToroConfig
+from etoropy.trading.client import EToroTrading
+from etoropy.ws.client import WsClient, WsClientOptions
+from etoropy.ws.tick_buffer import TickBuffer
+
+
+def _write(buffer: TickBuffer, n: int, start: int = 0) -> None:
+    for i in range(start, start + n):
+        buffer.write(i, i + 0.5, i + 1.0, i + 0.75, 1000.0 + i, i * 10)
+
+
+def test_read_returns_columns_in_order() -> None:
+    buffer = TickBuffer(8)
+    _write(buffer, 3)
+
+    batch = buffer.read()
+
+    assert len(batch) == 3
+    assert list(batch.instrument_id) == [0, 1, 2]
+    assert list(batch.bid) == [0.5, 1.5, 2.5]
+    assert list(batch.price_rate_id) == [0, 10, 20]
+    assert next(batch.rows()) == (0, 0.5, 1.0, 0.75, 1000.0, 0)
+    assert buffer.pending == 0
+    assert len(buffer.read()) == 0
+
+
+def test_max_items_and_wrap_around() -> None:
+    buffer = TickBuffer(4)
+    _write(buffer, 3)
+    assert list(buffer.read(2).instrument_id) == [0, 1]
+
+    _write(buffer, 3, start=3)  # wraps past the end of the columns
+
+    assert list(buffer.read().instrument_id) == [2, 3, 4, 5]
+    assert buffer.dropped == 0
+
+
+def test_overflow_drops_oldest() -> None:
+    buffer = TickBuffer(4)
+    _write(buffer, 10)
+
+    assert buffer.pending == 4
+    assert buffer.dropped == 6
+    assert list(buffer.read().instrument_id) == [6, 7, 8, 9]
+    assert buffer.dropped == 6
+    assert buffer.total_written == 10
+
+
+@pytest.mark.asyncio
+async def test_batches_wake_on_write() -> None:
+    buffer = TickBuffer(16)
+    batches = buffer.batches()
+
+    async def producer() -> None:
+        await asyncio.sleep(0.01)
+        _write(buffer, 2)
+
+    task = asyncio.create_task(producer())
+    batch = await asyncio.wait_for(anext(batches), 1.0)
+    await task
+
+    assert list(batch.instrument_id) == [0, 1]
+    assert await buffer.wait(timeout=0.01) is False
+
+
+@pytest.mark.skipif(importlib.util.find_spec("numpy") is None, reason="numpy not installed")
+def test_as_numpy() -> None:
+    buffer = TickBuffer(4)
+    _write(buffer, 2)
+
+    cols = buffer.read().as_numpy()
+
+    assert cols["ask"].tolist() == [1.0, 2.0]
+    assert cols["instrument_id"].dtype.kind == "i"
+
+
+def test_ws_client_writes_ticks_without_listeners() -> None:
+    buffer = TickBuffer(16)
+    ws = WsClient(WsClientOptions(tick_buffer=buffer))
+    rate = json.dumps({"Ask": 2, "Bid": 1.5, "PriceRateID": 3})
+    frame = {
+        "messages": [
+            {"topic": "instrument:1001", "content": rate, "id": "a", "type": "r"},
+            {"topic": "instrument:1002", "content": json.dumps({"Date": "d"}), "id": "b", "type": "r"},
+        ]
+    }
+
+    ws._handle_message(json.dumps(frame))
+
+    batch = buffer.read()
+    assert list(batch.instrument_id) == [1001]
+    assert (batch.ask[0], batch.bid[0], batch.price_rate_id[0]) == (2.0, 1.5, 3)
+    assert batch.timestamp[0] > 0
+
+
+def test_trading_client_creates_buffer_from_config() -> None:
+    etoro = EToroTrading(EToroConfig(api_key="k", user_key="u", ws_tick_buffer_size=128, quote_max_age=0))
+
+    assert etoro.tick_buffer is not None and etoro.tick_buffer.capacity == 128
+    assert not etoro.ws._listeners.get("instrument:rate")
+    etoro.on("price", lambda *args: None)
+    assert etoro.ws._listeners.get("instrument:rate")
@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from etoropy.errors.exceptions import EToroAuthError, EToroWebSocketError
+from etoropy.models.websocket import WsEnvelope, WsInstrumentRate, WsPrivateEvent, WsRateTick
 from etoropy.ws.client import WsClient, WsClientOptions
 
 
@@ -110,6 +111,86 @@ def test_handle_malformed_message_does_not_raise() -> None:
     ws._handle_message("not valid json {{{")
 
 
+def _rate_frame(content: dict[str, object], topic: str = "instrument:1001") -> str:
+    return json.dumps({"messages": [{"topic": topic, "content": json.dumps(content), "id": "m1", "type": "Rate"}]})
+
+
+def test_rate_ticks_skip_envelope_without_message_listener() -> None:
+    ws = _make_client()
+    rates: list[tuple[int, object]] = []
+    ws.on("instrument:rate", lambda iid, rate: rates.append((iid, rate)))
+
+    with patch("etoropy.ws.client.WsEnvelope.model_validate") as validate:
+        ws._handle_message(_rate_frame({"Ask": 1.5, "Bid": 1.4, "PriceRateID": 7}))
+        validate.assert_not_called()
+
+    assert len(rates) == 1
+    instrument_id, rate = rates[0]
+    assert instrument_id == 1001
+    assert isinstance(rate, WsInstrumentRate)
+    assert (rate.ask, rate.bid, rate.price_rate_id) == (1.5, 1.4, 7)
+
+
+def test_message_listener_receives_envelope() -> None:
+    ws = _make_client()
+    envelopes: list[WsEnvelope] = []
+    ws.on("message", envelopes.append)
+
+    ws._handle_message(_rate_frame({"Ask": 1.5, "Bid": 1.4}))
+
+    assert len(envelopes) == 1
+    assert envelopes[0].messages[0].topic == "instrument:1001"
+
+
+def test_lightweight_ticks() -> None:
+    ws = _make_client(lightweight_ticks=True)
+    rates: list[object] = []
+    ws.on("instrument:rate", lambda iid, rate: rates.append(rate))
+
+    ws._handle_message(_rate_frame({"Ask": "2", "Bid": 1.9, "LastExecution": 2.0, "Date": "d"}))
+    ws._handle_message(_rate_frame({"Date": "d", "PriceRateID": 1}))  # heartbeat without a rate
+
+    assert rates == [WsRateTick(ask=2.0, bid=1.9, last_execution=2.0, date="d", price_rate_id=0)]
+
+
+def test_failing_price_handler_does_not_drop_other_ticks() -> None:
+    from etoropy.config.settings import EToroConfig
+    from etoropy.trading.client import EToroTrading
+
+    etoro = EToroTrading(EToroConfig(api_key="k", user_key="u"))
+    seen: list[int] = []
+    errors: list[Exception] = []
+
+    def broken(symbol: str, instrument_id: int, rate: object) -> None:
+        raise KeyError(symbol)
+
+    etoro.on("price", broken).on("price", lambda s, instrument_id, r: seen.append(instrument_id))
+    etoro.on("error", errors.append)
+    rate = json.dumps({"Ask": 2, "Bid": 1.9})
+    frame = {
+        "messages": [
+            {"topic": f"instrument:{i}", "content": rate, "id": str(i), "type": "Trading.Instrument.Rate"}
+            for i in (1001, 1002, 1003)
+        ]
+    }
+
+    etoro.ws._handle_message(json.dumps(frame))
+
+    assert seen == [1001, 1002, 1003]
+    assert len(errors) == 3
+
+
+def test_private_events_are_dispatched() -> None:
+    ws = _make_client()
+    events: list[WsPrivateEvent] = []
+    ws.on("private:event", events.append)
+
+    content = {"OrderID": 1, "OrderType": 1, "StatusID": 3, "InstrumentID": 1001, "CID": 9}
+    ws._handle_message(_rate_frame(content, topic="private"))
+
+    assert [e.order_id for e in events] == [1]
+
+
 # ── connect / authenticate ───────────────────────────────────────────
 
 
@@ -258,6 +339,35 @@ async def test_receive_loop_processes_text_messages() -> None:
     assert ws.is_authenticated is True
 
 
+@pytest.mark.asyncio
+async def test_receive_loop_waits_while_reading_is_paused() -> None:
+    ws = _make_client()
+    handled: list[str] = []
+    ws._handle_message = handled.append  # type: ignore[method-assign]
+
+    async def fake_ws_iter(self: object) -> object:  # noqa: ANN001
+        yield "one"
+        yield "two"
+
+    mock_conn = AsyncMock()
+    mock_conn.__aiter__ = fake_ws_iter
+    ws._ws = mock_conn
+    ws.pause_reading()
+    ws.pause_reading()
+
+    task = asyncio.create_task(ws._receive_loop())
+    await asyncio.sleep(0.01)
+    assert handled == ["one"]
+
+    ws.resume_reading()
+    await asyncio.sleep(0.01)
+    assert handled == ["one"]
+
+    ws.resume_reading()
+    await asyncio.wait_for(task, 1.0)
+    assert handled == ["one", "two"]
+
+
 # ── disconnect ───────────────────────────────────────────────────────
 
 
@@ -287,3 +397,19 @@ async def test_send_raises_when_not_connected() -> None:
     ws = _make_client()
     with pytest.raises(EToroWebSocketError, match="not connected"):
         await ws._send({"test": True})
+
+
+def test_trading_client_subscribes_to_envelopes_only_while_listened() -> None:
+    from etoropy.config.settings import EToroConfig
+    from etoropy.trading.client import EToroTrading
+
+    etoro = EToroTrading(EToroConfig(api_key="k", user_key="u"))
+    assert not etoro.ws._listeners.get("message")
+
+    def handler(envelope: WsEnvelope) -> None:
+        pass
+
+    etoro.on("ws:message", handler)
+    assert etoro.ws._listeners.get("message")
+    etoro.off("ws:message", handler)
+    assert not etoro.ws._listeners.get("message")
@@ -0,0 +1,156 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+import pytest_asyncio
+
+from etoropy.config.settings import EToroConfig
+from etoropy.errors.exceptions import EToroError
+from etoropy.trading.client import EToroTrading
+from etoropy.ws.client import WsClientOptions
+from etoropy.ws.pool import WsClientPool
+from etoropy.ws.simulator import FeedSimulator
+
+TICKS_PER_FRAME = 10
+RATE = json.dumps({"Ask": 2.0, "Bid": 1.9, "LastExecution": 1.95, "Date": "d", "PriceRateID": 1})
+
+
+@pytest_asyncio.fixture
+async def server() -> AsyncIterator[tuple[FeedSimulator, str]]:
+    # 2,000 ticks/s per connection, like a per-connection bandwidth limit.
+    async with FeedSimulator(ticks_per_second=2_000, ticks_per_frame=TICKS_PER_FRAME) as simulator:
+        yield simulator, simulator.url
+
+
+def _options(url: str, **kwargs: Any) -> WsClientOptions:
+    return WsClientOptions(api_key="k", user_key="u", ws_url=url, heartbeat_interval=0, **kwargs)
+
+
+def test_topics_are_sharded_by_instrument_id() -> None:
+    pool = WsClientPool(WsClientOptions(), shards=3)
+
+    assert pool.shard_for("instrument:1001") is pool.shards[1001 % 3]
+    assert pool.shard_for("instrument:1002") is pool.shards[1002 % 3]
+    assert pool.shard_for("private") is pool.shards[0]
+
+
+def test_shard_events_are_forwarded_only_while_listened() -> None:
+    pool = WsClientPool(WsClientOptions(), shards=2)
+    received: list[int] = []
+
+    def handler(instrument_id: int, rate: object) -> None:
+        received.append(instrument_id)
+
+    pool.on("instrument:rate", handler)
+    frame = json.dumps({"messages": [{"topic": "instrument:7", "content": RATE, "id": "x", "type": "r"}]})
+    for shard in pool.shards:
+        shard._handle_message(frame)
+    assert received == [7, 7]
+
+    pool.off("instrument:rate", handler)
+    assert all(not shard._listeners.get("instrument:rate") for shard in pool.shards)
+
+
+def test_trading_client_uses_pool_when_sharded() -> None:
+    etoro = EToroTrading(EToroConfig(api_key="k", user_key="u", ws_shards=4))
+
+    assert isinstance(etoro.ws, WsClientPool)
+    assert len(etoro.ws.shards) == 4
+
+
+@pytest.mark.asyncio
+async def test_load_is_spread_across_shard_connections(server: tuple[FeedSimulator, str]) -> None:
+    simulator, url = server
+    pool = WsClientPool(_options(url), shards=4)
+    ticks = [0] * 4
+
+    def counter(index: int) -> Any:
+        def on_rate(instrument_id: int, rate: object) -> None:
+            assert instrument_id % 4 == index
+            ticks[index] += 1
+
+        return on_rate
+
+    for index, shard in enumerate(pool.shards):
+        shard.on("instrument:rate", counter(index))
+    await pool.connect()
+    topics = [f"instrument:{1000 + i}" for i in range(TICKS_PER_FRAME * 8)]
+    await pool.subscribe_many(topics)
+    for _ in range(200):
+        if all(ticks):
+            break
+        await asyncio.sleep(0.01)
+
+    # One server connection per shard, each streaming only its own quarter.
+    assert len(simulator.connections) == 4
+    served = sorted(sorted(simulator.subscriptions[conn]) for conn in simulator.connections)
+    assert served == sorted(sorted(t for t in topics if int(t[11:]) % 4 == k) for k in range(4))
+    assert all(ticks)
+    await pool.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_failed_connect_disconnects_the_other_shards(
+    server: tuple[FeedSimulator, str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _, url = server
+    pool = WsClientPool(_options(url), shards=3)
+
+    async def refuse() -> None:
+        await asyncio.sleep(0.05)
+        raise ConnectionRefusedError("shard down")
+
+    monkeypatch.setattr(pool.shards[1], "connect", refuse)
+
+    with pytest.raises(ConnectionRefusedError):
+        await pool.connect()
+    assert pool.connected_shards == 0
+
+
+@pytest.mark.asyncio
+async def test_private_connectivity_only_needs_its_shard(
+    server: tuple[FeedSimulator, str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _, url = server
+    etoro = EToroTrading(EToroConfig(api_key="k", user_key="u", ws_url=url, ws_shards=2))
+    monkeypatch.setattr(etoro.rest.info, "get_order", lambda order_id: asyncio.Event().wait())
+    pool = etoro.ws
+    assert isinstance(pool, WsClientPool)
+    await pool.connect()
+    await pool.shard_for("instrument:1").disconnect()
+
+    assert not pool.is_connected
+    assert pool.is_connected_for("private")
+    assert not pool.is_connected_for("instrument:1")
+    with pytest.raises(EToroError, match="[Tt]imed? ?out"):
+        await etoro.wait_for_order(1, timeout_s=0.01)
+
+    await pool.shard_for("private").disconnect()
+    with pytest.raises(EToroError, match="not connected"):
+        await etoro.wait_for_order(1, timeout_s=0.01)
+    await etoro.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_shards_reconnect_independently(server: tuple[FeedSimulator, str]) -> None:
+    stand_in, url = server
+    pool = WsClientPool(_options(url, reconnect_delay=0.01), shards=2)
+    await pool.connect()
+    pool.subscribe(["instrument:1", "instrument:2", "instrument:3"])
+    await asyncio.sleep(0.05)
+    first, second = pool.shards
+    kept = first._ws
+
+    odd = next(conn for conn, topics in stand_in.subscriptions.items() if "instrument:1" in topics)
+    await odd.close()
+    for _ in range(100):
+        await asyncio.sleep(0.01)
+        if len(stand_in.connections) == 3 and pool.is_authenticated:
+            break
+
+    assert first._ws is kept
+    assert pool.is_connected
+    assert sorted(stand_in.subscriptions[stand_in.connections[-1]]) == ["instrument:1", "instrument:3"]
+    await pool.disconnect()
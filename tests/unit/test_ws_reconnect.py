@@ -0,0 +1,124 @@
+import asyncio
+import json
+
+import pytest
+
+from etoropy.config.settings import EToroConfig
+from etoropy.errors.exceptions import EToroWebSocketError
+from etoropy.trading.client import EToroTrading
+from etoropy.ws.client import WsClient, WsClientOptions
+
+
+def _frame(instrument_id: int, **content: object) -> str:
+    msg = {"topic": f"instrument:{instrument_id}", "content": json.dumps(content), "id": "x", "type": "r"}
+    return json.dumps({"messages": [msg]})
+
+
+def test_backoff_is_jittered_and_capped() -> None:
+    ws = WsClient(WsClientOptions(reconnect_delay=1.0, reconnect_max_delay=8.0))
+
+    for attempt, ceiling in [(0, 1.0), (2, 4.0), (3, 8.0), (10, 8.0), (5000, 8.0)]:
+        delays = {ws._backoff(attempt) for _ in range(50)}
+        assert all(ceiling / 2 <= d <= ceiling for d in delays)
+        assert len(delays) > 1
+
+
+@pytest.mark.asyncio
+async def test_supervisor_retries_until_connected_and_resubscribes_with_snapshot(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    ws = WsClient(WsClientOptions(reconnect_delay=0.001, reconnect_attempts=5))
+    ws._subscriptions.add(["instrument:1001", "private"])
+    attempts = 0
+
+    async def connect() -> None:
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:
+            raise OSError("connection refused")
+
+    subscribed: list[tuple[list[str], bool]] = []
+    resyncs: list[tuple[str, list[str]]] = []
+    monkeypatch.setattr(ws, "connect", connect)
+    monkeypatch.setattr(ws, "subscribe", lambda topics, snapshot=False: subscribed.append((sorted(topics), snapshot)))
+    ws.on("resync", lambda reason, topics: resyncs.append((reason, sorted(topics))))
+
+    await ws._on_closed(1006, "")
+
+    assert attempts == 3
+    assert subscribed == [(["instrument:1001", "private"], True)]
+    assert resyncs == [("reconnect", ["instrument:1001", "private"])]
+    assert ws.reconnect_stats.reconnects == 1
+    assert ws.reconnect_stats.failed_attempts == 2
+
+    ws._handle_message(_frame(1001, Ask=2.0, Bid=1.9, PriceRateID=5))
+    assert ws.reconnect_stats.first_tick_latency.count == 1
+    assert ws.reconnect_stats.last_outage_s > 0
+
+
+@pytest.mark.asyncio
+async def test_supervisor_gives_up_after_max_attempts(monkeypatch: pytest.MonkeyPatch) -> None:
+    ws = WsClient(WsClientOptions(reconnect_delay=0.001, reconnect_attempts=2))
+    errors: list[Exception] = []
+
+    async def connect() -> None:
+        raise OSError("down")
+
+    monkeypatch.setattr(ws, "connect", connect)
+    ws.on("error", errors.append)
+
+    await ws._on_closed(1006, "")
+
+    assert ws.reconnect_stats.failed_attempts == 2
+    assert isinstance(errors[0], EToroWebSocketError)
+
+
+@pytest.mark.asyncio
+async def test_intentional_close_stops_supervisor(monkeypatch: pytest.MonkeyPatch) -> None:
+    ws = WsClient(WsClientOptions(reconnect_delay=0.05))
+    connects = 0
+
+    async def connect() -> None:
+        nonlocal connects
+        connects += 1
+
+    monkeypatch.setattr(ws, "connect", connect)
+    task = asyncio.create_task(ws._on_closed(1006, ""))
+    await asyncio.sleep(0)
+    await ws.disconnect()
+    await asyncio.wait_for(task, 1.0)
+
+    assert connects == 0
+
+
+def test_out_of_order_ticks_are_dropped_and_reported() -> None:
+    ws = WsClient(WsClientOptions())
+    rates: list[float] = []
+    resyncs: list[tuple[str, list[str]]] = []
+    ws.on("instrument:rate", lambda instrument_id, rate: rates.append(rate.bid))
+    ws.on("resync", lambda reason, topics: resyncs.append((reason, topics)))
+
+    ws._handle_message(_frame(1001, Ask=2.0, Bid=1.0, PriceRateID=10))
+    ws._handle_message(_frame(1001, Ask=2.0, Bid=2.0, PriceRateID=9))
+    ws._handle_message(_frame(1002, Ask=2.0, Bid=3.0, PriceRateID=9))
+    ws._handle_message(_frame(1001, Ask=2.0, Bid=4.0, PriceRateID=11))
+    ws._handle_message(_frame(1003, Ask=2.0, Bid=5.0, Date="2026-01-02T00:00:00Z"))
+    ws._handle_message(_frame(1003, Ask=2.0, Bid=6.0, Date="2026-01-01T00:00:00Z"))
+
+    assert rates == [1.0, 3.0, 4.0, 5.0]
+    assert resyncs == [("sequence", ["instrument:1001"]), ("sequence", ["instrument:1003"])]
+    assert ws.reconnect_stats.out_of_order == 2
+
+
+def test_trading_client_invalidates_quotes_on_resync() -> None:
+    etoro = EToroTrading(EToroConfig(api_key="k", user_key="u"))
+    resyncs: list[str] = []
+    etoro.on("resync", lambda reason, topics: resyncs.append(reason))
+    etoro.quotes.update(1001, 1.0, 2.0)
+    etoro.quotes.update(1002, 1.0, 2.0)
+
+    etoro.ws._emit("resync", "reconnect", ["instrument:1001", "private"])
+
+    assert etoro.quotes.get(1001) is None
+    assert etoro.quotes.get(1002) is not None
+    assert resyncs == ["reconnect"]
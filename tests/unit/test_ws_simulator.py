@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+
+from etoropy.config.settings import EToroConfig
+from etoropy.errors.exceptions import EToroAuthError
+from etoropy.models.websocket import WsPrivateEvent
+from etoropy.trading.client import EToroTrading
+from etoropy.ws.client import WsClient, WsClientOptions
+from etoropy.ws.simulator import FeedSimulator
+
+
+def test_burst_pattern() -> None:
+    sim = FeedSimulator(ticks_per_second=100, burst_factor=5, burst_period=1.0, burst_duration=0.2)
+
+    assert sim._rate_at(0.1) == 500
+    assert sim._rate_at(0.5) == 100
+    assert sim._rate_at(1.1) == 500
+
+
+@pytest.mark.asyncio
+async def test_prices_flow_through_the_trading_client() -> None:
+    async with FeedSimulator(ticks_per_second=2_000, private_interval=0.01, seed=1) as sim:
+        etoro = EToroTrading(EToroConfig(api_key="k", user_key="u", ws_url=sim.url))
+        prices: list[tuple[int, int]] = []
+        orders: list[WsPrivateEvent] = []
+        etoro.on("price", lambda symbol, instrument_id, rate: prices.append((instrument_id, rate.price_rate_id)))
+        etoro.on("order:update", orders.append)
+
+        await etoro.connect()
+        await etoro.stream_prices([1001, 1002])
+        result = await etoro.ws.subscribe_many(["private"])
+        await asyncio.sleep(0.1)
+        await etoro.disconnect()
+
+    assert result.acked == ["private"]
+    assert {instrument_id for instrument_id, _ in prices} == {1001, 1002}
+    ids = [price_rate_id for _, price_rate_id in prices]
+    assert ids == sorted(ids)
+    assert orders and orders[0].instrument_id in (1001, 1002)
+    assert sim.stats.ticks >= len(prices)
+
+
+@pytest.mark.asyncio
+async def test_wrong_credentials_are_rejected() -> None:
+    async with FeedSimulator(api_key="right") as sim:
+        ws = WsClient(WsClientOptions(api_key="wrong", user_key="u", ws_url=sim.url, auth_timeout=1.0))
+        with pytest.raises(EToroAuthError):
+            await ws.connect()
+        await ws.disconnect()
@@ -0,0 +1,128 @@
+import asyncio
+import json
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from etoropy.errors.exceptions import EToroWebSocketError
+from etoropy.ws.client import WsClient, WsClientOptions, _chunk_topics
+from etoropy.ws.pool import WsClientPool
+
+
+def _acking(ws: WsClient, reply: Callable[[dict[str, Any]], dict[str, Any] | None]) -> list[dict[str, Any]]:
+    """Replace ``ws._send`` with a fake server that answers via *reply*."""
+    sent: list[dict[str, Any]] = []
+
+    async def send(msg: dict[str, Any]) -> None:
+        sent.append(msg)
+        answer = reply(msg)
+        if answer is not None:
+            asyncio.get_running_loop().call_soon(ws._handle_message, json.dumps(answer))
+
+    ws._send = send  # type: ignore[method-assign]
+    return sent
+
+
+def _ok(msg: dict[str, Any]) -> dict[str, Any]:
+    return {"id": msg["id"], "operation": msg["operation"]}
+
+
+def test_topics_are_packed_by_count_and_size() -> None:
+    topics = [f"instrument:{i}" for i in range(1000, 1450)]
+
+    assert [len(c) for c in _chunk_topics(topics, 200, 1_000_000)] == [200, 200, 50]
+    by_size = _chunk_topics(topics, 200, 1024)
+    assert sum(len(c) for c in by_size) == 450
+    assert all(128 + sum(len(t) + 3 for t in c) <= 1024 for c in by_size)
+
+
+@pytest.mark.asyncio
+async def test_subscribe_many_batches_and_waits_for_acks() -> None:
+    ws = WsClient(WsClientOptions())
+    sent = _acking(ws, _ok)
+    topics = [f"instrument:{i}" for i in range(2000)]
+
+    result = await ws.subscribe_many(topics + topics[:10], snapshot=True)
+
+    assert len(sent) == 10
+    assert all(msg["data"]["snapshot"] for msg in sent)
+    assert result.ok
+    assert result.frames == 10
+    assert sorted(result.acked) == sorted(topics)
+    assert set(result.latency) == set(topics)
+    assert len(ws._subscriptions.get_all()) == 2000
+    assert not ws._pending_acks
+
+
+@pytest.mark.asyncio
+async def test_rejected_frames_are_retried_and_failures_reported() -> None:
+    ws = WsClient(WsClientOptions(reconnect_delay=0.001))
+    attempts: dict[str, int] = {}
+
+    def reply(msg: dict[str, Any]) -> dict[str, Any] | None:
+        first = msg["data"]["topics"][0]
+        attempts[first] = attempts.get(first, 0) + 1
+        if first == "instrument:1":
+            return None  # never acknowledged
+        if first == "instrument:3" and attempts[first] == 1:
+            return {**_ok(msg), "errorCode": "TooManyRequests"}
+        return _ok(msg)
+
+    _acking(ws, reply)
+    result = await ws.subscribe_many(
+        ["instrument:1", "instrument:2", "instrument:3", "instrument:4"],
+        max_topics_per_frame=2,
+        ack_timeout=0.02,
+        retries=1,
+    )
+
+    assert result.acked == ["instrument:3", "instrument:4"]
+    assert set(result.failed) == {"instrument:1", "instrument:2"}
+    assert "not acknowledged" in result.failed["instrument:1"]
+    assert result.retries == 2
+    assert result.frames == 4
+    assert sorted(ws._subscriptions.get_all()) == ["instrument:3", "instrument:4"]
+
+
+@pytest.mark.asyncio
+async def test_close_fails_pending_acks_immediately() -> None:
+    ws = WsClient(WsClientOptions())
+    ws._intentional_close = True
+    _acking(ws, lambda msg: None)
+
+    task = asyncio.create_task(ws.subscribe_many(["instrument:1"], ack_timeout=5.0, retries=0))
+    while not ws._pending_acks:
+        await asyncio.sleep(0)
+    await ws._on_closed(1006, "")
+    result = await asyncio.wait_for(task, 1.0)
+
+    assert "closed" in result.failed["instrument:1"]
+
+
+@pytest.mark.asyncio
+async def test_background_send_failures_are_emitted() -> None:
+    ws = WsClient(WsClientOptions())
+    errors: list[Exception] = []
+    ws.on("error", errors.append)
+
+    ws.subscribe(["instrument:1"])
+    assert len(ws._send_tasks) == 1
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert not ws._send_tasks
+    assert isinstance(errors[0], EToroWebSocketError)
+
+
+@pytest.mark.asyncio
+async def test_pool_subscribe_many_merges_shard_results() -> None:
+    pool = WsClientPool(WsClientOptions(), shards=2)
+    sent = [_acking(shard, _ok) for shard in pool.shards]
+
+    result = await pool.subscribe_many([f"instrument:{i}" for i in range(10)] + ["private"])
+
+    assert result.ok
+    assert len(result.acked) == 11
+    assert result.frames == 2
+    assert [len(s[0]["data"]["topics"]) for s in sent] == [6, 5]